@@ -0,0 +1,106 @@
+# benchmarks/bench_batch_scoring.py
+
+"""
+Jobs/second of the scalar score_job loop vs score_jobs_batch, and a check
+that both produce identical results.
+
+Run from the repo root:
+    python -m benchmarks.bench_batch_scoring
+    python -m benchmarks.bench_batch_scoring --sizes 10 1000 100000 --seed 7
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List
+
+from present_to_user.batch_scoring import score_jobs_batch
+from present_to_user.job_compatibility_scoring import score_job
+
+TITLES = [
+    "Data Scientist", "Senior Data Scientist", "Machine Learning Engineer",
+    "ML Engineer II", "Data Analyst", "AI Product Manager", "Product Manager",
+    "Backend Engineer", "Applied Scientist", "Research Engineer, NLP",
+    "Lead Data Engineer", "Business Analyst", "MLOps Engineer",
+]
+SKILLS = [
+    "python", "sql", "pytorch", "tensorflow", "spark", "aws", "docker",
+    "kubernetes", "pandas", "scikit-learn", "airflow", "tableau", "java",
+    "nlp", "computer vision", "llm", "fastapi", "git",
+]
+LOCATIONS = [
+    "Bengaluru", "Bengaluru, Karnataka", "Pune", "Mumbai", "Hyderabad",
+    "Remote", "Gurugram, Haryana", "Chennai", None,
+]
+REMOTE = [None, "remote", "hybrid", "onsite"]
+EXPERIENCE = [None, "2+ years", "3-5 years", "5+ years", "senior", "0-2 years", "7 years"]
+
+PROFILE: Dict[str, Any] = {
+    "resume": {
+        "location": "Bengaluru, India",
+        "years_experience": 3.5,
+        "top_technical_skills": ["python", "pytorch", "sql", "aws", "docker"],
+    },
+    "preferences": {
+        "preferred_role": "Machine Learning Engineer",
+        "remote_preference": "hybrid",
+        "target_salary_lpa": 25,
+    },
+}
+
+
+def make_jobs(n: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(n):
+        lo = rng.choice([None, 10, 15, 20, 30])
+        hi = None if lo is None or rng.random() < 0.3 else lo + rng.choice([5, 10, 15])
+        jobs.append({
+            "title": rng.choice(TITLES),
+            "company": f"Company {i % 500}",
+            "location_area": rng.choice(LOCATIONS),
+            "remote_type": rng.choice(REMOTE),
+            "required_skills": rng.sample(SKILLS, rng.randint(0, 5)),
+            "preferred_skills": rng.sample(SKILLS, rng.randint(0, 3)),
+            "experience_required": rng.choice(EXPERIENCE),
+            "salary_min": lo,
+            "salary_max": hi,
+            "job_url": f"https://jobs.example.com/{i}",
+        })
+    return jobs
+
+
+def bench(n: int, seed: int) -> None:
+    jobs = make_jobs(n, seed)
+
+    t0 = time.perf_counter()
+    scalar = [score_job(PROFILE, job) for job in jobs]
+    t_scalar = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    batch = score_jobs_batch(PROFILE, jobs)
+    t_batch = time.perf_counter() - t0
+
+    identical = scalar == batch
+    print(
+        f"{n:>8} jobs | scalar {n / t_scalar:>12,.0f} jobs/s | "
+        f"batch {n / t_batch:>12,.0f} jobs/s | speedup {t_scalar / t_batch:5.1f}x | "
+        f"identical={identical}"
+    )
+    if not identical:
+        first = next(i for i, (a, b) in enumerate(zip(scalar, batch)) if a != b)
+        raise SystemExit(f"Mismatch at job {first}:\n{scalar[first]}\n{batch[first]}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1_000, 100_000])
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    for n in args.sizes:
+        bench(n, args.seed)
+
+
+if __name__ == "__main__":
+    main()
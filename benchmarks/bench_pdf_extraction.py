@@ -0,0 +1,143 @@
+# benchmarks/bench_pdf_extraction.py
+
+"""
+Pages/second and peak RSS of the PDF extraction engines:
+
+- pdfplumber: layout analysis on every page (the previous extractor);
+- fast:       pypdf text layer, pdfplumber only for pages that need it;
+- fast-pool:  fast, with page chunks spread over the extraction process pool.
+
+Each engine runs in a fresh process so peak RSS (ru_maxrss, including pool
+workers) is not inherited from the previous one. Without --pdf a text-only
+PDF of --pages pages is generated. Page/char caps from config are lifted so
+every page is measured.
+
+Run from the repo root:
+    python -m benchmarks.bench_pdf_extraction
+    python -m benchmarks.bench_pdf_extraction --pages 200 --workers 4
+    python -m benchmarks.bench_pdf_extraction --pdf resume.pdf --repeat 5
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List
+
+ENGINES = ("pdfplumber", "fast", "fast-pool")
+
+
+def make_text_pdf(path: Path, pages: int, lines_per_page: int = 45) -> None:
+    """Minimal multi-page Helvetica PDF (no dependencies)."""
+    objects: List[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # page tree, filled in below
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for page in range(pages):
+        lines = [
+            f"Page {page + 1} line {n}: Senior Machine Learning Engineer, Python, PyTorch, SQL, AWS."
+            for n in range(lines_per_page)
+        ]
+        stream = "BT /F1 9 Tf 40 800 Td 11 TL " + " ".join(f"({line}) '" for line in lines) + " ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream".encode())
+        content_id = len(objects)
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>".encode()
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {pages} >>".encode()
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(bytes(out))
+
+
+def _measure(engine: str, pdf: str, repeat: int, workers: int, chunk_pages: int) -> Dict[str, Any]:
+    import memory_saving.resume_text_extraction as rte
+
+    # Measure every page: lift the configured caps.
+    rte.PDF_MAX_PAGES = 0
+    rte.PDF_MAX_CHARS = 0
+    path = Path(pdf)
+    pages = rte.pdf_page_count(path)
+
+    def run_once() -> int:
+        if engine == "fast-pool":
+            from memory_saving.resume_extraction_service import ResumeExtractionService
+            import memory_saving.resume_extraction_service as svc_module
+
+            svc_module.PDF_MAX_CHARS = 0
+            svc_module.pdf_page_ranges = lambda p: rte.pdf_page_ranges(p, chunk_pages=chunk_pages, max_pages=0)
+            service = ResumeExtractionService(workers=workers, timeout_seconds=600, max_file_mb=0)
+            try:
+                return len(asyncio.run(service.extract(path)))
+            finally:
+                service.shutdown()
+        text = rte.join_pdf_pages(path, rte.extract_pdf_pages(path, 0, pages, engine=engine), max_chars=0)
+        return len(text)
+
+    chars = run_once()  # warm-up (imports, font caches)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        run_once()
+    elapsed = time.perf_counter() - started
+
+    peak_kb = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    return {
+        "engine": engine,
+        "pages": pages,
+        "chars": chars,
+        "seconds": elapsed / repeat,
+        "pages_per_sec": pages * repeat / elapsed if elapsed else float("inf"),
+        "peak_rss_mb": peak_kb / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdf", help="PDF to extract (default: a generated text PDF)")
+    parser.add_argument("--pages", type=int, default=100, help="pages of the generated PDF")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=4, help="pool workers for fast-pool")
+    parser.add_argument("--chunk-pages", type=int, default=8)
+    parser.add_argument("--engines", nargs="+", default=list(ENGINES), choices=ENGINES)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = args.pdf
+        if pdf is None:
+            pdf = str(Path(tmp) / "bench.pdf")
+            make_text_pdf(Path(pdf), args.pages)
+
+        print(f"{'engine':<12} {'pages':>6} {'chars':>9} {'sec/file':>9} {'pages/s':>9} {'peak RSS MB':>12}")
+        for engine in args.engines:
+            # Fresh interpreter per engine so peak RSS is its own.
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as ex:
+                r = ex.submit(_measure, engine, pdf, args.repeat, args.workers, args.chunk_pages).result()
+            print(
+                f"{r['engine']:<12} {r['pages']:>6} {r['chars']:>9} {r['seconds']:>9.3f} "
+                f"{r['pages_per_sec']:>9.1f} {r['peak_rss_mb']:>12.1f}"
+            )
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
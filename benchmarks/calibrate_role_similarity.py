@@ -0,0 +1,81 @@
+# benchmarks/calibrate_role_similarity.py
+
+"""
+Drift of the role-similarity index from difflib.SequenceMatcher, plus
+pairs/second for both, over every (role, title) pair of the sample lists.
+
+Run from the repo root:
+    python -m benchmarks.calibrate_role_similarity
+    python -m benchmarks.calibrate_role_similarity --show 15
+"""
+
+import argparse
+import itertools
+import time
+from difflib import SequenceMatcher
+
+from present_to_user.role_similarity import RoleMatcher, calibration_report
+
+ROLES = [
+    "Machine Learning Engineer", "Data Scientist", "AI Product Manager",
+    "Backend Developer", "Full Stack Engineer", "Business Analyst",
+    "DevOps Engineer", "Software Engineer", "Data Analyst", "Product Manager",
+]
+TITLES = [
+    "Senior ML Engineer", "ML Engineer II", "Machine Learning Scientist",
+    "Sr. Data Scientist", "Lead Data Scientist - NLP", "Data Science Intern",
+    "Product Manager, AI Platform", "Associate PM", "Senior Backend Engineer (Python)",
+    "Back-end Developer", "Fullstack Developer", "Full-Stack Software Engineer",
+    "Business Intelligence Analyst", "Analytics Engineer", "SRE / DevOps Engineer",
+    "Dev Ops Lead", "SDE 2", "Software Development Engineer", "Staff Software Engineer",
+    "Data Analyst - Marketing", "Chef de Partie", "Sales Manager", "HR Business Partner",
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--show", type=int, default=10, help="print the N pairs with the largest drift")
+    parser.add_argument("--repeat", type=int, default=200, help="timing repetitions over all pairs")
+    args = parser.parse_args()
+
+    pairs = list(itertools.product(ROLES, TITLES))
+    print("calibration:", calibration_report(pairs))
+
+    matcher = RoleMatcher()
+    rows = []
+    for role, title in pairs:
+        new, hit = matcher.similarity(role, title)
+        old = SequenceMatcher(None, role.lower(), title.lower()).ratio()
+        rows.append((abs(new - old), role, title, old, new, hit))
+    rows.sort(reverse=True)
+    for drift, role, title, old, new, hit in rows[: args.show]:
+        print(f"  drift {drift:.3f} | seq {old:.3f} | index {new:.3f} | kw={hit!s:5} | {role!r} vs {title!r}")
+
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        for role, title in pairs:
+            SequenceMatcher(None, role.lower(), title.lower()).ratio()
+    t_seq = time.perf_counter() - t0
+
+    cold = RoleMatcher(cache_size=0)
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        for role, title in pairs:
+            cold.similarity(role, title)
+    t_cold = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        for role, title in pairs:
+            matcher.similarity(role, title)
+    t_warm = time.perf_counter() - t0
+
+    n = len(pairs) * args.repeat
+    print(
+        f"pairs/s: SequenceMatcher {n / t_seq:,.0f} | index (no pair LRU) {n / t_cold:,.0f} "
+        f"| index (warm LRU) {n / t_warm:,.0f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
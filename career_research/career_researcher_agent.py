@@ -8,7 +8,8 @@ Aditya's Epic Research Team
 
 Architecture:
 - Three junior research agents (JSearch API, Adzuna API, DuckDuckGo web search)
-- One senior researcher agent (merge, deduplicate, rank)
+- Merge, deduplicate and rank in code (career_research/job_aggregator.py)
+- Optional senior researcher agent that only writes search_summary
 - Returns JobAggregation with source_breakdown, best_matches, search_summary
 """
 
@@ -27,6 +28,7 @@ from career_research.career_research_prompts_config import (
     JUNIOR_ADZUNA_FALLBACK_RULES,
     DDG_JOB_FETCH_INSTRUCTIONS,
     SENIOR_AGGREGATOR_INSTRUCTIONS,
+    SENIOR_SUMMARY_INSTRUCTIONS,
 )
 
 logger = logging.getLogger(__name__)
@@ -173,15 +175,15 @@ async def create_multi_source_career_research_agents(
     """
     try:
         from career_research.research_mcp_and_tools import (
-            search_jobs_jsearch,
-            search_jobs_adzuna,
+            search_jobs_jsearch_async,
+            search_jobs_adzuna_async,
         )
 
         jsearch_agent = Agent(
             name="job_fetcher_jsearch",
             model=model,
             instructions=JUNIOR_BASE_JOB_FETCH_INSTRUCTIONS + JUNIOR_JSEARCH_FALLBACK_RULES,
-            tools=[search_jobs_jsearch],
+            tools=[search_jobs_jsearch_async],
             mcp_servers=list(mcp_servers),
             output_type=JobSearchOutput,
         )
@@ -190,7 +192,7 @@ async def create_multi_source_career_research_agents(
             name="job_fetcher_adzuna",
             model=model,
             instructions=JUNIOR_BASE_JOB_FETCH_INSTRUCTIONS + JUNIOR_ADZUNA_FALLBACK_RULES,
-            tools=[search_jobs_adzuna],
+            tools=[search_jobs_adzuna_async],
             mcp_servers=list(mcp_servers),
             output_type=JobSearchOutput,
         )
@@ -237,3 +239,20 @@ async def create_senior_researcher_agent(
     except Exception as e:
         logger.error("Error creating senior researcher agent: %s", e)
         raise CustomException(e, error_detail=sys)
+
+
+async def create_senior_summary_agent(model: str) -> Agent:
+    """
+    Senior analyst that only writes search_summary for an already ranked
+    JobAggregation (dedup and ranking happen in job_aggregator). No tools.
+    """
+    try:
+        return Agent(
+            name="senior_job_analyst",
+            model=model,
+            instructions=SENIOR_SUMMARY_INSTRUCTIONS,
+        )
+
+    except Exception as e:
+        logger.error("Error creating senior summary agent: %s", e)
+        raise CustomException(e, error_detail=sys)
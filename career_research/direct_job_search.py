@@ -0,0 +1,315 @@
+# career_research/direct_job_search.py
+
+"""
+Direct-fetch junior mode for JSearch and Adzuna (no LLM tool-calling).
+
+The LLM juniors for these two APIs only turned the minimized profile into a
+query string and a country code, called one tool, and copied fields into
+JobRole. This module does the same with rules:
+
+- build_search_query(): one compact title from preferred_role
+- resolve_country(): two letter country code from the locations list
+- map_jsearch_job() / map_adzuna_job(): typed extractors from the raw
+  normalized_jobs into JobRole, leaving unknown fields as None
+
+Research latency for these sources is then bounded by API latency. The
+DuckDuckGo junior still runs as an agent (it needs search + fetch reasoning).
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+from career_research.career_researcher_agent import JobRole, JobSearchOutput, SearchCriteria
+from career_research.research_mcp_and_tools import adzuna_market, fetch_jobs_adzuna, fetch_jobs_jsearch
+from utils.logger import logging
+
+logger = logging.getLogger(__name__)
+
+# Country names, aliases and major job-market cities -> ISO code used by the tools.
+COUNTRY_ALIASES: Dict[str, tuple] = {
+    "in": (
+        "india", "bharat", "bengaluru", "bangalore", "mumbai", "bombay", "delhi",
+        "new delhi", "ncr", "gurgaon", "gurugram", "noida", "hyderabad", "chennai",
+        "madras", "pune", "kolkata", "calcutta", "ahmedabad", "jaipur", "kochi",
+        "cochin", "coimbatore", "indore", "chandigarh", "thiruvananthapuram",
+        "trivandrum", "nagpur", "lucknow", "bhubaneswar", "mysore", "mysuru",
+        "karnataka", "maharashtra", "telangana", "tamil nadu", "kerala", "gujarat",
+    ),
+    "us": (
+        "united states", "usa", "u.s.", "u.s.a", "america", "new york", "nyc",
+        "san francisco", "bay area", "silicon valley", "seattle", "austin",
+        "boston", "chicago", "los angeles", "san jose", "denver", "atlanta",
+        "dallas", "houston", "washington dc", "california", "texas",
+    ),
+    "gb": (
+        "united kingdom", "uk", "u.k.", "england", "scotland", "wales", "britain",
+        "great britain", "london", "manchester", "edinburgh", "birmingham",
+        "cambridge", "oxford", "bristol", "leeds", "glasgow",
+    ),
+    "sg": ("singapore",),
+    "ca": (
+        "canada", "toronto", "vancouver", "montreal", "ottawa", "calgary",
+        "waterloo", "ontario", "british columbia", "quebec",
+    ),
+    "au": (
+        "australia", "sydney", "melbourne", "brisbane", "perth", "adelaide",
+        "canberra", "new south wales", "victoria",
+    ),
+    "ph": ("philippines", "manila", "cebu", "makati", "quezon city", "taguig"),
+    "de": ("germany", "deutschland", "berlin", "munich", "münchen", "hamburg", "frankfurt"),
+    "ae": ("united arab emirates", "uae", "dubai", "abu dhabi"),
+}
+
+CURRENCY_BY_COUNTRY = {
+    "in": "INR", "us": "USD", "gb": "GBP", "sg": "SGD", "ca": "CAD",
+    "au": "AUD", "ph": "PHP", "de": "EUR", "ae": "AED",
+}
+
+REMOTE_WORDS = ("remote", "work from home", "wfh")
+HYBRID_WORDS = ("hybrid",)
+
+_YEARS_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(?:\+|plus)?\s*(?:-|to)?\s*(?:\d+(?:\.\d+)?)?\s*\+?\s*(?:years?|yrs?)", re.I)
+
+
+# ----------------------
+# Query and country
+# ----------------------
+def build_search_query(preferred_role: Optional[str]) -> str:
+    """
+    One short title from preferred_role: first alternative of "A / B", "A or B"
+    or "A, B", without parentheticals or extra whitespace.
+    """
+    role = (preferred_role or "").strip()
+    if not role:
+        return ""
+    role = re.sub(r"\([^)]*\)", " ", role)
+    role = re.split(r"\s*(?:/|,|;|\||\bor\b)\s*", role, maxsplit=1)[0]
+    return " ".join(role.split())
+
+
+def resolve_country(locations: Iterable[str], default: str = "in") -> str:
+    """First location that names a known country/city wins; otherwise default."""
+    for loc in locations or []:
+        if not isinstance(loc, str):
+            continue
+        text = f" {re.sub(r'[^a-z.ü ]+', ' ', loc.lower())} "
+        for code, aliases in COUNTRY_ALIASES.items():
+            if any(f" {alias} " in text for alias in aliases):
+                return code
+    return default
+
+
+def primary_city(locations: Iterable[str]) -> Optional[str]:
+    """City part of the first location ("Bengaluru, India" -> "Bengaluru"), skipping 'remote'."""
+    for loc in locations or []:
+        if not isinstance(loc, str) or not loc.strip():
+            continue
+        city = loc.split(",")[0].strip()
+        if city and city.lower() not in REMOTE_WORDS:
+            return city
+    return None
+
+
+# ----------------------
+# Typed field extractors
+# ----------------------
+def _str(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    s = str(value).strip()
+    return s or None
+
+
+def _float(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _str_list(value: Any) -> Optional[List[str]]:
+    if not isinstance(value, list):
+        return None
+    items = [s for s in (_str(v) for v in value) if s]
+    return items or None
+
+
+def _job_type(value: Any) -> Optional[str]:
+    s = (_str(value) or "").lower().replace("-", "_").replace(" ", "_")
+    if not s:
+        return None
+    if s in ("fulltime", "full_time", "permanent"):
+        return "full_time"
+    if s in ("parttime", "part_time"):
+        return "part_time"
+    if s in ("contractor", "contract", "temporary"):
+        return "contract"
+    if s in ("intern", "internship"):
+        return "internship"
+    return s
+
+
+def _remote_from_text(*texts: Optional[str]) -> Optional[str]:
+    blob = " ".join(t for t in texts if t).lower()
+    if any(w in blob for w in HYBRID_WORDS):
+        return "hybrid"
+    if any(w in blob for w in REMOTE_WORDS):
+        return "remote"
+    return None
+
+
+def _experience_from_text(text: Optional[str]) -> Optional[str]:
+    if not text:
+        return None
+    m = _YEARS_RE.search(text)
+    return " ".join(m.group(0).split()) if m else None
+
+
+def map_jsearch_job(raw: Dict[str, Any]) -> Optional[JobRole]:
+    title = _str(raw.get("job_title"))
+    if not title:
+        return None
+
+    location = ", ".join(
+        p for p in (_str(raw.get("job_city")), _str(raw.get("job_state"))) if p
+    ) or _str(raw.get("job_location")) or _str(raw.get("job_country"))
+
+    experience = None
+    req = raw.get("job_required_experience") or {}
+    months = _float(req.get("required_experience_in_months")) if isinstance(req, dict) else None
+    if months:
+        experience = f"{round(months / 12, 1):g}+ years"
+    else:
+        experience = _experience_from_text(raw.get("job_description"))
+
+    if raw.get("job_is_remote") is True:
+        remote_type = "remote"
+    else:
+        remote_type = _remote_from_text(title)
+
+    return JobRole(
+        title=title,
+        company=_str(raw.get("employer_name")),
+        location_area=location,
+        salary_min=_float(raw.get("job_min_salary")),
+        salary_max=_float(raw.get("job_max_salary")),
+        salary_currency=_str(raw.get("job_salary_currency")),
+        job_type=_job_type(raw.get("job_employment_type")),
+        remote_type=remote_type,
+        job_url=_str(raw.get("job_apply_link")) or _str(raw.get("job_google_link")),
+        source="jsearch",
+        required_skills=_str_list(raw.get("job_required_skills")),
+        experience_required=experience,
+    )
+
+
+def map_adzuna_job(raw: Dict[str, Any], market: str) -> Optional[JobRole]:
+    """market is the Adzuna market actually queried (adzuna_market), which sets the currency."""
+    title = _str(raw.get("title"))
+    if not title:
+        return None
+
+    company = raw.get("company") or {}
+    location = raw.get("location") or {}
+    description = _str(raw.get("description"))
+
+    return JobRole(
+        title=title,
+        company=_str(company.get("display_name")) if isinstance(company, dict) else _str(company),
+        location_area=_str(location.get("display_name")) if isinstance(location, dict) else _str(location),
+        salary_min=_float(raw.get("salary_min")),
+        salary_max=_float(raw.get("salary_max")),
+        salary_currency=CURRENCY_BY_COUNTRY.get(market),
+        job_type=_job_type(raw.get("contract_time") or raw.get("contract_type")),
+        remote_type=_remote_from_text(title, description),
+        job_url=_str(raw.get("redirect_url")),
+        source="adzuna",
+        experience_required=_experience_from_text(description),
+    )
+
+
+def _map_all(rows: Iterable[Dict[str, Any]], mapper, *args) -> List[JobRole]:
+    jobs: List[JobRole] = []
+    for raw in rows or []:
+        if not isinstance(raw, dict):
+            continue
+        try:
+            job = mapper(raw, *args)
+        except Exception as e:
+            logger.warning("Skipping unmappable job row: %s", e)
+            continue
+        if job is not None:
+            jobs.append(job)
+    return jobs
+
+
+# ----------------------
+# Direct juniors
+# ----------------------
+async def direct_search_jsearch(
+    mini_profile: Dict[str, Any],
+    default_country: str = "in",
+    max_results: int = 5,
+) -> JobSearchOutput:
+    """JSearch junior without the LLM. Never raises; returns an empty output on failure."""
+    title = build_search_query(mini_profile.get("preferred_role"))
+    locations = mini_profile.get("locations") or []
+    country = resolve_country(locations, default=default_country)
+    city = primary_city(locations)
+    query = f"{title} jobs in {city}" if city else f"{title} jobs"
+    remote_only = (mini_profile.get("remote_preference") or "").lower() == "remote"
+
+    criteria = SearchCriteria(query=query, country=country, filters_applied=["role", "location"])
+    if not title:
+        logger.warning("Direct JSearch skipped: no preferred_role")
+        return JobSearchOutput(jobs=[], search_criteria=criteria)
+
+    try:
+        data = await fetch_jobs_jsearch(
+            query=query,
+            country=country,
+            remote_jobs_only=remote_only,
+            max_results=max_results,
+        )
+        jobs = _map_all(data.get("normalized_jobs"), map_jsearch_job)
+        logger.info("Direct JSearch: %d jobs for '%s' (%s)", len(jobs), query, country)
+        return JobSearchOutput(jobs=jobs, search_criteria=criteria)
+    except Exception as e:
+        logger.error("Direct JSearch failed. Returning empty JobSearchOutput. Error: %s", e)
+        return JobSearchOutput(jobs=[], search_criteria=criteria)
+
+
+async def direct_search_adzuna(
+    mini_profile: Dict[str, Any],
+    default_country: str = "in",
+    max_results: int = 5,
+) -> JobSearchOutput:
+    """Adzuna junior without the LLM. Never raises; returns an empty output on failure."""
+    query = build_search_query(mini_profile.get("preferred_role"))
+    country = resolve_country(mini_profile.get("locations") or [], default=default_country)
+    market = adzuna_market(country)
+
+    # No "where" is sent: Adzuna is filtered by role and market (country) only.
+    criteria = SearchCriteria(query=query, country=market or country, filters_applied=["role", "country"])
+    if not query:
+        logger.warning("Direct Adzuna skipped: no preferred_role")
+        return JobSearchOutput(jobs=[], search_criteria=criteria)
+    if market is None:
+        logger.info("Direct Adzuna skipped: country '%s' is not an Adzuna market", country)
+        return JobSearchOutput(jobs=[], search_criteria=criteria)
+
+    try:
+        data = await fetch_jobs_adzuna(
+            query=query,
+            country=market,
+            results_per_page=max_results,
+            max_results=max_results,
+        )
+        jobs = _map_all(data.get("normalized_jobs"), map_adzuna_job, market)
+        logger.info("Direct Adzuna: %d jobs for '%s' (%s)", len(jobs), query, market)
+        return JobSearchOutput(jobs=jobs, search_criteria=criteria)
+    except Exception as e:
+        logger.error("Direct Adzuna failed. Returning empty JobSearchOutput. Error: %s", e)
+        return JobSearchOutput(jobs=[], search_criteria=criteria)
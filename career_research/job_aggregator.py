@@ -0,0 +1,289 @@
+# career_research/job_aggregator.py
+
+"""
+Deterministic merge / dedup / rank of the junior JobSearchOutput payloads.
+
+These are the rules the senior aggregator prompt used to spell out, applied in
+code instead of an LLM call:
+
+- Dedup key: normalized job_url (scheme, trailing slashes and host case
+  ignored), else
+  lowercased "<title> | <company> | <location_area or unknown>".
+- Among duplicates keep one job: non-empty job_url first, then the one with
+  more non-null detail fields (salary, skills, experience_required), then
+  source priority jsearch > adzuna > ddg, then first seen.
+- Rank unique jobs with score_jobs_batch (same scorer the presenter uses), breaking
+  ties by number of matched_criteria and by 'skills' being matched.
+
+JobRole keeps only matched_criteria and reason from the ranking; the senior
+summary agent gets the ranked view (ranked_summary_view) with overall_score
+and fit_level as well.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from career_research.career_researcher_agent import JobAggregation, JobRole, JobSearchOutput
+from present_to_user.batch_scoring import score_jobs_batch
+from present_to_user.job_compatibility_scoring import _num_list_from_text
+from utils.logger import logging
+
+logger = logging.getLogger(__name__)
+
+SOURCE_PRIORITY = ("jsearch", "adzuna", "ddg")
+
+# Inferred minimum years when experience_required is missing (from the senior prompt rules).
+SENIORITY_YEARS = (
+    ("senior", 5.0),
+    ("manager", 3.0),
+    ("junior", 0.0),
+)
+DEFAULT_REQUIRED_YEARS = 1.0
+
+DETAIL_FIELDS = ("salary_min", "salary_max", "required_skills", "preferred_skills", "experience_required")
+
+DEFAULT_MAX_BEST_MATCHES = 12
+
+# Ranked-job fields the senior summary agent reads (its prompt names overall_score and fit_level).
+SUMMARY_FIELDS = (
+    "title", "company", "location_area", "source",
+    "overall_score", "fit_level", "matched_criteria", "reason",
+)
+
+
+# ----------------------
+# Dedup
+# ----------------------
+def normalize_job_url(url: Optional[str]) -> str:
+    """
+    URL without scheme or trailing slashes and with a lowercased host; ''
+    when missing. Path and query keep their case (posting ids such as
+    htidocid are case-sensitive).
+    """
+    if not url or not str(url).strip():
+        return ""
+    u = re.sub(r"^https?://", "", str(url).strip(), flags=re.IGNORECASE)
+    host, rest = re.match(r"([^/?#]*)(.*)", u, re.DOTALL).groups()
+    return (host.lower() + rest).rstrip("/")
+
+
+def dedup_key(job: Dict[str, Any]) -> str:
+    url = normalize_job_url(job.get("job_url"))
+    if url:
+        return url
+    title = (job.get("title") or "").strip().lower()
+    company = (job.get("company") or "").strip().lower()
+    location = (job.get("location_area") or "unknown").strip().lower()
+    return f"{title} | {company} | {location}"
+
+
+def _is_filled(value: Any) -> bool:
+    if value is None:
+        return False
+    if isinstance(value, (str, list, dict)):
+        return bool(value)
+    return True
+
+
+def _source_rank(source: Optional[str]) -> int:
+    s = (source or "").strip().lower()
+    return SOURCE_PRIORITY.index(s) if s in SOURCE_PRIORITY else len(SOURCE_PRIORITY)
+
+
+def _preference(job: Dict[str, Any], order: int) -> Tuple[int, int, int, int]:
+    """Sort key where smaller wins among duplicates."""
+    has_url = 1 if normalize_job_url(job.get("job_url")) else 0
+    filled = sum(1 for f in DETAIL_FIELDS if _is_filled(job.get(f)))
+    return (-has_url, -filled, _source_rank(job.get("source")), order)
+
+
+def dedupe_jobs(jobs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Keep one job per dedup key, in first-seen key order."""
+    best: Dict[str, Tuple[Tuple[int, int, int, int], Dict[str, Any]]] = {}
+    for order, job in enumerate(jobs):
+        key = dedup_key(job)
+        pref = _preference(job, order)
+        current = best.get(key)
+        if current is None or pref < current[0]:
+            best[key] = (pref, job)
+    return [job for _, job in best.values()]
+
+
+def merge_source_outputs(outputs: Dict[str, JobSearchOutput]) -> List[Dict[str, Any]]:
+    """Flatten {source: JobSearchOutput} into job dicts, stamping a missing source."""
+    merged: List[Dict[str, Any]] = []
+    for source, output in outputs.items():
+        for job in output.jobs:
+            data = job.model_dump()
+            if not data.get("source"):
+                data["source"] = source
+            merged.append(data)
+    return merged
+
+
+# ----------------------
+# Matching and ranking
+# ----------------------
+def _required_years(job: Dict[str, Any]) -> float:
+    nums = _num_list_from_text(job.get("experience_required") or "")
+    if nums:
+        return max(nums)
+    text = f"{job.get('experience_required') or ''} {job.get('title') or ''}".lower()
+    for token, years in SENIORITY_YEARS:
+        if token in text:
+            return years
+    return DEFAULT_REQUIRED_YEARS
+
+
+def _user_years(profile: Dict[str, Any]) -> float:
+    prefs = profile.get("preferences") or {}
+    resume = profile.get("resume") or {}
+    years = prefs.get("user_reported_years_experience")
+    if years is None:
+        years = resume.get("years_experience")
+    try:
+        return float(years or 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def matched_criteria_for(scored: Dict[str, Any], user_years: float) -> Tuple[List[str], str]:
+    """Derive matched_criteria and a one line reason from a score_job result."""
+    dims = scored.get("dimension_scores") or {}
+    matched: List[str] = []
+    parts: List[str] = []
+
+    role = dims.get("role", 0.0)
+    if role >= 1.2:
+        matched.append("role")
+    parts.append("Role strong" if role >= 2.0 else "Role partial" if role >= 1.2 else "Role weak")
+
+    skills = dims.get("matched_skills") or []
+    required = scored.get("required_skills") or []
+    preferred = scored.get("preferred_skills") or []
+    if len(skills) >= 2:
+        matched.append("skills")
+    denom = len(required) + len(preferred)
+    parts.append(f"Skills {len(skills)}/{denom}" if denom else "Skills unknown")
+
+    required_years = _required_years(scored)
+    gap = required_years - user_years
+    if gap <= 1.0:
+        matched.append("experience")
+    parts.append("Experience ok" if gap <= 0 else f"Experience {gap:g} years short")
+
+    if dims.get("location", 0.0) >= 1.5:
+        matched.append("location")
+        parts.append("Location ok")
+    else:
+        parts.append("Location mismatch")
+
+    if dims.get("salary_reason") == "meets_expectation":
+        matched.append("salary")
+
+    return matched, "; ".join(parts)
+
+
+def rank_jobs(profile: Dict[str, Any], jobs: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Score every job and return them best first (stable for equal keys)."""
+    user_years = _user_years(profile)
+    ranked: List[Dict[str, Any]] = []
+    for scored in score_jobs_batch(profile, jobs):
+        matched, reason = matched_criteria_for(scored, user_years)
+        scored["matched_criteria"] = matched
+        scored["reason"] = reason
+        ranked.append(scored)
+
+    ranked.sort(
+        key=lambda j: (
+            j.get("overall_score", 0.0),
+            len(j["matched_criteria"]),
+            "skills" in j["matched_criteria"],
+        ),
+        reverse=True,
+    )
+    return ranked
+
+
+def summarize_matches(ranked: Sequence[Dict[str, Any]], total_unique: int) -> str:
+    """Two or three factual sentences on how many strong/medium/weak matches were found."""
+    counts = {"strong": 0, "medium": 0, "weak": 0, "aspirational": 0}
+    for job in ranked:
+        level = job.get("fit_level", "aspirational")
+        counts[level] = counts.get(level, 0) + 1
+
+    if not ranked:
+        return "No job postings were found across JSearch, Adzuna and DuckDuckGo for this profile."
+
+    return (
+        f"Found {total_unique} unique postings after deduplication and kept the top {len(ranked)}. "
+        f"Strong matches: {counts['strong']}, medium: {counts['medium']}, "
+        f"weak or aspirational: {counts['weak'] + counts['aspirational']}."
+    )
+
+
+def rerank_aggregation(profile: Dict[str, Any], aggregation: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Re-rank an existing aggregation dict's best_matches for an updated profile
+    without searching again (used when only scoring preferences changed).
+    """
+    ranked = rank_jobs(profile, aggregation.get("best_matches") or [])
+    total_unique = sum((aggregation.get("source_breakdown") or {}).values()) or len(ranked)
+
+    job_fields = JobRole.model_fields.keys()
+    return {
+        **aggregation,
+        "best_matches": [{k: v for k, v in job.items() if k in job_fields} for job in ranked],
+        "search_summary": summarize_matches(ranked, total_unique),
+    }
+
+
+def ranked_summary_view(ranked: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Ranked jobs cut down to SUMMARY_FIELDS, best first."""
+    return [{k: job[k] for k in SUMMARY_FIELDS if job.get(k) is not None} for job in ranked]
+
+
+# ----------------------
+# Entry point
+# ----------------------
+def aggregate_jobs(
+    profile: Dict[str, Any],
+    outputs: Dict[str, JobSearchOutput],
+    max_best_matches: int = DEFAULT_MAX_BEST_MATCHES,
+) -> JobAggregation:
+    """
+    Merge {source: JobSearchOutput}, dedupe, rank with score_job and keep the
+    top max_best_matches as a JobAggregation (same shape the senior agent returned).
+    """
+    return aggregate_ranked_jobs(profile, outputs, max_best_matches)[0]
+
+
+def aggregate_ranked_jobs(
+    profile: Dict[str, Any],
+    outputs: Dict[str, JobSearchOutput],
+    max_best_matches: int = DEFAULT_MAX_BEST_MATCHES,
+) -> Tuple[JobAggregation, List[Dict[str, Any]]]:
+    """aggregate_jobs plus the scored dicts behind best_matches (same order)."""
+    merged = merge_source_outputs(outputs)
+    unique = dedupe_jobs(merged)
+
+    source_breakdown: Dict[str, int] = {}
+    for job in unique:
+        source = (job.get("source") or "unknown").strip().lower()
+        source_breakdown[source] = source_breakdown.get(source, 0) + 1
+
+    ranked = rank_jobs(profile, unique)[:max_best_matches]
+    logger.info(
+        "Aggregated %d jobs into %d unique, keeping %d best matches",
+        len(merged), len(unique), len(ranked),
+    )
+
+    job_fields = JobRole.model_fields.keys()
+    best_matches = [JobRole(**{k: v for k, v in job.items() if k in job_fields}) for job in ranked]
+
+    aggregation = JobAggregation(
+        source_breakdown=source_breakdown,
+        best_matches=best_matches,
+        search_summary=summarize_matches(ranked, len(unique)),
+    )
+    return aggregation, ranked
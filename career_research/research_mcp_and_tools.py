@@ -3,11 +3,15 @@ from __future__ import annotations
 import sys
 import os
 import requests
-from typing import Any, Dict, List
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
 from utils.logger import logging
 from utils.exception import CustomException
+from utils.http_client import get_http_client
+from utils.read_yaml import read_yaml
+from utils.sqlite_cache import SqliteCache, make_cache_key
 
 from agents import function_tool
 from agents.mcp import MCPServerStdio
@@ -25,6 +29,206 @@ JSEARCH_HOST = "jsearch.p.rapidapi.com"
 ADZUNA_APP_ID = os.getenv("ADZUNA_APP_ID")
 ADZUNA_APP_KEY = os.getenv("ADZUNA_APP_KEY")
 
+config = read_yaml(Path("config/master_config.yaml"))
+_search_cache_config = config.get("search_cache", {})
+
+# Raw API responses, shared across runs and restarts (same role + city => same query)
+search_cache = SqliteCache(
+    db_path=_search_cache_config.get("path", "cache/search_cache.db"),
+    namespace="job_search",
+    ttl_seconds=float(_search_cache_config.get("ttl_minutes", 360)) * 60,
+    max_bytes=int(float(_search_cache_config.get("max_mb", 64)) * 1024 * 1024),
+    enabled=bool(_search_cache_config.get("enabled", True)),
+)
+
+# Credentials never go into cache keys.
+_UNCACHED_PARAMS = ("app_id", "app_key")
+
+# ======================================
+# REQUEST BUILDERS / RESPONSE LIMITERS (shared by sync and async tools)
+# ======================================
+
+def _jsearch_request(
+    query: str,
+    country: str,
+    page: int,
+    num_pages: int,
+    date_posted: str,
+    remote_jobs_only: bool,
+) -> Tuple[str, Dict[str, Any], Dict[str, str]]:
+    if not RAPIDAPI_KEY:
+        raise CustomException(
+            "RAPIDAPI_KEY not configured, cannot call JSearch",
+            error_detail=None,
+        )
+
+    url = f"https://{JSEARCH_HOST}/search"
+    params = {
+        "query": query,
+        "country": country,
+        "page": page,
+        "num_pages": num_pages,
+        "date_posted": date_posted,
+        "remote_jobs_only": str(remote_jobs_only).lower(),
+    }
+    headers = {
+        "x-rapidapi-key": RAPIDAPI_KEY,
+        "x-rapidapi-host": JSEARCH_HOST,
+    }
+
+    logger.info(
+        "Calling JSearch: '%s' (%s) page=%s num_pages=%s",
+        query, country, page, num_pages,
+    )
+    return url, params, headers
+
+
+def _limit_jsearch(data: Dict[str, Any], max_results: int) -> Dict[str, Any]:
+    if "data" in data and len(data["data"]) > max_results:
+        original_count = len(data["data"])
+        data["data"] = data["data"][:max_results]
+        data["took"] = f"{len(data['data'])}/{original_count} results (limited to {max_results})"
+        logger.info("JSearch truncated: %s → %s jobs", original_count, max_results)
+
+    data["normalized_jobs"] = data.get("data", [])
+    logger.info("JSearch normalized: %s jobs", len(data["normalized_jobs"]))
+
+    logger.info("JSearch returned %s jobs (limited to %s)", len(data.get("data", [])), max_results)
+    return data
+
+
+# Country code -> Adzuna market. Adzuna has no Philippines market, so "ph" searches Singapore.
+ADZUNA_MARKETS = {
+    "us": "us", "in": "in", "ph": "sg", "sg": "sg",
+    "ca": "ca", "gb": "gb", "au": "au", "de": "de",
+}
+
+
+def adzuna_market(country: str) -> Optional[str]:
+    """The Adzuna market searched for country, or None when Adzuna does not cover it."""
+    return ADZUNA_MARKETS.get((country or "").lower())
+
+
+def _adzuna_request(
+    query: str,
+    country: str,
+    results_per_page: int,
+    max_results: int,
+) -> Tuple[str, Dict[str, Any]]:
+    if not ADZUNA_APP_ID or not ADZUNA_APP_KEY:
+        raise CustomException(
+            "ADZUNA_APP_ID or ADZUNA_APP_KEY not configured",
+            error_detail=None,
+        )
+    # Agent tool calls keep the old "us" fallback; the direct junior skips uncovered countries.
+    adzuna_country = adzuna_market(country) or "us"
+
+    url = f"https://api.adzuna.com/v1/api/jobs/{adzuna_country}/search/1"
+    params = {
+        "app_id": ADZUNA_APP_ID,
+        "app_key": ADZUNA_APP_KEY,
+        "what": [query],  
+        "results_per_page": min(results_per_page, max_results),
+        "sort_by": "date",  # Recent jobs first (realtimr/week results)
+    }
+
+    logger.info(
+        "Calling Adzuna: '%s' (%s → %s) results=%s",
+        query, country, adzuna_country, results_per_page,
+    )
+    return url, params
+
+
+def _limit_adzuna(data: Dict[str, Any], max_results: int) -> Dict[str, Any]:
+    # ADDED LIMITS coz tokens were sometimes exceeding limits due to repeated searches
+    if "results" in data and len(data["results"]) > max_results:
+        original_count = len(data["results"])
+        data["results"] = data["results"][:max_results]
+        data["count"] = min(data.get("count", 0), max_results)
+        logger.info("Adzuna truncated: %s → %s jobs", original_count, max_results)
+        
+    data["normalized_jobs"] = data.get("results", [])
+    logger.info("Adzuna normalized: %s jobs", len(data["normalized_jobs"]))
+    logger.info("Adzuna returned %s jobs (limited to %s)", len(data.get("results", [])), max_results)
+    return data
+
+
+def _normalize_query(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_normalize_query(v) for v in value]
+    if isinstance(value, str):
+        return " ".join(value.lower().split())
+    return value
+
+
+def _search_cache_key(source: str, url: str, params: Dict[str, Any]) -> str:
+    """Key on endpoint + request params with normalized query text (case/whitespace)."""
+    fields = {
+        k: _normalize_query(v) for k, v in params.items()
+        if k not in _UNCACHED_PARAMS
+    }
+    return make_cache_key(source, url.lower(), **fields)
+
+
+# ======================================
+# ASYNC API CALLS (shared pooled httpx client)
+# ======================================
+
+async def fetch_jobs_jsearch(
+    query: str,
+    country: str = "us",
+    page: int = 1,
+    num_pages: int = 1,
+    date_posted: str = "week",
+    remote_jobs_only: bool = False,
+    max_results: int = 5,
+) -> Dict[str, Any]:
+    """JSearch call over the shared keep-alive client (no agent wrapper)."""
+    try:
+        url, params, headers = _jsearch_request(
+            query, country, page, num_pages, date_posted, remote_jobs_only
+        )
+        cache_key = _search_cache_key("jsearch", url, params)
+        data = await search_cache.aget(cache_key)
+        if data is None:
+            data = await get_http_client().get_json(url, params=params, headers=headers)
+            await search_cache.aset(cache_key, data)
+        else:
+            logger.info("JSearch cache hit for '%s' (%s)", query, country)
+        return _limit_jsearch(data, max_results)
+
+    except CustomException:
+        raise
+    except Exception as e:
+        logger.error("Error during JSearch call: %s", str(e))
+        raise CustomException(e, error_detail=sys)
+
+
+async def fetch_jobs_adzuna(
+    query: str,
+    country: str = "us",
+    results_per_page: int = 5,
+    max_results: int = 5,
+) -> Dict[str, Any]:
+    """Adzuna call over the shared keep-alive client (no agent wrapper)."""
+    try:
+        url, params = _adzuna_request(query, country, results_per_page, max_results)
+        cache_key = _search_cache_key("adzuna", url, params)
+        data = await search_cache.aget(cache_key)
+        if data is None:
+            data = await get_http_client().get_json(url, params=params)
+            await search_cache.aset(cache_key, data)
+        else:
+            logger.info("Adzuna cache hit for '%s' (%s)", query, country)
+        return _limit_adzuna(data, max_results)
+
+    except CustomException:
+        raise
+    except Exception as e:
+        logger.error("Error during Adzuna call: %s", str(e))
+        raise CustomException(e, error_detail=sys)
+
+
 # ======================================
 # JSEARCH PYTHON TOOL (Primary API - LIMITED)
 # ======================================
@@ -44,46 +248,17 @@ def search_jobs_jsearch(
     Defaults: 1 page, recent week, remote only, max 5 jobs.
     """
     try:
-        if not RAPIDAPI_KEY:
-            raise CustomException(
-                "RAPIDAPI_KEY not configured, cannot call JSearch",
-                error_detail=None,
-            )
-
-        url = f"https://{JSEARCH_HOST}/search"
-        params = {
-            "query": query,
-            "country": country,
-            "page": page,
-            "num_pages": num_pages,
-            "date_posted": date_posted,
-            "remote_jobs_only": str(remote_jobs_only).lower(),
-        }
-        headers = {
-            "x-rapidapi-key": RAPIDAPI_KEY,
-            "x-rapidapi-host": JSEARCH_HOST,
-        }
-
-        logger.info(
-            "Calling JSearch: '%s' (%s) page=%s num_pages=%s",
-            query, country, page, num_pages,
+        url, params, headers = _jsearch_request(
+            query, country, page, num_pages, date_posted, remote_jobs_only
         )
-
-        resp = requests.get(url, headers=headers, params=params, timeout=60)
-        resp.raise_for_status()
-        data = resp.json()
-
-        if "data" in data and len(data["data"]) > max_results:
-            original_count = len(data["data"])
-            data["data"] = data["data"][:max_results]
-            data["took"] = f"{len(data['data'])}/{original_count} results (limited to {max_results})"
-            logger.info("JSearch truncated: %s → %s jobs", original_count, max_results)
-
-        data["normalized_jobs"] = data.get("data", [])
-        logger.info("JSearch normalized: %s jobs", len(data["normalized_jobs"]))
-
-        logger.info("JSearch returned %s jobs (limited to %s)", len(data.get("data", [])), max_results)
-        return data
+        cache_key = _search_cache_key("jsearch", url, params)
+        data = search_cache.get(cache_key)
+        if data is None:
+            resp = requests.get(url, headers=headers, params=params, timeout=60)
+            resp.raise_for_status()
+            data = resp.json()
+            search_cache.set(cache_key, data)
+        return _limit_jsearch(data, max_results)
 
     except CustomException:
         raise
@@ -91,6 +266,31 @@ def search_jobs_jsearch(
         logger.error("Error during JSearch call: %s", str(e))
         raise CustomException(e, error_detail=sys)
 
+
+@function_tool(name_override="search_jobs_jsearch")
+async def search_jobs_jsearch_async(
+    query: str,
+    country: str = "us",
+    page: int = 1,
+    num_pages: int = 1,           # Always 1 page max
+    date_posted: str = "week",    # Recent jobs only
+    remote_jobs_only: bool = False, # Fewer results
+    max_results: int = 5,         # Post-process limit
+) -> Dict[str, Any]:
+    """
+    JSearch API - LIMITED OUTPUT for agent context window safety.
+    Defaults: 1 page, recent week, remote only, max 5 jobs.
+    """
+    return await fetch_jobs_jsearch(
+        query=query,
+        country=country,
+        page=page,
+        num_pages=num_pages,
+        date_posted=date_posted,
+        remote_jobs_only=remote_jobs_only,
+        max_results=max_results,
+    )
+
 # ======================================
 # ADZUNA PYTHON TOOL (FREE API - LIMITED)
 # ======================================
@@ -107,47 +307,15 @@ def search_jobs_adzuna(
     Defaults: 5 results max. PH uses SG proxy.
     """
     try:
-        if not ADZUNA_APP_ID or not ADZUNA_APP_KEY:
-            raise CustomException(
-                "ADZUNA_APP_ID or ADZUNA_APP_KEY not configured",
-                error_detail=None,
-            )
-        # API Requires this stuff
-        country_map = {
-            "us": "us", "in": "in", "ph": "sg", "sg": "sg",
-            "ca": "ca", "gb": "gb", "au": "au"
-        }
-        adzuna_country = country_map.get(country.lower(), "us")
-
-        url = f"https://api.adzuna.com/v1/api/jobs/{adzuna_country}/search/1"
-        params = {
-            "app_id": ADZUNA_APP_ID,
-            "app_key": ADZUNA_APP_KEY,
-            "what": [query],  
-            "results_per_page": min(results_per_page, max_results),
-            "sort_by": "date",  # Recent jobs first (realtimr/week results)
-        }
-
-        logger.info(
-            "Calling Adzuna: '%s' (%s → %s) results=%s",
-            query, country, adzuna_country, results_per_page,
-        )
-
-        resp = requests.get(url, params=params, timeout=60)
-        resp.raise_for_status()
-        data = resp.json()
-
-        # ADDED LIMITS coz tokens were sometimes exceeding limits due to repeated searches
-        if "results" in data and len(data["results"]) > max_results:
-            original_count = len(data["results"])
-            data["results"] = data["results"][:max_results]
-            data["count"] = min(data.get("count", 0), max_results)
-            logger.info("Adzuna truncated: %s → %s jobs", original_count, max_results)
-            
-        data["normalized_jobs"] = data.get("results", [])
-        logger.info("Adzuna normalized: %s jobs", len(data["normalized_jobs"]))
-        logger.info("Adzuna returned %s jobs (limited to %s)", len(data.get("results", [])), max_results)
-        return data
+        url, params = _adzuna_request(query, country, results_per_page, max_results)
+        cache_key = _search_cache_key("adzuna", url, params)
+        data = search_cache.get(cache_key)
+        if data is None:
+            resp = requests.get(url, params=params, timeout=60)
+            resp.raise_for_status()
+            data = resp.json()
+            search_cache.set(cache_key, data)
+        return _limit_adzuna(data, max_results)
 
     except CustomException:
         raise
@@ -156,38 +324,70 @@ def search_jobs_adzuna(
         raise CustomException(e, error_detail=sys)
 
 
+@function_tool(name_override="search_jobs_adzuna")
+async def search_jobs_adzuna_async(
+    query: str,
+    country: str = "us",
+    results_per_page: int = 5,   
+    max_results: int = 5,        
+) -> Dict[str, Any]:
+    """
+    Adzuna FREE API - LIMITED OUTPUT for agent context safety.
+    Defaults: 5 results max. PH uses SG proxy.
+    """
+    return await fetch_jobs_adzuna(
+        query=query,
+        country=country,
+        results_per_page=results_per_page,
+        max_results=max_results,
+    )
 
 
-def researcher_mcp_stdio_servers(
-    client_session_timeout_seconds: int = 300,
-) -> List[MCPServerStdio]:
-    servers: List[MCPServerStdio] = []
 
+
+def fetch_mcp_server(client_session_timeout_seconds: int = 300) -> MCPServerStdio:
     # ✅ Fetch MCP (Python, robust)
-    servers.append(
-        MCPServerStdio(
-            name="fetch_mcp",
-            params={
-                "command": "python",
-                "args": ["-m", "mcp_server_fetch"],
-            },
-            client_session_timeout_seconds=client_session_timeout_seconds,
-        )
+    return MCPServerStdio(
+        name="fetch_mcp",
+        params={
+            "command": "python",
+            "args": ["-m", "mcp_server_fetch"],
+        },
+        client_session_timeout_seconds=client_session_timeout_seconds,
     )
 
+
+def ddg_mcp_server(client_session_timeout_seconds: int = 300) -> MCPServerStdio:
     # ✅ DuckDuckGo MCP (already working)
-    servers.append(
-        MCPServerStdio(
-            name="ddg_mcp",
-            params={
-                "command": "ddg-search-mcp",
-                "args": [],
-            },
-            client_session_timeout_seconds=client_session_timeout_seconds,
-        )
+    return MCPServerStdio(
+        name="ddg_mcp",
+        params={
+            "command": "ddg-search-mcp",
+            "args": [],
+        },
+        client_session_timeout_seconds=client_session_timeout_seconds,
     )
 
-    return servers
+
+def researcher_mcp_server_factories(
+    client_session_timeout_seconds: int = 300,
+) -> Dict[str, Callable[[], MCPServerStdio]]:
+    """
+    Name -> zero-arg builder for the research MCP servers.
+    Used by the process-wide MCPServerPool (utils/mcp_server_pool.py).
+    """
+    return {
+        "fetch_mcp": lambda: fetch_mcp_server(client_session_timeout_seconds),
+        "ddg_mcp": lambda: ddg_mcp_server(client_session_timeout_seconds),
+    }
+
+
+def researcher_mcp_stdio_servers(
+    client_session_timeout_seconds: int = 300,
+) -> List[MCPServerStdio]:
+    return [
+        build() for build in researcher_mcp_server_factories(client_session_timeout_seconds).values()
+    ]
 
 
 
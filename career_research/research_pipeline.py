@@ -5,26 +5,27 @@ Sequential flow:
 1) Load the full user profile from the LiteLLM memory database.
 2) Minimize the profile into only the fields needed for job search APIs
    (role, location, remote preference, salary expectation).
-3) Start all required MCP servers inside an AsyncExitStack:
+3) Lease the MCP servers from the process-wide MCPServerPool when one is given,
+   otherwise start them inside an AsyncExitStack:
    - fetch_mcp for fetching page content
    - ddg_mcp for DuckDuckGo based search
-   - playwright_mcp for dynamic pages if needed
 4) Create three junior job researchers using create_multi_source_career_research_agents:
    - JSearch API agent (Python tool)
    - Adzuna API agent (Python tool)
    - DuckDuckGo web search agent (MCP tools only)
 5) Build a compact task that includes the minimized profile and instructs each
    junior to return a JobSearchOutput without explanations.
-6) Run all three junior agents in parallel with Runner.run, wrapped in
-   safe_run_junior so any failure becomes an empty JobSearchOutput instead of
-   crashing the pipeline.
-7) Create a senior researcher agent that does not call tools and only works on
-   the JSON outputs from the three juniors.
-8) Build a senior task that embeds the three JobSearchOutput objects as JSON
-   and instructs the senior agent to merge, deduplicate and rank jobs into a
-   JobAggregation object.
-9) Run the senior agent and validate that the final_output is a JobAggregation.
-10) Return a combined dictionary that includes:
+6) Run all three juniors in parallel. With research.junior_mode "direct"
+   (default) JSearch and Adzuna are queried without an LLM
+   (career_research/direct_job_search.py); otherwise, and always for DDG,
+   agents run via Runner.run wrapped in safe_run_junior so any failure becomes
+   an empty JobSearchOutput instead of crashing the pipeline.
+7) Merge, deduplicate and rank the three JobSearchOutput payloads in code
+   (career_research/job_aggregator.py) into a JobAggregation, ranking with the
+   same score_job used by the presenter.
+8) Optionally (aggregation.senior_llm_summary) let a senior agent rewrite
+   search_summary only; otherwise a deterministic summary is used.
+9) Return a combined dictionary that includes:
     - original profile
     - senior best matches
     - full aggregation
@@ -35,7 +36,8 @@ Sequential flow:
 import sys
 import json
 import asyncio
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from contextlib import AsyncExitStack
 
 from agents import Runner, trace
@@ -46,17 +48,36 @@ from utils.exception import CustomException
 from career_research.fetch_user_profile import fetch_user_profile_async
 from career_research.career_researcher_agent import (
     create_multi_source_career_research_agents,
-    create_senior_researcher_agent,
+    create_senior_summary_agent,
     JobSearchOutput,
     JobAggregation,
 )
+from career_research.direct_job_search import direct_search_adzuna, direct_search_jsearch
+from career_research.job_aggregator import DEFAULT_MAX_BEST_MATCHES, aggregate_ranked_jobs, ranked_summary_view
 from career_research.research_mcp_and_tools import (
     researcher_mcp_stdio_servers,
 )
 from career_research.research_reports import write_debug_markdown  
+from utils.mcp_server_pool import MCPServerPool
+from utils.skill_taxonomy import skill_taxonomy
+from utils.read_yaml import read_yaml
 
 logger = logging.getLogger(__name__)
 
+config = read_yaml(Path("config/master_config.yaml"))
+_aggregation_config = config.get("aggregation", {})
+MAX_BEST_MATCHES = int(_aggregation_config.get("max_best_matches", DEFAULT_MAX_BEST_MATCHES))
+SENIOR_LLM_SUMMARY = bool(_aggregation_config.get("senior_llm_summary", False))
+
+_research_config = config.get("research", {})
+# "direct": JSearch/Adzuna are called without an LLM; "agent": LLM juniors call the tools.
+JUNIOR_MODE = str(_research_config.get("junior_mode", "direct")).lower()
+DEFAULT_COUNTRY = str(_research_config.get("default_country", "in")).lower()
+# Minimized-profile keys the "direct" JSearch/Adzuna search uses; salary, experience and skills only affect ranking.
+SEARCH_PROFILE_FIELDS = ("preferred_role", "locations", "remote_preference")
+# The DuckDuckGo agent also builds its query from top_skills and filters by experience; salary only affects ranking.
+DDG_PROFILE_FIELDS = ("preferred_role", "locations", "remote_preference", "years_experience", "top_skills")
+
 
 # We need this coz searching can get crowded when we enter the entire resume and profile (this makes searching crisp)
 def minimize_profile(full_profile: dict) -> dict:
@@ -91,19 +112,7 @@ def minimize_profile(full_profile: dict) -> dict:
     # ----------------------
     raw_skills = resume.get("top_technical_skills") or []
 
-    low_signal_langs = {
-        "python", "java", "c++", "c", "c#", "javascript", "js",
-        "typescript", "go", "golang", "ruby", "php", "rust",
-        "kotlin", "swift", "scala",
-
-        "communication", "leadership", "teamwork", "collaboration",
-        "problem solving", "critical thinking", "creativity",
-
-        "english", "hindi", "marathi", "spanish", "german", "french", "russian", "japanese"
-        "sales", "marketing", "management",
-        "microsoft office", "excel", "powerpoint", "word",
-    }
-
+    # Bare languages, soft skills, spoken languages and office tools are "low" tier in config/skill_taxonomy.yaml
     high_signal: list[str] = []
     for s in raw_skills:
         if not isinstance(s, str):
@@ -111,7 +120,7 @@ def minimize_profile(full_profile: dict) -> dict:
         s_clean = s.strip()
         if not s_clean:
             continue
-        if s_clean.lower() not in low_signal_langs:
+        if not skill_taxonomy.is_low_signal(s_clean):
             high_signal.append(s_clean)
 
     # PRIORITIZE HIGH SIGNAL SKILLS
@@ -142,6 +151,41 @@ def minimize_profile(full_profile: dict) -> dict:
 
 
 
+def search_profile(mini_profile: dict, junior_mode: str = JUNIOR_MODE) -> dict:
+    """
+    The part of the minimized profile JSearch/Adzuna receive: only
+    SEARCH_PROFILE_FIELDS in "direct" mode, everything for LLM juniors.
+    """
+    if junior_mode == "direct":
+        return {key: mini_profile.get(key) for key in SEARCH_PROFILE_FIELDS}
+    return dict(mini_profile)
+
+
+def junior_task_profiles(mini_profile: dict, junior_mode: str = JUNIOR_MODE) -> Dict[str, dict]:
+    """{"api": what JSearch/Adzuna receive, "ddg": what the DuckDuckGo agent receives}."""
+    return {
+        "api": search_profile(mini_profile, junior_mode),
+        "ddg": {key: mini_profile.get(key) for key in DDG_PROFILE_FIELDS},
+    }
+
+
+def build_junior_task(task_profile: dict) -> str:
+    """Task prompt for an LLM junior, carrying exactly task_profile."""
+    return (
+        "You receive a small JSON profile with these keys: "
+        f"{', '.join(task_profile)}.\n"
+        "Use this JSON only. Do not invent different roles, locations, or salary values.\n\n"
+        "When you call your job search tool, you must:\n"
+        "- Build the search query from preferred roles and similar roles.\n"
+        "- Use the locations list to infer the city or region for search.\n"
+        "- Infer the correct country from the locations list and pass it explicitly as the country argument.\n"
+        "- Do not rely on the tool default country.\n\n"
+        "Return a JobSearchOutput JSON only. No explanations or extra text.\n\n"
+        "User profile JSON:\n"
+        f"{json.dumps(task_profile, ensure_ascii=False)}"
+    )
+
+
 async def safe_run_junior(agent, task: str) -> JobSearchOutput:
     """
     Run a junior agent with safeguards:
@@ -177,12 +221,63 @@ async def safe_run_junior(agent, task: str) -> JobSearchOutput:
         return JobSearchOutput(jobs=[], search_criteria=None)
 
 
+async def write_senior_summary(
+    model: str,
+    mini_profile: Dict[str, Any],
+    aggregation: JobAggregation,
+    ranked: List[Dict[str, Any]],
+) -> str:
+    """
+    Ask the senior agent for search_summary only, from the ranked view of
+    best_matches (scores and fit levels, not the JobRole dumps). Falls back
+    to the deterministic summary already on the aggregation if the call fails.
+    """
+    try:
+        senior_agent = await create_senior_summary_agent(model=model)
+        senior_task = (
+            "# CANDIDATE PROFILE\n"
+            f"{json.dumps(mini_profile, indent=2)}\n\n"
+            "# SOURCE BREAKDOWN (after deduplication)\n"
+            f"{json.dumps(aggregation.source_breakdown)}\n\n"
+            "# RANKED BEST MATCHES\n"
+            f"{json.dumps(ranked_summary_view(ranked), ensure_ascii=False)}\n\n"
+            "Write the search_summary now."
+        )
+        with trace("Senior_Researcher_Summarizing_Research"):
+            senior_run = await Runner.run(senior_agent, senior_task, max_turns=2)
+
+        summary = getattr(senior_run, "final_output", None)
+        if isinstance(summary, str) and summary.strip():
+            return summary.strip()
+        logger.warning("Senior summary was empty; keeping deterministic summary")
+    except Exception as e:
+        logger.warning("Senior summary failed, keeping deterministic summary: %s", e)
+    return aggregation.search_summary
+
+
+async def _report_when_done(
+    source: str,
+    call: Awaitable[JobSearchOutput],
+    on_event: Optional[Callable[..., Any]],
+) -> JobSearchOutput:
+    """Await one junior and report its job count as soon as it finishes."""
+    output = await call
+    if on_event:
+        on_event("research.source_done", source=source, jobs=len(output.jobs or []))
+    return output
+
+
 async def run_career_research(
     memory_db_path: str,
     model: str = "gpt-4.1-mini",
+    mcp_pool: Optional[MCPServerPool] = None,
+    on_event: Optional[Callable[..., Any]] = None,
 ) -> Dict[str, Any]:
     """
     Main entrypoint for the job role research stage.
+    Leases MCP servers from mcp_pool when given, otherwise spawns them for this call.
+    on_event (optional) receives research.profile_loaded, one research.source_done
+    per junior and research.aggregated.
     """
     try:
         profile = await fetch_user_profile_async(memory_db_path)
@@ -194,12 +289,17 @@ async def run_career_research(
             bool(profile.get("resume")),
             bool(profile.get("preferences")),
         )
+        if on_event:
+            on_event("research.profile_loaded", preferred_role=mini_profile.get("preferred_role"))
 
         async with AsyncExitStack() as stack:
-            mcp_servers = []
-            for server in researcher_mcp_stdio_servers():
-                entered = await stack.enter_async_context(server)
-                mcp_servers.append(entered)
+            if mcp_pool is not None:
+                mcp_servers = list(await stack.enter_async_context(mcp_pool.lease()))
+            else:
+                mcp_servers = []
+                for server in researcher_mcp_stdio_servers():
+                    entered = await stack.enter_async_context(server)
+                    mcp_servers.append(entered)
 
             jsearch_agent, adzuna_agent, ddg_agent = (
                 await create_multi_source_career_research_agents(
@@ -208,107 +308,49 @@ async def run_career_research(
                 )
             )
 
-            senior_agent = await create_senior_researcher_agent(
-                model=model,
-                mcp_servers=mcp_servers,
-            )
+            # Each junior gets only the fields it searches with (pipeline_dag fingerprints the same dicts).
+            task_profiles = junior_task_profiles(mini_profile)
+            api_task = build_junior_task(task_profiles["api"])
+            ddg_task = build_junior_task(task_profiles["ddg"])
 
-            base_task = (
-                "You receive a small JSON profile with these keys: "
-                "preferred_role, locations, remote_preference, target_salary_lpa, years_experience, top_skills.\n"
-                "Use this JSON only. Do not invent different roles, locations, or salary values.\n\n"
-                "When you call your job search tool, you must:\n"
-                "- Build the search query from preferred roles and similar roles.\n"
-                "- Use the locations list to infer the city or region for search.\n"
-                "- Infer the correct country from the locations list and pass it explicitly as the country argument.\n"
-                "- Do not rely on the tool default country.\n\n"
-                "Return a JobSearchOutput JSON only. No explanations or extra text.\n\n"
-                "User profile JSON:\n"
-                f"{json.dumps(mini_profile, ensure_ascii=False)}"
-            )
 
+            if JUNIOR_MODE == "direct":
+                jsearch_call = direct_search_jsearch(mini_profile, default_country=DEFAULT_COUNTRY)
+                adzuna_call = direct_search_adzuna(mini_profile, default_country=DEFAULT_COUNTRY)
+            else:
+                jsearch_call = safe_run_junior(jsearch_agent, api_task)
+                adzuna_call = safe_run_junior(adzuna_agent, api_task)
 
             with trace("Junior_Researchers_Finding_Best_Roles"):
                 jsearch_output, adzuna_output, ddg_output = await asyncio.gather(
-                    safe_run_junior(jsearch_agent, base_task),
-                    safe_run_junior(adzuna_agent, base_task),
-                    safe_run_junior(ddg_agent, base_task),
+                    _report_when_done("jsearch", jsearch_call, on_event),
+                    _report_when_done("adzuna", adzuna_call, on_event),
+                    _report_when_done("ddg", safe_run_junior(ddg_agent, ddg_task), on_event),
                 )
 
-            senior_task = (
-                "# CANDIDATE PROFILE\n"
-                f"{json.dumps(mini_profile, indent=2)}\n\n"
-
-                "# JOB SOURCES (JobSearchOutput JSON)\n"
-                f"JSEARCH: {json.dumps(jsearch_output.model_dump())}\n\n"
-                f"ADZUNA: {json.dumps(adzuna_output.model_dump())}\n\n"
-                f"DDG: {json.dumps(ddg_output.model_dump())}\n\n"
-
-                "# MATCHING RULES\n"
-                "- For each job, fill matched_criteria (list) and a short reason based only on real evidence.\n"
-                "- Use matched_criteria items from: 'role', 'skills', 'experience', 'location', 'salary'.\n\n"
-
-                "role:\n"
-                "- Add 'role' if the job title contains preferred_role keywords and seniority fits candidate experience.\n\n"
-
-                "skills:\n"
-                "- Add 'skills' if at least 2 skills from key_skills appear in required or implied skills.\n\n"
-
-                "experience:\n"
-                "- Add 'experience' if candidate experience >= job requirement or within 1 year.\n"
-                "- If experience_required is null, infer: Senior=5+ yrs, Manager=3+ yrs, Junior=0 to 2 yrs, default=1 to 3 yrs.\n\n"
-
-                "location:\n"
-                "- Add 'location' if same city, region or country, or remote_type matches remote_preference.\n\n"
-
-                "salary:\n"
-                "- Add 'salary' only if salary meets or exceeds salary_expectation (if provided).\n\n"
-
-                "# DEDUPLICATION RULES\n"
-                "You must remove duplicates before ranking.\n"
-                "- First build a combined list of all jobs from JSEARCH, ADZUNA and DDG.\n"
-                "- For each job, create a deduplication key:\n"
-                "  - If job_url is present and not empty, key = normalized job_url (ignore http vs https, ignore trailing slashes).\n"
-                "  - Otherwise key = lowercased '<title> | <company> | <location_area or unknown>'.\n"
-                "- Jobs that share the same deduplication key are considered duplicates.\n"
-                "- For duplicates, keep only ONE job in the final result:\n"
-                "  - Prefer the job that has a non empty job_url.\n"
-                "  - If both have job_url, prefer the one with more non null fields (salary, skills, experience_required).\n"
-                "  - If still equal, prefer source priority: jsearch > adzuna > ddg.\n"
-                "- Do not allow the same deduplication key to appear more than once in best_matches.\n\n"
-
-                "# AGGREGATION STEPS\n"
-                "1) Merge jobs from all sources, apply the deduplication rules above\n"
-                "2) Rank jobs: first by number of matched_criteria, then prefer jobs that include 'skills' in matched_criteria.\n"
-                "3) For each unique job, set matched_criteria and a one line reason like "
-                "\"Role strong; Skills 2/3; Experience 1 year short; Location ok\".\n"
-                "4) Select the top 8 to 12 jobs for best_matches from the ranked unique list.\n"
-                "5) Write search_summary as 2 to 3 factual sentences about how many strong, medium and weak or aspirational matches you found.\n\n"
-
-                "Return a single JobAggregation JSON object only. "
-                "Do not call tools. Do not invent missing values. Do not output prose outside JSON."
-            )
-
-
+        # Merge, dedupe and rank in code; the LLM (optional) only writes the summary.
+        aggregation, ranked = aggregate_ranked_jobs(
+            profile,
+            {"jsearch": jsearch_output, "adzuna": adzuna_output, "ddg": ddg_output},
+            max_best_matches=MAX_BEST_MATCHES,
+        )
 
-            with trace("Senior_Researcher_Reviewing_Research"):
-                senior_run = await Runner.run(
-                    senior_agent,
-                    senior_task,
-                    max_turns=12,
-                )
+        if on_event:
+            on_event(
+                "research.aggregated",
+                best_matches=len(aggregation.best_matches),
+                source_breakdown=dict(aggregation.source_breakdown),
+            )
 
-        senior_output = getattr(senior_run, "final_output", None)
-        if not isinstance(senior_output, JobAggregation):
-            raise CustomException(
-                f"Senior agent returned unexpected output type: {type(senior_output)}",
-                error_detail=sys,
+        if SENIOR_LLM_SUMMARY and aggregation.best_matches:
+            aggregation.search_summary = await write_senior_summary(
+                model, mini_profile, aggregation, ranked
             )
 
         return {
             "profile": profile,
-            "jobs": senior_output.best_matches,
-            "aggregation": senior_output,
+            "jobs": aggregation.best_matches,
+            "aggregation": aggregation,
             "jsearch_jobs": jsearch_output.jobs,
             "adzuna_jobs": adzuna_output.jobs,
             "ddg_jobs": ddg_output.jobs,
@@ -24,8 +24,14 @@ if "jobs_data" not in st.session_state:
     st.session_state.jobs_data = None
 if "selected_jobs" not in st.session_state:
     st.session_state.selected_jobs = []
+if "run_id" not in st.session_state:
+    st.session_state.run_id = None
 
 # === HELPERS ===
+def run_params() -> dict:
+    """Query params that scope every backend call to this browser session's run."""
+    return {"run_id": st.session_state.run_id}
+
 def current_step_index(view: str) -> int:
     mapping = {
         "upload": 0,
@@ -83,7 +89,7 @@ def render_sidebar():
 
 def check_status():
     try:
-        r = requests.get(f"{API_URL}/status", timeout=120)
+        r = requests.get(f"{API_URL}/status", params=run_params(), timeout=120)
         r.raise_for_status()
         return r.json()
     except requests.exceptions.ConnectionError:
@@ -95,9 +101,11 @@ def check_status():
 
 def reset_pipeline():
     try:
-        requests.post(f"{API_URL}/reset", timeout=120)
+        if st.session_state.run_id:
+            requests.post(f"{API_URL}/reset", params=run_params(), timeout=120)
     except Exception:
         pass
+    st.session_state.run_id = None
     st.session_state.view = "upload"
     st.session_state.last_status = {}
     st.session_state.jobs_data = None
@@ -110,6 +118,7 @@ def _upload_and_queue(uploaded_file, preferences):
         data = {"preferences": json.dumps(preferences)}
         r = requests.post(f"{API_URL}/intake", files=files, data=data, timeout=120)
         if r.status_code in (200, 201):
+            st.session_state.run_id = r.json().get("run_id")
             return True, "Intake queued."
         return False, f"{r.status_code}: {r.text}"
     except Exception as e:
@@ -153,7 +162,7 @@ def _poll_until(target_step=None):
             else:
                 html_placeholder.info("✅ A step finished, moving to the next stage...")
                 progress_placeholder.empty()
-        elif state == "error":
+        elif state in ("error", "cancelled"):
             html_placeholder.empty()
             progress_placeholder.empty()
             st.error(f"❌ {error}")
@@ -167,6 +176,117 @@ def _poll_until(target_step=None):
     return check_status()
 
 
+def _describe_event(event):
+    """Short progress line for a phase event from /events (None for events not worth showing)."""
+    kind = event.get("type")
+    data = event.get("data") or {}
+    if kind == "intake.resume_parsed":
+        return "📄 Resume parsed"
+    if kind == "intake.preferences_saved":
+        return "📝 Preferences saved"
+    if kind == "research.profile_loaded":
+        return f"🎯 Searching for {data.get('preferred_role') or 'your target role'}"
+    if kind == "research.source_done":
+        return f"✅ {str(data.get('source', '')).upper()} returned {data.get('jobs', 0)} jobs"
+    if kind == "research.aggregated":
+        return f"🧮 Ranked {data.get('best_matches', 0)} best matches"
+    if kind == "present.scored":
+        return f"📊 Scored {data.get('jobs', 0)} jobs"
+    if kind == "present.report_ready":
+        return "🗒️ Report ready"
+    if kind == "advisor.job_done":
+        mark = "✅" if data.get("ok") else "⚠️"
+        return f"{mark} Roadmap {data.get('index')}/{data.get('total')}: {data.get('job_title')}"
+    return None
+
+
+def _iter_sse(response):
+    """Parse a text/event-stream response into event dicts; keep-alive comments yield None."""
+    data_lines = []
+    for line in response.iter_lines(decode_unicode=True):
+        if line is None:
+            continue
+        if line == "":
+            if data_lines:
+                yield json.loads("\n".join(data_lines))
+                data_lines = []
+            continue
+        if line.startswith(":"):
+            yield None
+        elif line.startswith("data:"):
+            data_lines.append(line[5:].lstrip())
+
+
+def _follow_events(target_step=None):
+    """
+    Same contract as _poll_until, driven by GET /events instead of polling /status.
+    Falls back to _poll_until if the stream cannot be opened or drops.
+    """
+    start = time.time()
+    html_placeholder = st.empty()
+    progress_placeholder = st.empty()
+    detail_placeholder = st.empty()
+    STREAM_TIMEOUT = 300
+    progress_lines = []
+
+    def _finish():
+        html_placeholder.empty()
+        progress_placeholder.empty()
+
+    try:
+        with requests.get(
+            f"{API_URL}/events",
+            params=run_params(),
+            stream=True,
+            timeout=(10, 60),
+            headers={"Accept": "text/event-stream"},
+        ) as r:
+            r.raise_for_status()
+            for event in _iter_sse(r):
+                elapsed = time.time() - start
+                if elapsed > STREAM_TIMEOUT:
+                    break
+                if event is None:
+                    continue
+
+                line = _describe_event(event)
+                if line:
+                    progress_lines.append(line)
+                    detail_placeholder.caption("  \n".join(progress_lines[-6:]))
+                    continue
+                if event.get("type") not in ("snapshot", "status"):
+                    continue
+
+                status = event.get("data") or {}
+                state = status.get("state")
+                step = status.get("step")
+
+                if state in ("running", "queued"):
+                    spinner.render_spinning_status(
+                        html_placeholder, progress_placeholder, step, min(1.0, elapsed / STREAM_TIMEOUT)
+                    )
+                elif state == "done":
+                    if (target_step is None) or (step in (None, target_step)):
+                        _finish()
+                        st.success("✅ Step complete!")
+                        return status
+                    html_placeholder.info("✅ A step finished, moving to the next stage...")
+                    progress_placeholder.empty()
+                elif state in ("error", "cancelled"):
+                    _finish()
+                    st.error(f"❌ {status.get('error')}")
+                    return status
+    except Exception:
+        # Older backend, proxy without streaming support or a dropped connection: poll instead.
+        _finish()
+        detail_placeholder.empty()
+        return _poll_until(target_step=target_step)
+
+    _finish()
+    st.warning("⚠️ This is taking longer than expected. The rocket may have hit some turbulence. Please refresh!")
+    return check_status()
+
+
 
 # === RENDER SIDEBAR AND HERO ===
 render_sidebar()
@@ -267,7 +387,7 @@ elif st.session_state.view == "intake_processing":
     auto = st.checkbox("Auto refresh status", value=True, key="auto_intake")
 
     if auto:
-        final_status = _poll_until(target_step="intake")
+        final_status = _follow_events(target_step="intake")
     else:
         if st.button("🔄 Refresh Status"):
             pass
@@ -277,7 +397,7 @@ elif st.session_state.view == "intake_processing":
         st.success("✅ Intake complete. Your profile has been processed.")
         if st.button("🔍 Start Job Research", type="primary"):
             try:
-                r = requests.post(f"{API_URL}/start_research", timeout=120)
+                r = requests.post(f"{API_URL}/start_research", params=run_params(), timeout=120)
                 if r.status_code in (200, 201):
                     st.session_state.view = "research_processing"
                     st.rerun()
@@ -303,7 +423,7 @@ elif st.session_state.view == "research_processing":
     auto = st.checkbox("Auto refresh status", value=True, key="auto_research")
 
     if auto:
-        final_status = _poll_until(target_step="present")
+        final_status = _follow_events(target_step="present")
     else:
         if st.button("🔄 Refresh Status"):
             pass
@@ -332,7 +452,7 @@ elif st.session_state.view == "results":
         st.write("Your job research report is ready. Download it or preview it below.")
     with col2:
         try:
-            download_response = requests.get(f"{API_URL}/download", timeout=120)
+            download_response = requests.get(f"{API_URL}/download", params=run_params(), timeout=120)
             if download_response.status_code == 200:
                 get_pdf_download(download_response.text, "rolerocket_job_matches.pdf", "RoleRocket Job Matches")
         except Exception as e:
@@ -342,7 +462,7 @@ elif st.session_state.view == "results":
     st.markdown("### 📄 Report preview")
 
     try:
-        download_response = requests.get(f"{API_URL}/download", timeout=120)
+        download_response = requests.get(f"{API_URL}/download", params=run_params(), timeout=120)
         if download_response.status_code == 200:
             st.markdown(download_response.text)
         else:
@@ -376,7 +496,7 @@ elif st.session_state.view == "job_selection":
     if st.session_state.jobs_data is None:
         with st.spinner("Loading job data..."):
             try:
-                response = requests.get(f"{API_URL}/aggregation", timeout=120)
+                response = requests.get(f"{API_URL}/aggregation", params=run_params(), timeout=120)
                 if response.status_code == 200:
                     st.session_state.jobs_data = response.json()
                 else:
@@ -433,6 +553,7 @@ elif st.session_state.view == "job_selection":
                 try:
                     response = requests.post(
                         f"{API_URL}/save_selection",
+                        params=run_params(),
                         json=selection_output,
                         timeout=120,
                     )
@@ -444,6 +565,7 @@ elif st.session_state.view == "job_selection":
                         with st.spinner("Launching the advisor... 🚀"):
                             improve_response = requests.post(
                                 f"{API_URL}/start_improvement",
+                                params=run_params(),
                                 timeout=120,
                             )
 
@@ -479,7 +601,7 @@ elif st.session_state.view == "improvement_processing":
     auto = st.checkbox("Auto refresh status", value=True, key="auto_improvement")
 
     if auto:
-        final_status = _poll_until(target_step="improvement")
+        final_status = _follow_events(target_step="improvement")
     else:
         if st.button("🔄 Refresh Status"):
             pass
@@ -509,7 +631,7 @@ elif st.session_state.view == "improvement_results":
         st.write("Your personalized profile improvement guide is ready. Download it or preview it below.")
     with col2:
         try:
-            download_response = requests.get(f"{API_URL}/download_improvement", timeout=120)
+            download_response = requests.get(f"{API_URL}/download_improvement", params=run_params(), timeout=120)
             if download_response.status_code == 200:
                 get_pdf_download(download_response.text, "rolerocket_career_roadmap.pdf", "RoleRocket Career Roadmap")
         except Exception as e:
@@ -519,7 +641,7 @@ elif st.session_state.view == "improvement_results":
     st.markdown("### 📖 Roadmap preview")
 
     try:
-        download_response = requests.get(f"{API_URL}/download_improvement", timeout=120)
+        download_response = requests.get(f"{API_URL}/download_improvement", params=run_params(), timeout=120)
         if download_response.status_code == 200:
             st.markdown(download_response.text)
         else:
@@ -0,0 +1,182 @@
+# full_pipeline_files/artifact_store.py
+
+"""
+Run-scoped artifact store: phase results stay in memory, disk is only for durability.
+
+Phases hand each other the aggregation, the scored payload and the job
+selection through the run's RunArtifactStore instead of re-parsing the JSON
+files, and /aggregation is served from memory. put() keeps the value and,
+when given a path, writes compact JSON in a shared writer thread; a newer
+put() of the same artifact supersedes a write that has not started yet.
+
+get()/aget() fall back to the file when the artifact is not in memory (a run
+created before this process, or an evicted value) and cache what they read.
+flush()/aflush() wait for pending writes; phases call them before finishing
+so the files the pipeline plan checks (pipeline_dag.py) exist.
+
+Values are shared, not copied: treat what get() returns as read-only.
+"""
+
+import asyncio
+import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from utils.logger import logging
+from utils.read_yaml import read_yaml
+
+logger = logging.getLogger(__name__)
+
+config = read_yaml(Path("config/master_config.yaml"))
+_artifacts_config = config.get("artifacts", {})
+# False: artifacts live in memory only (files are never written).
+PERSIST_ARTIFACTS = bool(_artifacts_config.get("persist", True))
+
+# Artifact names, in pipeline order.
+ARTIFACT_AGGREGATION = "aggregation"
+ARTIFACT_SCORES = "scores"
+ARTIFACT_PRESENTER_MD = "presenter_md"
+ARTIFACT_SELECTION = "selection"
+ARTIFACT_IMPROVEMENT = "improvement_output"
+
+_writer = ThreadPoolExecutor(
+    max_workers=int(_artifacts_config.get("writer_threads", 1)),
+    thread_name_prefix="artifact-writer",
+)
+
+
+def _to_jsonable(value: Any) -> Any:
+    return value.model_dump() if hasattr(value, "model_dump") else value
+
+
+def write_json_compact(path: Path, value: Any) -> None:
+    """Atomic compact JSON write (tmp file + replace)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(value, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def read_json(path: Path) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class RunArtifactStore:
+    """
+    In-memory artifacts of one run, with write-behind persistence.
+    """
+
+    def __init__(self, run_id: str, persist: bool = PERSIST_ARTIFACTS):
+        self.run_id = run_id
+        self.persist = persist
+        self._values: Dict[str, Any] = {}
+        self._versions: Dict[str, int] = {}
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        # Serializes this run's writes so two writer threads never race on one file.
+        self._write_lock = threading.Lock()
+        self.closed = False
+        self.writes = 0
+        self.superseded = 0
+
+    # ----------------------
+    # Read / write
+    # ----------------------
+    def put(self, name: str, value: Any, path: Optional[Path] = None) -> Any:
+        """Keep value (pydantic models are dumped to dicts) and, with a path, persist it in the background."""
+        value = _to_jsonable(value)
+        with self._lock:
+            self._values[name] = value
+            version = self._versions.get(name, 0) + 1
+            self._versions[name] = version
+            if path is not None and self.persist and not self.closed:
+                self._pending[name] = _writer.submit(self._write, name, version, Path(path))
+        return value
+
+    def _write(self, name: str, version: int, path: Path) -> None:
+        with self._write_lock:
+            with self._lock:
+                if self.closed:
+                    return
+                if self._versions.get(name) != version:
+                    # A newer put() queued its own write.
+                    self.superseded += 1
+                    return
+                value = self._values.get(name)
+            try:
+                write_json_compact(path, value)
+                self.writes += 1
+            except Exception as e:
+                logger.warning("Could not persist artifact %s of run %s to %s: %s", name, self.run_id, path, e)
+
+    def get(self, name: str, path: Optional[Path] = None) -> Optional[Any]:
+        """The artifact from memory, else from path (cached), else None."""
+        with self._lock:
+            if name in self._values:
+                return self._values[name]
+        if path is None or not Path(path).exists():
+            return None
+        value = read_json(Path(path))
+        with self._lock:
+            # A put() that landed while we were reading wins.
+            return self._values.setdefault(name, value)
+
+    async def aget(self, name: str, path: Optional[Path] = None) -> Optional[Any]:
+        with self._lock:
+            if name in self._values:
+                return self._values[name]
+        return await asyncio.to_thread(self.get, name, path)
+
+    def has(self, name: str, path: Optional[Path] = None) -> bool:
+        with self._lock:
+            if name in self._values:
+                return True
+        return path is not None and Path(path).exists()
+
+    def discard(self, name: str) -> None:
+        with self._lock:
+            self._values.pop(name, None)
+            self._versions[name] = self._versions.get(name, 0) + 1
+
+    # ----------------------
+    # Durability
+    # ----------------------
+    def flush(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        if pending:
+            wait(pending, timeout=timeout)
+
+    async def aflush(self) -> None:
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for future in pending:
+            await asyncio.wrap_future(future)
+
+    def close(self) -> None:
+        """Drop values and skip writes not yet started (the run's directories are going away)."""
+        with self._lock:
+            self.closed = True
+            self._values.clear()
+            self._pending.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "artifacts": sorted(self._values),
+                "pending_writes": sum(1 for f in self._pending.values() if not f.done()),
+                "writes": self.writes,
+                "superseded": self.superseded,
+            }
+
+
+def shutdown_artifact_writer() -> None:
+    """Finish queued writes at process shutdown."""
+    _writer.shutdown(wait=True)
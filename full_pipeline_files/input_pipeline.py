@@ -5,12 +5,13 @@ import json
 import os
 import sys
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from utils.logger import logging
 from utils.exception import CustomException
 from utils.read_yaml import read_yaml
 
+from full_pipeline_files.run_events import ProgressCallback
 from memory_saving.user_intake_pipeline import (
     process_resume_and_save,
     save_user_preferences,
@@ -28,11 +29,13 @@ async def run_intake_pipeline(
     intake_answers: Dict[str, Any],
     model: str = "gpt-4.1-mini",
     memory_db_path: str = MEMORY_DB_PATH,
+    on_event: Optional[ProgressCallback] = None,
 ) -> str:
     """
     Intake pipeline:
       1) Parse resume and save parsed profile to memory
       2) Save user preferences (intake_answers) to memory
+    on_event (optional) receives "intake.resume_parsed" and "intake.preferences_saved".
     Returns the memory DB path used.
     """
     resume_path = Path(resume_path)
@@ -42,8 +45,14 @@ async def run_intake_pipeline(
 
     try:
         logger.info("<<<< [1/2] USER_INTAKE_RESUME_START >>>>")
-        await process_resume_and_save(path=resume_path, model=model)
+        await process_resume_and_save(
+            path=resume_path,
+            model=model,
+            memory_db_path=memory_db_path,
+        )
         logger.info("<<<< [1/2] USER_INTAKE_RESUME_END >>>>")
+        if on_event:
+            on_event("intake.resume_parsed")
     except Exception as e:
         logger.error("USER_INTAKE_RESUME_FAILED: %s", CustomException(e, sys))
         logger.info("<<<< INTAKE_PIPELINE_ABORTED >>>>")
@@ -51,8 +60,13 @@ async def run_intake_pipeline(
 
     try:
         logger.info("<<<< [2/2] USER_INTAKE_PREFERENCES_START >>>>")
-        await save_user_preferences(intake_answers=intake_answers)
+        await save_user_preferences(
+            intake_answers=intake_answers,
+            memory_db_path=memory_db_path,
+        )
         logger.info("<<<< [2/2] USER_INTAKE_PREFERENCES_END >>>>")
+        if on_event:
+            on_event("intake.preferences_saved")
     except Exception as e:
         logger.error("USER_INTAKE_PREFERENCES_FAILED: %s", CustomException(e, sys))
         logger.info("<<<< INTAKE_PIPELINE_ABORTED >>>>")
@@ -0,0 +1,211 @@
+# full_pipeline_files/job_scheduler.py
+
+"""
+Bounded async job scheduler for API pipeline phases.
+
+Each phase (intake, research, present, improvement) gets its own priority
+queue and its own pool of worker tasks, so LLM-heavy phases can be capped
+tightly while cheap phases run wide. Jobs are ordered by (priority, submit
+order), queues are bounded for back-pressure, and every job is tagged with a
+run_id so a whole run can be cancelled at once.
+"""
+
+import asyncio
+import itertools
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from utils.logger import logging
+
+logger = logging.getLogger(__name__)
+
+# Lower value runs first. Continuations of a run that is already in flight
+# (e.g. present after research) jump ahead of brand new requests.
+PRIORITY_CONTINUATION = 0
+PRIORITY_NORMAL = 10
+
+DEFAULT_PHASE_LIMITS = {
+    "intake": 4,
+    "research": 2,
+    "present": 4,
+    "improvement": 2,
+}
+
+
+class SchedulerQueueFull(RuntimeError):
+    """Raised when a phase queue is at capacity (caller should answer 429)."""
+
+
+class ScheduledJob:
+    def __init__(
+        self,
+        run_id: str,
+        phase: str,
+        factory: Callable[[], Awaitable[Any]],
+        priority: int,
+    ):
+        self.job_id = uuid.uuid4().hex[:12]
+        self.run_id = run_id
+        self.phase = phase
+        self.factory = factory
+        self.priority = priority
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.cancelled = False
+        self.task: Optional[asyncio.Task] = None
+
+
+class JobScheduler:
+    """
+    Per-phase priority queues drained by a fixed number of workers each.
+
+    Call start() inside the FastAPI lifespan and stop() on shutdown.
+    """
+
+    def __init__(
+        self,
+        phase_limits: Optional[Dict[str, int]] = None,
+        max_queue_size: int = 100,
+    ):
+        self.phase_limits = {**DEFAULT_PHASE_LIMITS, **(phase_limits or {})}
+        self.max_queue_size = max_queue_size
+        self._queues: Dict[str, asyncio.PriorityQueue] = {}
+        self._workers: List[asyncio.Task] = []
+        self._queued: Dict[str, Dict[str, ScheduledJob]] = {p: {} for p in self.phase_limits}
+        self._running: Dict[str, Dict[str, ScheduledJob]] = {p: {} for p in self.phase_limits}
+        self._seq = itertools.count()
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+
+    # ----------------------
+    # Lifecycle
+    # ----------------------
+    async def start(self) -> None:
+        if self._workers:
+            return
+        for phase, limit in self.phase_limits.items():
+            self._queues[phase] = asyncio.PriorityQueue()
+            for i in range(max(1, int(limit))):
+                self._workers.append(
+                    asyncio.create_task(self._worker(phase), name=f"scheduler-{phase}-{i}")
+                )
+        logger.info("Job scheduler started with limits %s", self.phase_limits)
+
+    async def stop(self) -> None:
+        for phase_jobs in self._running.values():
+            for job in phase_jobs.values():
+                if job.task is not None:
+                    job.task.cancel()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+        logger.info("Job scheduler stopped")
+
+    # ----------------------
+    # Public API
+    # ----------------------
+    def submit(
+        self,
+        run_id: str,
+        phase: str,
+        factory: Callable[[], Awaitable[Any]],
+        priority: int = PRIORITY_NORMAL,
+    ) -> str:
+        """Queue factory() under phase. Returns the job_id."""
+        if phase not in self._queues:
+            raise ValueError(f"Unknown or unstarted scheduler phase '{phase}'")
+
+        if len(self._queued[phase]) >= self.max_queue_size:
+            raise SchedulerQueueFull(
+                f"The {phase} queue is full ({self.max_queue_size} waiting). Please try again shortly."
+            )
+
+        job = ScheduledJob(run_id=run_id, phase=phase, factory=factory, priority=priority)
+        self._queued[phase][job.job_id] = job
+        self._queues[phase].put_nowait((priority, next(self._seq), job))
+        logger.info(
+            "Queued %s job %s for run %s (priority=%s, depth=%d)",
+            phase, job.job_id, run_id, priority, len(self._queued[phase]),
+        )
+        return job.job_id
+
+    def cancel(self, run_id: str) -> int:
+        """Cancel every queued or running job of run_id. Returns how many were hit."""
+        hit = 0
+        for phase in self.phase_limits:
+            for job in list(self._queued[phase].values()):
+                if job.run_id == run_id:
+                    job.cancelled = True
+                    self._queued[phase].pop(job.job_id, None)
+                    self._cancelled += 1
+                    hit += 1
+            for job in list(self._running[phase].values()):
+                if job.run_id == run_id and job.task is not None and not job.task.done():
+                    job.cancelled = True
+                    job.task.cancel()
+                    hit += 1
+        if hit:
+            logger.info("Cancelled %d scheduled jobs for run %s", hit, run_id)
+        return hit
+
+    def has_jobs(self, run_id: str) -> bool:
+        return any(
+            job.run_id == run_id
+            for phase in self.phase_limits
+            for job in (*self._queued[phase].values(), *self._running[phase].values())
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "phases": {
+                phase: {
+                    "limit": self.phase_limits[phase],
+                    "queued": len(self._queued[phase]),
+                    "running": len(self._running[phase]),
+                }
+                for phase in self.phase_limits
+            },
+            "max_queue_size": self.max_queue_size,
+            "completed": self._completed,
+            "failed": self._failed,
+            "cancelled": self._cancelled,
+        }
+
+    # ----------------------
+    # Workers
+    # ----------------------
+    async def _worker(self, phase: str) -> None:
+        queue = self._queues[phase]
+        while True:
+            _, _, job = await queue.get()
+            try:
+                if job.cancelled:
+                    continue
+
+                self._queued[phase].pop(job.job_id, None)
+                self._running[phase][job.job_id] = job
+                job.started_at = time.time()
+                logger.info(
+                    "Starting %s job %s for run %s (waited %.2fs)",
+                    phase, job.job_id, job.run_id, job.started_at - job.submitted_at,
+                )
+
+                job.task = asyncio.create_task(job.factory())
+                try:
+                    await job.task
+                    self._completed += 1
+                except asyncio.CancelledError:
+                    if asyncio.current_task().cancelling():
+                        # The worker itself is being stopped.
+                        raise
+                    self._cancelled += 1
+                    logger.info("%s job %s for run %s was cancelled", phase, job.job_id, job.run_id)
+                except Exception as e:
+                    self._failed += 1
+                    logger.error("%s job %s for run %s failed: %s", phase, job.job_id, job.run_id, e)
+            finally:
+                self._running[phase].pop(job.job_id, None)
+                queue.task_done()
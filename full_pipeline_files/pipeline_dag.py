@@ -0,0 +1,424 @@
+# full_pipeline_files/pipeline_dag.py
+
+"""
+Incremental execution of a run's research -> rank -> score -> present chain.
+
+Each stage declares its dependencies, the files it writes and a
+fingerprint of its inputs (profile fields, config, prompt/model, and the
+run token of every dependency). The run's manifest
+(outputs/<run_id>/pipeline_manifest.json) records the fingerprint and a
+fresh token each time a stage completes, so a stage is skipped when:
+
+- its outputs exist,
+- its fingerprint matches the manifest,
+- and no dependency is re-running.
+
+Because a dependency's token changes whenever it re-runs, downstream stages
+follow even when the upstream output is not deterministic (live job search).
+
+Stages:
+- research: paid job search; inputs are the profile fields each junior
+  receives (research_pipeline.junior_task_profiles), model and
+  research/aggregation config;
+- rank: re-rank the saved aggregation for the full profile (cheap, no LLM);
+- score: compatibility scores; inputs are WEIGHTS, SCORING_VERSION and the
+  role/skill matching config;
+- present: presenter markdown; inputs are the profile and presenter prompt.
+
+So iterating on presenter prompts or scoring weights never re-runs research.
+Stages pass the aggregation and scores through the run's RunArtifactStore
+(artifact_store.py); files are written behind and flushed when a phase ends.
+plan() returns the same decisions without running anything (GET /plan).
+"""
+
+import asyncio
+import hashlib
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence
+
+from utils.logger import logging
+from utils.exception import CustomException
+from utils.read_yaml import read_yaml
+from utils.sqlite_cache import make_cache_key
+from utils.mcp_server_pool import MCPServerPool
+
+from career_research.fetch_user_profile import fetch_user_profile_async
+from career_research.research_pipeline import (
+    DEFAULT_COUNTRY,
+    JUNIOR_MODE,
+    MAX_BEST_MATCHES,
+    SENIOR_LLM_SUMMARY,
+    minimize_profile,
+    junior_task_profiles,
+)
+from full_pipeline_files.research_pipeline import refresh_aggregation_profile, run_research_pipeline
+from full_pipeline_files.run_registry import PipelineRun
+from full_pipeline_files.artifact_store import ARTIFACT_AGGREGATION, ARTIFACT_PRESENTER_MD, ARTIFACT_SCORES
+from full_pipeline_files.presenter_pipeline import PERSIST_SCORES
+from present_to_user.job_compatibility_scoring import SCORING_VERSION, WEIGHTS, score_aggregation
+from present_to_user.job_presenter_agent import (
+    PRESENTER_INSTRUCTIONS,
+    PRESENTER_TASK_TEMPLATE,
+    presenter_agent,
+)
+from present_to_user.present_jobs_pipeline import run_presenter_pipeline
+
+logger = logging.getLogger(__name__)
+
+config = read_yaml(Path("config/master_config.yaml"))
+_pipeline_config = config.get("pipeline", {})
+# False: every stage always re-runs (the behaviour before incremental execution).
+INCREMENTAL = bool(_pipeline_config.get("incremental", True))
+MANIFEST_NAME = str(_pipeline_config.get("manifest_name", "pipeline_manifest.json"))
+
+ACTION_RUN = "run"
+ACTION_SKIP = "skip"
+
+
+class StageContext:
+    """
+    What stages need from a run: its paths, the model, the MCP pool and the
+    user profile (read from memory once per plan/execute).
+    """
+
+    def __init__(
+        self,
+        run: PipelineRun,
+        model: str,
+        mcp_pool: Optional[MCPServerPool] = None,
+    ):
+        self.run = run
+        self.model = model
+        self.mcp_pool = mcp_pool
+        self._profile: Optional[Dict[str, Any]] = None
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.run.output_dir / MANIFEST_NAME
+
+    @property
+    def aggregation_path(self) -> Path:
+        return Path(self.run.status.get("aggregation_path") or self.run.aggregation_path)
+
+    async def profile(self) -> Dict[str, Any]:
+        if self._profile is None:
+            self._profile = await fetch_user_profile_async(str(self.run.db_path))
+        return self._profile
+
+    def publish(self, event_type: str, **data: Any) -> None:
+        self.run.publish(event_type, **data)
+
+
+class PipelineStage:
+    """
+    One node of the DAG: inputs() returns the dict that is fingerprinted,
+    outputs() the {artifact: file} it produces, run() does the work.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        phase: str,
+        deps: Sequence[str],
+        inputs: Callable[[StageContext], Awaitable[Dict[str, Any]]],
+        outputs: Callable[[StageContext], Dict[str, Path]],
+        run: Callable[[StageContext], Awaitable[Any]],
+    ):
+        self.name = name
+        self.phase = phase
+        self.deps = list(deps)
+        self.inputs = inputs
+        self.outputs = outputs
+        self.run = run
+
+
+# ----------------------
+# Manifest
+# ----------------------
+def load_manifest(path: Path) -> Dict[str, Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        return manifest if isinstance(manifest, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning("Ignoring unreadable pipeline manifest %s: %s", path, e)
+        return {}
+
+
+def save_manifest(path: Path, manifest: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    tmp.replace(path)
+
+
+def _file_digest(path: str | Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+# ----------------------
+# Executor
+# ----------------------
+class PipelineDAG:
+    """
+    Stages in dependency order; plan() decides run/skip per stage and
+    execute() runs the selected stages, recording them in the manifest.
+    """
+
+    def __init__(self, stages: Iterable[PipelineStage]):
+        self.stages: Dict[str, PipelineStage] = {}
+        for stage in stages:
+            missing = [d for d in stage.deps if d not in self.stages]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' depends on undeclared or later stages: {missing}")
+            self.stages[stage.name] = stage
+
+    def stage_names(self, phase: Optional[str] = None) -> List[str]:
+        return [s.name for s in self.stages.values() if phase is None or s.phase == phase]
+
+    async def _fingerprint(self, stage: PipelineStage, ctx: StageContext, manifest: Dict[str, Any]) -> str:
+        inputs = await stage.inputs(ctx)
+        dep_tokens = {d: (manifest.get(d) or {}).get("token") for d in stage.deps}
+        return make_cache_key(stage.name, inputs=inputs, deps=dep_tokens)
+
+    async def plan(
+        self,
+        ctx: StageContext,
+        force: Iterable[str] = (),
+    ) -> List[Dict[str, Any]]:
+        """
+        [{"stage", "phase", "action": "run" | "skip", "reason", "fingerprint"}] in
+        dependency order. A stage in force always runs; so does everything downstream.
+        """
+        manifest = load_manifest(ctx.manifest_path)
+        force = set(force)
+        rerun: set = set()
+        steps: List[Dict[str, Any]] = []
+
+        for stage in self.stages.values():
+            recorded = manifest.get(stage.name) or {}
+            fingerprint = await self._fingerprint(stage, ctx, manifest)
+            missing = [
+                name for name, path in stage.outputs(ctx).items()
+                if not ctx.run.artifacts.has(name, path)
+            ]
+            upstream = [d for d in stage.deps if d in rerun]
+
+            if stage.name in force:
+                reason = "forced"
+            elif not INCREMENTAL:
+                reason = "incremental execution disabled"
+            elif upstream:
+                reason = f"upstream re-runs: {', '.join(upstream)}"
+            elif missing:
+                reason = "output missing"
+            elif not recorded:
+                reason = "never ran"
+            elif recorded.get("fingerprint") != fingerprint:
+                reason = "inputs changed"
+            else:
+                reason = None
+
+            if reason:
+                rerun.add(stage.name)
+            steps.append({
+                "stage": stage.name,
+                "phase": stage.phase,
+                "action": ACTION_RUN if reason else ACTION_SKIP,
+                "reason": reason or "up to date",
+                "fingerprint": fingerprint,
+                "last_run_at": recorded.get("finished_at"),
+            })
+        return steps
+
+    async def execute(
+        self,
+        ctx: StageContext,
+        stages: Optional[Iterable[str]] = None,
+        force: Iterable[str] = (),
+    ) -> List[Dict[str, Any]]:
+        """
+        Run the stages in stages (default: all) that plan() marks "run", in
+        dependency order. Stages outside the selection are only planned, so a
+        phase can run its part of the DAG on its own. Returns the plan with
+        each step's outcome.
+        """
+        selected = set(stages) if stages is not None else set(self.stages)
+        steps = await self.plan(ctx, force=force)
+        try:
+            await self._execute_steps(ctx, steps, selected)
+        finally:
+            # Background artifact writes finish before the phase ends.
+            await ctx.run.artifacts.aflush()
+        return steps
+
+    async def _execute_steps(self, ctx: StageContext, steps: List[Dict[str, Any]], selected: set) -> None:
+        for step in steps:
+            if step["stage"] not in selected:
+                continue
+            stage = self.stages[step["stage"]]
+
+            if step["action"] == ACTION_SKIP:
+                logger.info("[%s] Stage %s skipped (up to date)", ctx.run.run_id, stage.name)
+                ctx.publish("pipeline.stage_skipped", stage=stage.name)
+                step["outcome"] = "skipped"
+                continue
+
+            logger.info("[%s] Stage %s running (%s)", ctx.run.run_id, stage.name, step["reason"])
+            ctx.publish("pipeline.stage_started", stage=stage.name, reason=step["reason"])
+            started = time.perf_counter()
+            try:
+                await stage.run(ctx)
+            except Exception as e:
+                logger.error("Stage %s failed: %s", stage.name, CustomException(e, sys))
+                raise
+
+            # Re-read and fingerprint against the tokens just written by upstream stages.
+            manifest = load_manifest(ctx.manifest_path)
+            manifest[stage.name] = {
+                "fingerprint": await self._fingerprint(stage, ctx, manifest),
+                "token": uuid.uuid4().hex,
+                "finished_at": round(time.time(), 3),
+                "duration_seconds": round(time.perf_counter() - started, 3),
+            }
+            await asyncio.to_thread(save_manifest, ctx.manifest_path, manifest)
+            ctx.publish("pipeline.stage_done", stage=stage.name, seconds=manifest[stage.name]["duration_seconds"])
+            step["outcome"] = "ran"
+
+
+# ----------------------
+# Job pipeline stages
+# ----------------------
+async def _research_inputs(ctx: StageContext) -> Dict[str, Any]:
+    return {
+        # Exactly what the juniors receive: a salary edit must not re-run the search.
+        "task_profiles": junior_task_profiles(minimize_profile(await ctx.profile()), JUNIOR_MODE),
+        "model": ctx.model,
+        "junior_mode": JUNIOR_MODE,
+        "default_country": DEFAULT_COUNTRY,
+        "max_best_matches": MAX_BEST_MATCHES,
+        "senior_llm_summary": SENIOR_LLM_SUMMARY,
+    }
+
+
+async def _run_research(ctx: StageContext) -> None:
+    await run_research_pipeline(
+        model=ctx.model,
+        memory_db_path=str(ctx.run.db_path),
+        job_agg_path=str(ctx.run.aggregation_path),
+        mcp_pool=ctx.mcp_pool,
+        on_event=ctx.publish,
+        artifacts=ctx.run.artifacts,
+    )
+    ctx.run.update(aggregation_path=str(ctx.run.aggregation_path.resolve()))
+
+
+def _scoring_inputs() -> Dict[str, Any]:
+    return {
+        "version": SCORING_VERSION,
+        "weights": WEIGHTS,
+        "role_matching": config.get("role_matching", {}),
+        "skill_taxonomy": _file_digest(config.get("skill_taxonomy", {}).get("path", "config/skill_taxonomy.yaml")),
+    }
+
+
+async def _rank_inputs(ctx: StageContext) -> Dict[str, Any]:
+    return {"profile": await ctx.profile(), "scoring": _scoring_inputs()}
+
+
+async def _run_rank(ctx: StageContext) -> None:
+    await refresh_aggregation_profile(
+        memory_db_path=str(ctx.run.db_path),
+        job_agg_path=str(ctx.aggregation_path),
+        artifacts=ctx.run.artifacts,
+    )
+
+
+async def _score_inputs(ctx: StageContext) -> Dict[str, Any]:
+    return {"scoring": _scoring_inputs()}
+
+
+async def _score(ctx: StageContext) -> Dict[str, Any]:
+    data = await ctx.run.artifacts.aget(ARTIFACT_AGGREGATION, ctx.aggregation_path)
+    if data is None:
+        raise FileNotFoundError(f"No aggregation for run {ctx.run.run_id}")
+    scored = await asyncio.to_thread(score_aggregation, data)
+    return ctx.run.artifacts.put(
+        ARTIFACT_SCORES,
+        scored,
+        ctx.run.scored_path if PERSIST_SCORES else None,
+    )
+
+
+async def _run_score(ctx: StageContext) -> None:
+    scored = await _score(ctx)
+    ctx.publish("present.scored", jobs=len(scored.get("compatibility_scores", [])))
+
+
+async def _scored_payload(ctx: StageContext) -> Dict[str, Any]:
+    """The score stage's payload from the store (or its file); scored afresh if neither exists."""
+    scored = await ctx.run.artifacts.aget(ARTIFACT_SCORES, ctx.run.scored_path)
+    return scored if scored is not None else await _score(ctx)
+
+
+async def _present_inputs(ctx: StageContext) -> Dict[str, Any]:
+    return {
+        "profile": await ctx.profile(),
+        "model": str(presenter_agent.model),
+        "instructions": PRESENTER_INSTRUCTIONS,
+        "template": PRESENTER_TASK_TEMPLATE,
+    }
+
+
+async def _run_present(ctx: StageContext) -> None:
+    await run_presenter_pipeline(
+        input_agg_path=str(ctx.aggregation_path),
+        scored_out_path=str(ctx.run.scored_path),
+        presenter_md_path=str(ctx.run.presenter_md_path),
+        memory_db_path=str(ctx.run.db_path),
+        scored=await _scored_payload(ctx),
+    )
+    ctx.publish("present.report_ready")
+
+
+def build_job_pipeline() -> PipelineDAG:
+    """research -> rank -> score -> present; research is the "research" phase, the rest "present"."""
+    return PipelineDAG([
+        PipelineStage(
+            "research", "research", [],
+            inputs=_research_inputs,
+            outputs=lambda ctx: {ARTIFACT_AGGREGATION: ctx.run.aggregation_path},
+            run=_run_research,
+        ),
+        PipelineStage(
+            "rank", "present", ["research"],
+            inputs=_rank_inputs,
+            outputs=lambda ctx: {ARTIFACT_AGGREGATION: ctx.aggregation_path},
+            run=_run_rank,
+        ),
+        PipelineStage(
+            "score", "present", ["rank"],
+            inputs=_score_inputs,
+            outputs=lambda ctx: {ARTIFACT_SCORES: ctx.run.scored_path},
+            run=_run_score,
+        ),
+        PipelineStage(
+            "present", "present", ["score"],
+            inputs=_present_inputs,
+            outputs=lambda ctx: {ARTIFACT_PRESENTER_MD: ctx.run.presenter_md_path},
+            run=_run_present,
+        ),
+    ])
+
+
+job_pipeline = build_job_pipeline()
@@ -0,0 +1,71 @@
+# full_pipeline_files/preference_updates.py
+
+"""
+Which run artifacts a preferences edit invalidates, and which phases must re-run.
+
+Search queries are built from research_pipeline.junior_task_profiles, so
+only fields that reach a junior need a new research phase; main asks the
+pipeline plan (pipeline_dag.py), which fingerprints exactly that, and
+RESEARCH_FIELDS (the intake fields behind the "direct" search and the
+DuckDuckGo agent's profile) is the fallback. Every other intake field feeds scoring or the presenter and
+advisor prompts, so it only needs the existing aggregation re-ranked and the
+presenter re-run. Advisor reports are marked stale but never re-run
+automatically: they need a fresh job selection from the user.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from full_pipeline_files.artifact_store import (
+    ARTIFACT_AGGREGATION,
+    ARTIFACT_IMPROVEMENT,
+    ARTIFACT_PRESENTER_MD,
+    ARTIFACT_SCORES,
+)
+
+# Intake fields that change what the juniors search for.
+RESEARCH_FIELDS = frozenset({
+    "preferred_role", "preferred_locations", "remote_preference", "user_reported_years_experience",
+})
+
+PHASE_RESEARCH = "research"
+PHASE_RESCORE = "rescore"
+
+
+def merge_preferences(old: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
+    """Partial update: keys in update replace old ones, everything else is kept."""
+    return {**(old or {}), **(update or {})}
+
+
+def changed_preference_fields(old: Dict[str, Any], new: Dict[str, Any]) -> List[str]:
+    old, new = old or {}, new or {}
+    return sorted(k for k in set(old) | set(new) if old.get(k) != new.get(k))
+
+
+def plan_preference_update(
+    changed: List[str],
+    has_aggregation: bool,
+    has_improvement: bool,
+    research_reruns: Optional[bool] = None,
+) -> Dict[str, Any]:
+    """
+    Return {"phase": PHASE_RESEARCH | PHASE_RESCORE | None, "stale": [artifacts]}.
+    research_reruns is the pipeline plan's decision for the research stage;
+    without it RESEARCH_FIELDS decides. Nothing re-runs before research has
+    produced an aggregation.
+    """
+    if not changed or not has_aggregation:
+        return {"phase": None, "stale": []}
+
+    if research_reruns is None:
+        research_reruns = bool(RESEARCH_FIELDS.intersection(changed))
+
+    if research_reruns:
+        phase = PHASE_RESEARCH
+        stale = [ARTIFACT_AGGREGATION, ARTIFACT_SCORES, ARTIFACT_PRESENTER_MD]
+    else:
+        phase = PHASE_RESCORE
+        stale = [ARTIFACT_SCORES, ARTIFACT_PRESENTER_MD]
+
+    if has_improvement:
+        stale.append(ARTIFACT_IMPROVEMENT)
+    return {"phase": phase, "stale": stale}
@@ -1,14 +1,16 @@
 import asyncio
+import json
 import os
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, Optional
 
 from utils.logger import logging
 from utils.exception import CustomException
 from utils.read_yaml import read_yaml
 
-from present_to_user.job_compatibility_scoring import add_scores_to_aggregation
+from full_pipeline_files.run_events import ProgressCallback
+from present_to_user.job_compatibility_scoring import score_aggregation, write_scores
 from present_to_user.present_jobs_pipeline import run_presenter_pipeline
 
 logger = logging.getLogger(__name__)
@@ -19,6 +21,31 @@ SCORED_OUT_PATH = config.scored_out_path
 PRESENTER_MD_PATH = config.presenter_md_path
 MEMORY_DB_PATH = config.memory_path
 
+# Scores reach the presenter in memory; writing compatibility_scores.json is an optional side effect.
+PERSIST_SCORES = bool(config.get("scoring", {}).get("persist_scores", True))
+
+
+def load_aggregation(input_agg_path: str) -> Dict[str, Any]:
+    with open(input_agg_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def start_score_persist(scored: Dict[str, Any], scored_out_path: Optional[str]) -> Optional[asyncio.Task]:
+    """Write the scored payload in a worker thread while the caller carries on (None when disabled)."""
+    if not PERSIST_SCORES or not scored_out_path:
+        return None
+    return asyncio.create_task(asyncio.to_thread(write_scores, scored, scored_out_path))
+
+
+async def finish_score_persist(task: Optional[asyncio.Task]) -> None:
+    """Wait for start_score_persist; a failed write is logged, never raised."""
+    if task is None:
+        return
+    try:
+        await task
+    except Exception as e:
+        logger.warning("Could not persist compatibility scores: %s", CustomException(e, sys))
+
 
 async def run_presenter_only_pipeline(
     model: str = "gpt-4.1-mini",
@@ -26,12 +53,15 @@ async def run_presenter_only_pipeline(
     scored_out_path: str = SCORED_OUT_PATH,
     presenter_md_path: str = PRESENTER_MD_PATH,
     memory_db_path: str = MEMORY_DB_PATH,
+    on_event: Optional[ProgressCallback] = None,
 ) -> str:
     """
     Presenter pipeline (only):
-      1) Score/Aggregation -> add_scores_to_aggregation(input_agg_path, scored_out_path)
-      2) Run presenter to generate markdown (uses present_jobs_pipeline)
+      1) Score the aggregation once, in memory (scored_out_path is written in the
+         background when scoring.persist_scores is on)
+      2) Run presenter on the scored payload to generate markdown (uses present_jobs_pipeline)
     Uses provided paths and falls back to module defaults.
+    on_event (optional) receives "present.scored" and "present.report_ready".
     Returns the presenter markdown path produced by the presenter step.
     """
     logger.info("<<<< PRESENTER_PIPELINE_START >>>>")
@@ -42,9 +72,13 @@ async def run_presenter_only_pipeline(
 
     try:
         logger.info("<<<< [1/2] SCORING_START >>>>")
-        scored = add_scores_to_aggregation(input_agg_path, scored_out_path)
-        logger.info("SCORING_COMPLETE: %s", scored_out_path)
+        data = await asyncio.to_thread(load_aggregation, input_agg_path)
+        scored = await asyncio.to_thread(score_aggregation, data)
+        persist_task = start_score_persist(scored, scored_out_path)
+        logger.info("SCORING_COMPLETE: %d jobs", len(scored.get("compatibility_scores", [])))
         logger.info("<<<< [1/2] SCORING_END >>>>")
+        if on_event:
+            on_event("present.scored", jobs=len(scored.get("compatibility_scores", [])))
     except Exception as e:
         logger.error("SCORING_FAILED: %s", CustomException(e, sys))
         logger.info("<<<< PRESENTER_PIPELINE_ABORTED >>>>")
@@ -57,13 +91,18 @@ async def run_presenter_only_pipeline(
             scored_out_path=scored_out_path,
             presenter_md_path=presenter_md_path,
             memory_db_path=memory_db_path,
+            scored=scored,
         )
         logger.info("PRESENTER_MD_PATH: %s", presenter_md_path_ret)
         logger.info("<<<< [2/2] PRESENTER_END >>>>")
+        if on_event:
+            on_event("present.report_ready")
     except Exception as e:
         logger.error("PRESENTER_FAILED: %s", CustomException(e, sys))
         logger.info("<<<< PRESENTER_PIPELINE_ABORTED >>>>")
         raise
+    finally:
+        await finish_score_persist(persist_task)
 
     logger.info("<<<< PRESENTER_PIPELINE_END >>>>")
     try:
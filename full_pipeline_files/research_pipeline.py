@@ -3,13 +3,18 @@ import json
 import os
 import sys
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from utils.logger import logging
 from utils.exception import CustomException
 from utils.read_yaml import read_yaml
 
 from career_research.research_pipeline import run_career_research
+from career_research.fetch_user_profile import fetch_user_profile_async
+from career_research.job_aggregator import rerank_aggregation
+from utils.mcp_server_pool import MCPServerPool
+from full_pipeline_files.run_events import ProgressCallback
+from full_pipeline_files.artifact_store import ARTIFACT_AGGREGATION, RunArtifactStore
 
 logger = logging.getLogger(__name__)
 
@@ -22,11 +27,17 @@ async def run_research_pipeline(
     model: str = "gpt-4.1-mini",
     memory_db_path: str = MEMORY_DB_PATH,
     job_agg_path: str = JOB_AGGREGATION_PATH,
+    mcp_pool: Optional[MCPServerPool] = None,
+    on_event: Optional[ProgressCallback] = None,
+    artifacts: Optional[RunArtifactStore] = None,
 ) -> str:
     """
     Research pipeline (only):
       1) Run career research using memory (memory_db_path)
       2) Persist JobAggregation JSON to job_agg_path
+    With artifacts, the payload is kept in the run's store and written to
+    job_agg_path in the background instead.
+    on_event (optional) receives the research.* progress events.
     Returns the path to the saved JobAggregation JSON.
     """
     logger.info("<<<< RESEARCH_PIPELINE_START >>>>")
@@ -37,6 +48,8 @@ async def run_research_pipeline(
         research_result = await run_career_research(
             memory_db_path=memory_db_path,
             model=model,
+            mcp_pool=mcp_pool,
+            on_event=on_event,
         )
         logger.info("<<<< [1/2] CAREER_RESEARCH_END >>>>")
     except Exception as e:
@@ -52,11 +65,16 @@ async def run_research_pipeline(
         agg_dict = aggregation.model_dump() if hasattr(aggregation, "model_dump") else aggregation
         payload = {"profile": profile, "aggregation": agg_dict}
 
-        os.makedirs(os.path.dirname(job_agg_path) or ".", exist_ok=True)
-        with open(job_agg_path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2)
+        if artifacts is not None:
+            artifacts.put(ARTIFACT_AGGREGATION, payload, Path(job_agg_path))
+        else:
+            os.makedirs(os.path.dirname(job_agg_path) or ".", exist_ok=True)
+            with open(job_agg_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=2)
 
         logger.info("JOB_AGGREGATION_SAVED: %s", job_agg_path)
+        if on_event:
+            on_event("research.aggregation_saved")
         logger.info("<<<< [2/2] SAVE_JOB_AGGREGATION_JSON_END >>>>")
     except Exception as e:
         logger.error("SAVE_JOB_AGGREGATION_JSON_FAILED: %s", CustomException(e, sys))
@@ -65,3 +83,48 @@ async def run_research_pipeline(
 
     logger.info("<<<< RESEARCH_PIPELINE_END >>>>")
     return str(Path(job_agg_path).resolve())
+
+
+def _read_json(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_json(path: str, payload: Dict[str, Any]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+
+
+async def refresh_aggregation_profile(
+    memory_db_path: str = MEMORY_DB_PATH,
+    job_agg_path: str = JOB_AGGREGATION_PATH,
+    artifacts: Optional[RunArtifactStore] = None,
+) -> str:
+    """
+    Re-rank a saved JobAggregation for the current profile in memory, without searching
+    again (a preferences edit that does not touch the search fields).
+    With artifacts, the aggregation is read from and put back into the run's store.
+    Returns the path to the rewritten JobAggregation JSON.
+    """
+    try:
+        profile = await fetch_user_profile_async(memory_db_path)
+        if artifacts is not None:
+            saved = await artifacts.aget(ARTIFACT_AGGREGATION, Path(job_agg_path))
+            if saved is None:
+                raise FileNotFoundError(job_agg_path)
+        else:
+            saved = await asyncio.to_thread(_read_json, job_agg_path)
+        payload = {
+            **saved,
+            "profile": profile,
+            "aggregation": rerank_aggregation(profile, saved.get("aggregation") or {}),
+        }
+        if artifacts is not None:
+            artifacts.put(ARTIFACT_AGGREGATION, payload, Path(job_agg_path))
+        else:
+            await asyncio.to_thread(_write_json, job_agg_path, payload)
+        logger.info("JOB_AGGREGATION_RERANKED: %s", job_agg_path)
+        return str(Path(job_agg_path).resolve())
+    except Exception as e:
+        logger.error("REFRESH_JOB_AGGREGATION_FAILED: %s", CustomException(e, sys))
+        raise
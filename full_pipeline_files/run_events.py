@@ -0,0 +1,128 @@
+# full_pipeline_files/run_events.py
+
+"""
+Per-run progress event bus behind GET /events (server-sent events).
+
+Each PipelineRun owns a RunEventBus. Pipelines publish structured phase
+events (intake parsed, each junior finished, scoring done, each advisor job
+done) and every run.update() publishes a "status" event, so subscribers see
+completion as soon as it happens instead of polling /status.
+
+The bus keeps a short history so a reconnecting client can resume from its
+Last-Event-ID. publish() never raises and may be called from worker
+threads; delivery to subscribers is handed to their event loop.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Optional, Set
+
+from utils.logger import logging
+
+logger = logging.getLogger(__name__)
+
+# Signature of the on_event hooks the pipelines accept: on_event("research.source_done", source="adzuna", jobs=5)
+ProgressCallback = Callable[..., Any]
+
+SUBSCRIBER_QUEUE_SIZE = 256
+
+
+class RunEventBus:
+    """
+    Fan-out of one run's events to any number of async subscribers.
+    """
+
+    def __init__(self, run_id: str, history_size: int = 200):
+        self.run_id = run_id
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=history_size)
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._next_id = 1
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.closed = False
+
+    @property
+    def last_event_id(self) -> int:
+        return self._next_id - 1
+
+    def publish(self, event_type: str, **data: Any) -> Optional[Dict[str, Any]]:
+        if self.closed:
+            return None
+        with self._lock:
+            event = {
+                "id": self._next_id,
+                "type": event_type,
+                "run_id": self.run_id,
+                "ts": round(time.time(), 3),
+                "data": data,
+            }
+            self._next_id += 1
+            self._history.append(event)
+        self._call_in_loop(self._deliver, event)
+        return event
+
+    def _call_in_loop(self, fn, *args) -> None:
+        loop = self._loop
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if loop is None or running is loop:
+            fn(*args)
+        elif not loop.is_closed():
+            loop.call_soon_threadsafe(fn, *args)
+
+    def _deliver(self, event: Optional[Dict[str, Any]]) -> None:
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                if event is not None:
+                    # A stalled client loses events rather than growing memory; it can resume via Last-Event-ID.
+                    logger.warning("Dropping event %s for a slow subscriber of run %s", event["id"], self.run_id)
+
+    async def subscribe(
+        self,
+        after_id: Optional[int] = None,
+        heartbeat_seconds: Optional[float] = None,
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Yield events with id > after_id (history first, then live).
+        after_id None means live events only. Yields None every
+        heartbeat_seconds of silence so callers can send keep-alives.
+        Ends when the bus is closed.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._loop = asyncio.get_running_loop()
+        # Register and snapshot history together, so no event is missed or repeated.
+        with self._lock:
+            self._subscribers.add(queue)
+            backlog = [e for e in self._history if after_id is not None and e["id"] > after_id]
+        last_id = after_id or 0
+        try:
+            for event in backlog:
+                last_id = event["id"]
+                yield event
+            while not self.closed:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if event is None:
+                    break
+                if event["id"] <= last_id:
+                    continue
+                last_id = event["id"]
+                yield event
+        finally:
+            self._subscribers.discard(queue)
+
+    def close(self) -> None:
+        """Stop accepting events and end every open subscription."""
+        if self.closed:
+            return
+        self.closed = True
+        self._call_in_loop(self._deliver, None)
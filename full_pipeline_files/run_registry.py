@@ -0,0 +1,231 @@
+# full_pipeline_files/run_registry.py
+
+"""
+Session-scoped run registry for the API.
+
+Every /intake call creates a PipelineRun with its own run_id, its own
+input/outputs/memory directories and its own status record, so several users
+can move through intake, research and advisor phases on one process without
+sharing files or state.
+"""
+
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from full_pipeline_files.artifact_store import RunArtifactStore
+from full_pipeline_files.run_events import RunEventBus
+from utils.logger import logging
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATES = ("queued", "running")
+# Status fields that are pushed to /events subscribers on every change.
+STATUS_EVENT_FIELDS = ("state", "step", "error", "stale")
+
+
+def _empty_status() -> Dict[str, Any]:
+    return {
+        "state": "idle",
+        "step": None,
+        "file": None,
+        "preferences": None,
+        "error": None,
+        "aggregation_path": None,
+        "presenter_md": None,
+        "improvement_output": None,
+        "improvement_result": None,
+        # Artifacts made out of date by a preferences edit (see preference_updates.py)
+        "stale": [],
+        # Advisor cache fingerprints of this run's earlier profiles, for /invalidate_advisor_cache
+        "previous_profile_fingerprints": [],
+    }
+
+
+class PipelineRun:
+    """
+    One user session: paths, the status record served by /status, the
+    event bus streamed by /events and the in-memory phase artifacts.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        input_root: Path,
+        output_root: Path,
+        memory_root: Path,
+        event_history_size: int = 200,
+    ):
+        self.run_id = run_id
+        self.input_dir = Path(input_root) / run_id
+        self.output_dir = Path(output_root) / run_id
+        self.memory_dir = Path(memory_root) / run_id
+        self.db_path = self.memory_dir / "userprofile.db"
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+        self.status: Dict[str, Any] = _empty_status()
+        self.events = RunEventBus(run_id, history_size=event_history_size)
+        self.artifacts = RunArtifactStore(run_id)
+
+    # ----------------------
+    # Paths
+    # ----------------------
+    def make_dirs(self) -> None:
+        for d in (self.input_dir, self.output_dir, self.memory_dir):
+            d.mkdir(parents=True, exist_ok=True)
+
+    def remove_dirs(self) -> None:
+        for d in (self.input_dir, self.output_dir, self.memory_dir):
+            shutil.rmtree(d, ignore_errors=True)
+
+    @property
+    def aggregation_path(self) -> Path:
+        return self.output_dir / "job_aggregation.json"
+
+    @property
+    def scored_path(self) -> Path:
+        return self.output_dir / "compatibility_scores.json"
+
+    @property
+    def presenter_md_path(self) -> Path:
+        return self.output_dir / "presenter_output.md"
+
+    @property
+    def selection_path(self) -> Path:
+        return self.input_dir / "user_selected_jobs.json"
+
+    @property
+    def improvement_md_path(self) -> Path:
+        return self.output_dir / "profile_improvement_output.md"
+
+    # ----------------------
+    # Status
+    # ----------------------
+    def update(self, **fields: Any) -> None:
+        self.status.update(fields)
+        self.updated_at = time.time()
+        if any(k in fields for k in STATUS_EVENT_FIELDS):
+            self.events.publish("status", **self.status_summary())
+
+    def publish(self, event_type: str, **data: Any) -> None:
+        """Progress hook handed to the pipelines as on_event."""
+        self.updated_at = time.time()
+        self.events.publish(event_type, **data)
+
+    def mark_stale(self, *artifacts: str) -> None:
+        stale = list(self.status.get("stale") or [])
+        stale.extend(a for a in artifacts if a not in stale)
+        self.update(stale=stale)
+
+    def clear_stale(self, *artifacts: str) -> None:
+        stale = [a for a in (self.status.get("stale") or []) if a not in artifacts]
+        self.update(stale=stale)
+
+    def reset_status(self) -> None:
+        self.status = _empty_status()
+        self.updated_at = time.time()
+
+    def is_active(self) -> bool:
+        return self.status.get("state") in ACTIVE_STATES
+
+    def to_status(self) -> Dict[str, Any]:
+        return {"run_id": self.run_id, **self.status}
+
+    def status_summary(self) -> Dict[str, Any]:
+        return {k: self.status.get(k) for k in STATUS_EVENT_FIELDS}
+
+
+class RunRegistry:
+    """
+    In-process registry of PipelineRun objects keyed by run_id.
+
+    Finished runs older than ttl_seconds are pruned (directories included)
+    whenever a new run is created, so disk and memory stay bounded.
+    on_remove is called with each run before its directories are deleted
+    (e.g. to close the run's memory store); the run's event bus is closed
+    so open /events streams end.
+    """
+
+    def __init__(
+        self,
+        input_root: Path,
+        output_root: Path,
+        memory_root: Path,
+        ttl_seconds: float = 2 * 60 * 60,
+        max_runs: int = 200,
+        on_remove: Optional[Callable[[PipelineRun], None]] = None,
+        event_history_size: int = 200,
+    ):
+        self.input_root = Path(input_root)
+        self.output_root = Path(output_root)
+        self.memory_root = Path(memory_root)
+        self.ttl_seconds = ttl_seconds
+        self.max_runs = max_runs
+        self.on_remove = on_remove
+        self.event_history_size = event_history_size
+        self._runs: Dict[str, PipelineRun] = {}
+
+    def create(self) -> PipelineRun:
+        self.prune()
+        if len(self._runs) >= self.max_runs:
+            raise RuntimeError(
+                f"Too many active runs ({len(self._runs)}). Please try again shortly."
+            )
+
+        run = PipelineRun(
+            run_id=uuid.uuid4().hex[:12],
+            input_root=self.input_root,
+            output_root=self.output_root,
+            memory_root=self.memory_root,
+            event_history_size=self.event_history_size,
+        )
+        run.make_dirs()
+        self._runs[run.run_id] = run
+        logger.info("Created run %s (%d runs registered)", run.run_id, len(self._runs))
+        return run
+
+    def get(self, run_id: str) -> Optional[PipelineRun]:
+        return self._runs.get(run_id)
+
+    def remove(self, run_id: str) -> bool:
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return False
+        if self.on_remove is not None:
+            try:
+                self.on_remove(run)
+            except Exception as e:
+                logger.warning("on_remove hook failed for run %s: %s", run_id, e)
+        run.events.close()
+        run.artifacts.close()
+        run.remove_dirs()
+        logger.info("Removed run %s", run_id)
+        return True
+
+    def prune(self) -> List[str]:
+        """Drop idle/finished runs that have not been touched for ttl_seconds."""
+        cutoff = time.time() - self.ttl_seconds
+        stale = [
+            run_id for run_id, run in self._runs.items()
+            if not run.is_active() and run.updated_at < cutoff
+        ]
+        for run_id in stale:
+            self.remove(run_id)
+        if stale:
+            logger.info("Pruned %d stale runs", len(stale))
+        return stale
+
+    def all(self) -> List[PipelineRun]:
+        return list(self._runs.values())
+
+    def counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for run in self._runs.values():
+            state = run.status.get("state") or "idle"
+            counts[state] = counts.get(state, 0) + 1
+        return counts
+
+    def __len__(self) -> int:
+        return len(self._runs)
@@ -8,19 +8,51 @@ from typing import Dict, Any
 from contextlib import asynccontextmanager
 
 
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Body
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Body, Query, Header, Request
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 
 from full_pipeline_files.input_pipeline import run_intake_pipeline
-from full_pipeline_files.research_pipeline import run_research_pipeline
-from full_pipeline_files.presenter_pipeline import run_presenter_only_pipeline
+from full_pipeline_files.pipeline_dag import ACTION_RUN, StageContext, job_pipeline
+from full_pipeline_files.artifact_store import (
+    ARTIFACT_AGGREGATION,
+    ARTIFACT_IMPROVEMENT,
+    ARTIFACT_PRESENTER_MD,
+    ARTIFACT_SCORES,
+    ARTIFACT_SELECTION,
+    shutdown_artifact_writer,
+)
+from full_pipeline_files.run_registry import PipelineRun, RunRegistry
+from full_pipeline_files.preference_updates import (
+    PHASE_RESEARCH,
+    PHASE_RESCORE,
+    changed_preference_fields,
+    merge_preferences,
+    plan_preference_update,
+)
+from full_pipeline_files.job_scheduler import (
+    JobScheduler,
+    SchedulerQueueFull,
+    PRIORITY_CONTINUATION,
+)
 from profile_improvement_advisor.profile_improvement_pipeline import (
+    advisor_profile_fingerprint,
+    build_improvement_markdown,
+    invalidate_advisor_cache_for_profile,
     run_profile_improvement_pipeline,
 )
+from profile_improvement_advisor.advisor_cache import advisor_cache, invalidate_advisor_cache
 from utils.read_yaml import read_yaml
-
+from utils.mcp_server_pool import MCPServerPool
+from utils.http_client import close_http_client, http_client_stats
+from career_research.research_mcp_and_tools import researcher_mcp_server_factories, search_cache
+
+from memory_saving.memory_store import close_memory_store, close_all_memory_stores
+from memory_saving.profile_repository import profile_repository
+from memory_saving.resume_parse_cache import resume_cache
+from memory_saving.resume_extraction_service import ResumeExtractionError, resume_extraction_service
+from memory_saving.user_intake_pipeline import save_user_preferences
 from memory_saving.save_user_resume_to_memory import (
     FRIENDLY_OCR_DISABLED_MSG,
     OCRDisabledError,
@@ -46,6 +78,43 @@ MEMORY_DIR.mkdir(parents=True, exist_ok=True)
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 DB_PATH = MEMORY_DIR / "userprofile.db"
 
+_events_config = config.get("events", {})
+EVENT_HEARTBEAT_SECONDS = float(_events_config.get("heartbeat_seconds", 15))
+
+
+def _release_run_memory(run: PipelineRun) -> None:
+    close_memory_store(run.db_path)
+    profile_repository.invalidate(run.db_path)
+
+
+runs = RunRegistry(
+    input_root=INPUT_DIR,
+    output_root=OUTPUT_DIR,
+    memory_root=MEMORY_DIR,
+    ttl_seconds=float(config.get("run_ttl_minutes", 120)) * 60,
+    max_runs=int(config.get("max_runs", 200)),
+    on_remove=_release_run_memory,
+    event_history_size=int(_events_config.get("history_size", 200)),
+)
+
+_scheduler_config = config.get("scheduler", {})
+scheduler = JobScheduler(
+    phase_limits=dict(_scheduler_config.get("concurrency", {})),
+    max_queue_size=int(_scheduler_config.get("max_queue_size", 100)),
+)
+
+_mcp_pool_config = config.get("mcp_pool", {})
+mcp_pool: MCPServerPool | None = None
+if _mcp_pool_config.get("enabled", False):
+    mcp_pool = MCPServerPool(
+        factories=researcher_mcp_server_factories(
+            client_session_timeout_seconds=int(_mcp_pool_config.get("client_session_timeout_seconds", 300))
+        ),
+        size_per_server=int(_mcp_pool_config.get("size_per_server", 2)),
+        lease_timeout_seconds=float(_mcp_pool_config.get("lease_timeout_seconds", 30)),
+        health_check_interval_seconds=float(_mcp_pool_config.get("health_check_interval_seconds", 60)),
+    )
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -57,12 +126,34 @@ async def lifespan(app: FastAPI):
     logger.info(f"  • Input:   {INPUT_DIR}")
     logger.info(f"  • Memory:  {MEMORY_DIR}")
     logger.info(f"  • Outputs: {OUTPUT_DIR}")
-    logger.info(f"  • DB:      {DB_PATH}")
+    logger.info(f"  • Runs:    <dir>/<run_id>/ (ttl {runs.ttl_seconds / 60:.0f} min)")
+    logger.info(f"Scheduler limits: {scheduler.phase_limits}")
     logger.info("=" * 80)
     
+    if mcp_pool is not None:
+        logger.info(f"Starting MCP pool ({mcp_pool.size_per_server} per server)...")
+        await mcp_pool.start()
+    
+    await scheduler.start()
+    
     yield
     
     logger.info("🛑 Job Research Pipeline API Shutting Down")
+    await scheduler.stop()
+    
+    for run in runs.all():
+        run.artifacts.flush(timeout=10)
+    shutdown_artifact_writer()
+    
+    if mcp_pool is not None:
+        await mcp_pool.stop()
+    
+    await close_http_client()
+    search_cache.close()
+    advisor_cache.close()
+    resume_cache.close()
+    resume_extraction_service.shutdown()
+    close_all_memory_stores()
 
 
 app = FastAPI(title="Job Research Pipeline", lifespan=lifespan)
@@ -77,53 +168,31 @@ app.add_middleware(
 )
 
 
-_state: Dict[str, Any] = {
-    "state": "idle",
-    "step": None,
-    "file": None,
-    "preferences": None,
-    "error": None,
-    "aggregation_path": None,
-    "presenter_md": None,
-    "improvement_output": None,
-    "improvement_result": None,
-}
-
-
-def cleanup_directories():
-    cleaned_files = []
-    try:
-        for item in INPUT_DIR.glob("*"):
-            if item.is_file():
-                item.unlink()
-                cleaned_files.append(f"input/{item.name}")
-        for item in OUTPUT_DIR.glob("*"):
-            if item.is_file():
-                item.unlink()
-                cleaned_files.append(f"outputs/{item.name}")
-        if cleaned_files:
-            logger.info(f"🗑️  Cleaned {len(cleaned_files)} files")
-    except Exception as e:
-        logger.warning(f"⚠️  Cleanup error: {e}")
-    return cleaned_files
+def _get_run(run_id: str) -> PipelineRun:
+    run = runs.get(run_id)
+    if run is None:
+        raise HTTPException(404, f"Unknown run_id '{run_id}'. Call /intake first.")
+    return run
 
 
-async def _run_intake_task(file_path: str, preferences: Dict[str, Any]):
-    logger.info(f"▶️  Starting intake pipeline")
+async def _run_intake_task(run: PipelineRun, file_path: str, preferences: Dict[str, Any]):
+    logger.info(f"▶️  [{run.run_id}] Starting intake pipeline")
     logger.info(f"   Resume: {Path(file_path).name}")
-    logger.info(f"   DB: {DB_PATH}")
+    logger.info(f"   DB: {run.db_path}")
     
-    _state.update({"state": "running", "step": "intake", "error": None})
+    run.update(state="running", step="intake", error=None)
     
     try:
         await run_intake_pipeline(
             resume_path=file_path,
             intake_answers=preferences,
-            model=MODEL
+            model=MODEL,
+            memory_db_path=str(run.db_path),
+            on_event=run.publish,
         )
         
-        logger.info(f"✅ Intake pipeline completed")
-        _state["state"] = "done"
+        logger.info(f"✅ [{run.run_id}] Intake pipeline completed")
+        run.update(state="done")
         
     except Exception as e:
         raw_msg = str(e)
@@ -139,106 +208,140 @@ async def _run_intake_task(file_path: str, preferences: Dict[str, Any]):
         else:
             user_msg = raw_msg
 
-            logger.error(f"❌ Intake pipeline failed: {raw_msg}")
+            logger.error(f"❌ [{run.run_id}] Intake pipeline failed: {raw_msg}")
             logger.exception("Full traceback:")
 
         # Store the error silently for frontend consumption
-        _state.update({"state": "error", "error": user_msg})
+        run.update(state="error", error=user_msg)
 
 
 
 
 
 
-async def _run_research_task() -> bool:
-    logger.info(f"▶️  Starting research pipeline")
+async def _run_research_task(run: PipelineRun, force: bool = False) -> bool:
+    logger.info(f"▶️  [{run.run_id}] Starting research pipeline")
     
-    _state.update({"state": "running", "step": "research", "error": None})
+    run.update(state="running", step="research", error=None)
     
     try:
-        job_agg_path = OUTPUT_DIR / "job_aggregation.json"
+        job_agg_path = run.aggregation_path
         logger.info(f"   Output: {job_agg_path.name}")
         
-        await run_research_pipeline(
-            model=MODEL,
-            job_agg_path=str(job_agg_path)
+        # Skipped when the search inputs match the last research of this run (see /plan).
+        await job_pipeline.execute(
+            StageContext(run, MODEL, mcp_pool),
+            stages=job_pipeline.stage_names("research"),
+            force=["research"] if force else (),
         )
         
-        logger.info(f"✅ Research pipeline completed")
+        logger.info(f"✅ [{run.run_id}] Research pipeline completed")
         
-        _state.update({
-            "state": "done",
-            "aggregation_path": str(job_agg_path.resolve())
-        })
+        run.update(
+            state="done",
+            aggregation_path=str(job_agg_path.resolve()),
+        )
+        run.clear_stale(ARTIFACT_AGGREGATION)
         return True
         
     except Exception as e:
-        logger.error(f"❌ Research pipeline failed: {str(e)}")
+        logger.error(f"❌ [{run.run_id}] Research pipeline failed: {str(e)}")
         logger.exception("Full traceback:")
-        _state.update({"state": "error", "error": str(e)})
+        run.update(state="error", error=str(e))
         return False
 
 
-async def _run_present_task() -> bool:
-    logger.info(f"▶️  Starting presenter pipeline")
+async def _run_present_task(run: PipelineRun) -> bool:
+    logger.info(f"▶️  [{run.run_id}] Starting presenter pipeline")
     
-    _state.update({"state": "running", "step": "present", "error": None})
+    run.update(state="running", step="present", error=None)
     
     try:
-        agg_path = _state.get("aggregation_path") or str(OUTPUT_DIR / "job_aggregation.json")
-        scored_out_path = OUTPUT_DIR / "compatibility_scores.json"
-        presenter_md_path = OUTPUT_DIR / "presenter_output.md"
+        presenter_md_path = run.presenter_md_path
         
-        await run_presenter_only_pipeline(
-            model=MODEL,
-            input_agg_path=agg_path,
-            scored_out_path=str(scored_out_path),
+        # rank -> score -> present, each skipped when its inputs are unchanged.
+        await job_pipeline.execute(
+            StageContext(run, MODEL, mcp_pool),
+            stages=job_pipeline.stage_names("present"),
         )
         
         if not presenter_md_path.exists():
             raise ValueError(f"Presenter output not created")
         
-        logger.info(f"✅ Presenter pipeline completed")
+        logger.info(f"✅ [{run.run_id}] Presenter pipeline completed")
         
-        _state.update({
-            "state": "done",
-            "presenter_md": str(presenter_md_path.resolve())
-        })
+        run.update(
+            state="done",
+            presenter_md=str(presenter_md_path.resolve()),
+        )
+        run.clear_stale(ARTIFACT_SCORES, ARTIFACT_PRESENTER_MD)
         return True
         
     except Exception as e:
-        logger.error(f"❌ Presenter pipeline failed: {str(e)}")
+        logger.error(f"❌ [{run.run_id}] Presenter pipeline failed: {str(e)}")
         logger.exception("Full traceback:")
-        _state.update({"state": "error", "error": str(e)})
+        run.update(state="error", error=str(e))
         return False
 
 
-async def _run_full_pipeline():
-    logger.info(f"🚀 Starting full pipeline (research -> present)")
+async def _run_full_pipeline(run: PipelineRun, force: bool = False):
+    logger.info(f"🚀 [{run.run_id}] Starting full pipeline (research -> present)")
     
-    if await _run_research_task():
-        await _run_present_task()
+    if await _run_research_task(run, force=force):
+        # Present runs in its own (wider) phase pool; it jumps ahead of new runs.
+        run.update(state="queued", step="present")
+        try:
+            scheduler.submit(
+                run.run_id,
+                "present",
+                lambda: _run_present_task(run),
+                priority=PRIORITY_CONTINUATION,
+            )
+        except SchedulerQueueFull as e:
+            # No HTTP caller to answer 429 to: fail the run so it is not left "queued" forever.
+            logger.warning(f"❌ [{run.run_id}] present rejected: {e}")
+            run.update(state="error", error=str(e))
+            return
+        logger.info(f"   🔄 [{run.run_id}] Presenter queued")
+        return
         
-    logger.info(f"🏁 Full pipeline completed")
+    logger.info(f"🏁 [{run.run_id}] Full pipeline stopped after research")
 
 
-async def _run_improvement_task():
-    logger.info(f"▶️  Starting profile improvement pipeline")
+def _submit_or_429(run: PipelineRun, phase: str, factory) -> str:
+    try:
+        return scheduler.submit(run.run_id, phase, factory)
+    except SchedulerQueueFull as e:
+        logger.warning(f"❌ [{run.run_id}] {phase} rejected: {e}")
+        run.update(state="error", error=str(e))
+        raise HTTPException(status_code=429, detail=str(e))
+
+
+async def _run_improvement_task(run: PipelineRun):
+    logger.info(f"▶️  [{run.run_id}] Starting profile improvement pipeline")
     
-    _state.update({"state": "running", "step": "improvement", "error": None})
+    run.update(state="running", step="improvement", error=None)
     
     try:
-        selection_path = INPUT_DIR / "user_selected_jobs.json"
-        output_path = OUTPUT_DIR / "profile_improvement_output.md"
+        selection_path = run.selection_path
+        output_path = run.improvement_md_path
         
         logger.info(f"   📂 Loading selection from {selection_path.name}")
-        with open(selection_path, 'r', encoding='utf-8') as f:
-            selection_data = json.load(f)
+        selection_data = await run.artifacts.aget(ARTIFACT_SELECTION, selection_path)
+        if selection_data is None:
+            raise ValueError("No job selection found")
         
         logger.info(f"   ✅ Loaded {selection_data.get('selected_count', 0)} jobs")
         
         logger.info(f"   🤖 Calling run_profile_improvement_pipeline()...")
-        result = await run_profile_improvement_pipeline()
+        result = await run_profile_improvement_pipeline(
+            selection_data=selection_data,
+            memory_db_path=str(run.db_path),
+            selection_path=str(selection_path),
+            output_path=str(output_path),
+            mcp_pool=mcp_pool,
+            on_event=run.publish,
+        )
         logger.info(f"   ✅ Pipeline function returned successfully!")
         
         status = result.get("status", "unknown")
@@ -247,30 +350,11 @@ async def _run_improvement_task():
         
         logger.info(f"   📊 Pipeline: {status} ({successful}/{total} successful)")
         
-        logger.info(f"   📝 Building markdown output...")
-        markdown_output = f"# Profile Improvement Report\n\n"
-        markdown_output += f"**Generated:** {result.get('timestamp', 'N/A')}\n\n"
-        markdown_output += f"**Jobs Analyzed:** {total}\n\n"
-        markdown_output += f"**Successful:** {successful}\n\n"
-        markdown_output += "---\n\n"
-        
-        for idx, job_result in enumerate(result.get("results", []), 1):
-            markdown_output += f"## {idx}. {job_result.get('job_title', 'Unknown')}\n\n"
-            markdown_output += f"**Company:** {job_result.get('company', 'N/A')}\n\n"
-            markdown_output += f"**Location:** {job_result.get('location', 'N/A')}\n\n"
-            
-            if job_result.get('job_url'):
-                markdown_output += f"**Link:** {job_result['job_url']}\n\n"
-            
-            markdown_output += f"### Improvement Recommendations\n\n"
-            markdown_output += job_result.get('summary_text', 'No recommendations available')
-            markdown_output += "\n\n---\n\n"
-        
-        logger.info(f"   📝 Markdown built ({len(markdown_output)} chars)")
-        
-        logger.info(f"   💾 Saving to {output_path.name}...")
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(markdown_output, encoding="utf-8")
+        if not result.get("output_path"):
+            # Early failures (no selection) and write errors still leave a report behind.
+            logger.info(f"   💾 Saving to {output_path.name}...")
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_text(build_improvement_markdown(result), encoding="utf-8")
         
         if output_path.exists():
             file_size = output_path.stat().st_size
@@ -278,21 +362,22 @@ async def _run_improvement_task():
         else:
             logger.error(f"   ❌ File was NOT created!")
         
-        logger.info(f"✅ Profile improvement pipeline completed")
+        logger.info(f"✅ [{run.run_id}] Profile improvement pipeline completed")
         logger.info(f"   Output: {output_path.name}")
         
-        _state.update({
-            "state": "done",
-            "improvement_output": str(output_path.resolve()),
-            "improvement_result": result
-        })
+        run.update(
+            state="done",
+            improvement_output=str(output_path.resolve()),
+            improvement_result=result,
+        )
+        run.clear_stale(ARTIFACT_IMPROVEMENT)
         
         logger.info(f"   ✅ State updated to 'done'")
         
     except Exception as e:
-        logger.error(f"❌ Profile improvement pipeline failed: {str(e)}")
+        logger.error(f"❌ [{run.run_id}] Profile improvement pipeline failed: {str(e)}")
         logger.exception("Full traceback:")
-        _state.update({"state": "error", "error": str(e)})
+        run.update(state="error", error=str(e))
 
 
 @app.post("/intake")
@@ -302,84 +387,225 @@ async def intake(
 ):
     logger.info(f"📨 POST /intake - {file.filename}")
 
-    if _state["state"] in ["queued", "running"]:
-        logger.warning("❌ Intake rejected: pipeline already running")
+    try:
+        prefs = json.loads(preferences)
+    except json.JSONDecodeError as e:
+        raise HTTPException(400, "preferences must be valid JSON")
 
-        raise HTTPException(
-            status_code=409,
-            detail=(
-                "Another session is already running. "
-                "Multiple simultaneous runs are not supported due to free-tier "
-                "deployment limitations. Please wait for the current job to finish "
-                "and try again."
-            )
-        )
-    
-    cleanup_directories()
+    try:
+        run = runs.create()
+    except RuntimeError as e:
+        logger.warning(f"❌ Intake rejected: {e}")
+        raise HTTPException(status_code=503, detail=str(e))
     
-    dest = INPUT_DIR / file.filename
+    dest = run.input_dir / Path(file.filename).name
     with open(dest, "wb") as f:
         shutil.copyfileobj(file.file, f)
     
-    logger.info(f"   Saved: {dest.name}")
-    
     try:
-        prefs = json.loads(preferences)
-    except json.JSONDecodeError as e:
-        raise HTTPException(400, "preferences must be valid JSON")
+        resume_extraction_service.check_size(dest)
+    except ResumeExtractionError as e:
+        runs.remove(run.run_id)
+        raise HTTPException(status_code=413, detail=str(e))
+    
+    logger.info(f"   [{run.run_id}] Saved: {dest.name}")
     
-    _state.update({
-        "state": "queued",
-        "step": "intake",
-        "file": str(dest),
-        "preferences": prefs,
-        "error": None,
-        "aggregation_path": None,
-        "presenter_md": None,
-        "improvement_output": None,
-        "improvement_result": None,
-    })
+    run.update(
+        state="queued",
+        step="intake",
+        file=str(dest),
+        preferences=prefs,
+        error=None,
+    )
     
-    asyncio.create_task(_run_intake_task(str(dest), prefs))
-    logger.info(f"   🔄 Intake task queued")
+    try:
+        _submit_or_429(run, "intake", lambda: _run_intake_task(run, str(dest), prefs))
+    except HTTPException:
+        runs.remove(run.run_id)
+        raise
+    logger.info(f"   🔄 [{run.run_id}] Intake task queued")
     
-    return {"status": "queued", "step": "intake"}
+    return {"status": "queued", "step": "intake", "run_id": run.run_id}
 
 
 @app.post("/start_research")
-async def start_research():
-    logger.info(f"📨 POST /start_research")
+async def start_research(run_id: str = Query(...), force: bool = Query(False)):
+    logger.info(f"📨 POST /start_research - {run_id}")
     
-    if not _state.get("file"):
+    run = _get_run(run_id)
+    
+    if not run.status.get("file"):
         raise HTTPException(400, "No resume uploaded. Call /intake first.")
     
-    if _state["step"] == "intake" and _state["state"] == "running":
+    if run.status["step"] == "intake" and run.is_active():
         raise HTTPException(409, "Intake pipeline still running.")
     
-    if _state["step"] in ["research", "present"] and _state["state"] in ["queued", "running"]:
+    if run.status["step"] in ["research", "present"] and run.is_active():
         return {
             "status": "already_in_progress",
-            "state": _state["state"],
-            "step": _state["step"]
+            "run_id": run.run_id,
+            "state": run.status["state"],
+            "step": run.status["step"]
         }
     
-    _state.update({"state": "queued", "step": "research", "error": None})
-    asyncio.create_task(_run_full_pipeline())
-    logger.info(f"   🔄 Research pipeline queued")
+    run.update(state="queued", step="research", error=None)
+    _submit_or_429(run, "research", lambda: _run_full_pipeline(run, force=force))
+    logger.info(f"   🔄 [{run.run_id}] Research pipeline queued")
+    
+    return {"status": "queued", "step": "research", "run_id": run.run_id}
+
+
+@app.get("/plan")
+async def plan(run_id: str = Query(...), force_research: bool = Query(False)):
+    """Which pipeline stages /start_research would run or skip, and why."""
+    run = _get_run(run_id)
+    
+    if not run.status.get("file"):
+        raise HTTPException(400, "No resume uploaded. Call /intake first.")
+    
+    steps = await job_pipeline.plan(
+        StageContext(run, MODEL, mcp_pool),
+        force=["research"] if force_research else (),
+    )
+    return {"run_id": run.run_id, "stages": steps}
+
+
+@app.post("/update_preferences")
+async def update_preferences(
+    run_id: str = Query(...),
+    preferences: Dict[str, Any] = Body(...),
+):
+    """
+    Update only job_intake for a run (partial updates are merged) and re-run just
+    the phases that depend on the changed fields: research + present when the
+    search profile changed (see /plan), otherwise re-rank + present.
+    """
+    logger.info(f"📨 POST /update_preferences - {run_id}")
+    
+    run = _get_run(run_id)
     
-    return {"status": "queued", "step": "research"}
+    if not run.status.get("file"):
+        raise HTTPException(400, "No resume uploaded. Call /intake first.")
+    
+    if run.is_active():
+        raise HTTPException(409, f"Run is busy with step '{run.status['step']}'.")
+    
+    if run.status.get("step") == "intake" and run.status.get("state") != "done":
+        raise HTTPException(409, "Intake has not completed for this run.")
+    
+    old_prefs = run.status.get("preferences") or {}
+    new_prefs = merge_preferences(old_prefs, preferences)
+    changed = changed_preference_fields(old_prefs, new_prefs)
+    
+    if not changed:
+        return {"status": "unchanged", "run_id": run.run_id, "changed": [], "rerun": None}
+    
+    # Advisor outputs cached for the old profile stay reachable by /invalidate_advisor_cache.
+    previous_fp = await advisor_profile_fingerprint(str(run.db_path))
+    await save_user_preferences(new_prefs, memory_db_path=str(run.db_path))
+    previous_fps = list(run.status.get("previous_profile_fingerprints") or [])
+    if previous_fp not in previous_fps:
+        previous_fps.append(previous_fp)
+    run.update(preferences=new_prefs, previous_profile_fingerprints=previous_fps)
+    logger.info(f"   [{run.run_id}] job_intake updated: {', '.join(changed)}")
+    
+    agg_path = Path(run.status.get("aggregation_path") or run.aggregation_path)
+    improvement_path = Path(run.status.get("improvement_output") or run.improvement_md_path)
+    steps = await job_pipeline.plan(StageContext(run, MODEL, mcp_pool))
+    plan = plan_preference_update(
+        changed,
+        has_aggregation=run.artifacts.has(ARTIFACT_AGGREGATION, agg_path),
+        has_improvement=improvement_path.exists(),
+        research_reruns=any(s["stage"] == "research" and s["action"] == ACTION_RUN for s in steps),
+    )
+    run.mark_stale(*plan["stale"])
+    run.publish("preferences.updated", changed=changed, rerun=plan["phase"], stale=plan["stale"])
+    
+    if plan["phase"] == PHASE_RESEARCH:
+        run.update(state="queued", step="research", error=None)
+        _submit_or_429(run, "research", lambda: _run_full_pipeline(run))
+        logger.info(f"   🔄 [{run.run_id}] Research pipeline re-queued")
+    elif plan["phase"] == PHASE_RESCORE:
+        run.update(state="queued", step="present", error=None)
+        _submit_or_429(run, "present", lambda: _run_present_task(run))
+        logger.info(f"   🔄 [{run.run_id}] Re-rank + presenter queued")
+    
+    return {
+        "status": "queued" if plan["phase"] else "saved",
+        "run_id": run.run_id,
+        "changed": changed,
+        "rerun": plan["phase"],
+        "stale": run.status.get("stale", []),
+    }
 
 
 @app.get("/status")
-async def get_status():
-    return JSONResponse(content=_state)
+async def get_status(run_id: str = Query(...)):
+    run = _get_run(run_id)
+    return JSONResponse(content=run.to_status())
+
+
+def _format_sse(event: Dict[str, Any]) -> str:
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+
+
+@app.get("/events")
+async def stream_events(
+    request: Request,
+    run_id: str = Query(...),
+    after: int | None = Query(None, description="Replay events with id > after"),
+    last_event_id: str | None = Header(None, alias="Last-Event-ID"),
+):
+    """
+    Server-sent events for one run: a "snapshot" of the current status first,
+    then "status" and phase events (intake.*, research.*, present.*, advisor.*)
+    as they happen. Reconnecting clients resume via Last-Event-ID or ?after=.
+    """
+    logger.info(f"📨 GET /events - {run_id}")
+    
+    run = _get_run(run_id)
+    
+    resume_from = after
+    if last_event_id and last_event_id.isdigit():
+        resume_from = int(last_event_id)
+    
+    async def event_stream():
+        yield "retry: 3000\n\n"
+        after_id = resume_from
+        if after_id is None:
+            # Id taken before the summary: events published while the snapshot is sent are
+            # replayed from history instead of lost (one may repeat what the snapshot shows).
+            after_id = run.events.last_event_id
+            yield _format_sse({
+                "id": after_id,
+                "type": "snapshot",
+                "run_id": run.run_id,
+                "data": run.status_summary(),
+            })
+        async for event in run.events.subscribe(
+            after_id=after_id,
+            heartbeat_seconds=EVENT_HEARTBEAT_SECONDS,
+        ):
+            if await request.is_disconnected():
+                break
+            if event is None:
+                yield ": keep-alive\n\n"
+                continue
+            yield _format_sse(event)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.get("/download")
-async def download_results():
-    logger.info(f"📨 GET /download")
+async def download_results(run_id: str = Query(...)):
+    logger.info(f"📨 GET /download - {run_id}")
     
-    path = Path(_state.get("presenter_md") or OUTPUT_DIR / "presenter_output.md")
+    run = _get_run(run_id)
+    path = Path(run.status.get("presenter_md") or run.presenter_md_path)
     
     if not path.exists():
         raise HTTPException(404, f"File not found")
@@ -389,37 +615,42 @@ async def download_results():
 
 
 @app.get("/aggregation")
-async def get_aggregation():
-    logger.info(f"📨 GET /aggregation")
+async def get_aggregation(run_id: str = Query(...)):
+    logger.info(f"📨 GET /aggregation - {run_id}")
     
-    path = Path(_state.get("aggregation_path") or OUTPUT_DIR / "job_aggregation.json")
+    run = _get_run(run_id)
+    path = Path(run.status.get("aggregation_path") or run.aggregation_path)
     
-    if not path.exists():
+    # Served from the run's artifact store; the file is only read after a restart.
+    data = await run.artifacts.aget(ARTIFACT_AGGREGATION, path)
+    if data is None:
         raise HTTPException(404, f"File not found")
     
-    with open(path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
     logger.info(f"   Serving: {path.name}")
     return JSONResponse(content=data)
 
 
 @app.post("/save_selection")
-async def save_selection(selection_data: Dict[str, Any] = Body(...)):
-    logger.info(f"📨 POST /save_selection")
+async def save_selection(
+    run_id: str = Query(...),
+    selection_data: Dict[str, Any] = Body(...),
+):
+    logger.info(f"📨 POST /save_selection - {run_id}")
+    
+    run = _get_run(run_id)
     
     try:
-        save_path = INPUT_DIR / "user_selected_jobs.json"
+        save_path = run.selection_path
         
-        with open(save_path, 'w', encoding='utf-8') as f:
-            json.dump(selection_data, f, indent=2, ensure_ascii=False)
+        run.artifacts.put(ARTIFACT_SELECTION, selection_data, save_path)
         
         selected_count = selection_data.get("selected_count", 0)
         
-        logger.info(f"✅ Selection saved: {selected_count} jobs")
+        logger.info(f"✅ [{run.run_id}] Selection saved: {selected_count} jobs")
         
         return {
             "status": "saved",
+            "run_id": run.run_id,
             "path": str(save_path),
             "count": selected_count,
             "timestamp": selection_data.get("timestamp")
@@ -431,25 +662,30 @@ async def save_selection(selection_data: Dict[str, Any] = Body(...)):
 
 
 @app.post("/start_improvement")
-async def start_improvement():
-    logger.info(f"📨 POST /start_improvement")
+async def start_improvement(run_id: str = Query(...)):
+    logger.info(f"📨 POST /start_improvement - {run_id}")
     
-    selection_path = INPUT_DIR / "user_selected_jobs.json"
-    if not selection_path.exists():
+    run = _get_run(run_id)
+    
+    if not run.artifacts.has(ARTIFACT_SELECTION, run.selection_path):
         raise HTTPException(400, "No job selection found. Select jobs first via /save_selection")
     
-    _state.update({"state": "queued", "step": "improvement", "error": None})
-    asyncio.create_task(_run_improvement_task())
-    logger.info(f"   🔄 Profile improvement task queued")
+    if run.is_active():
+        raise HTTPException(409, f"Run is busy with step '{run.status['step']}'.")
+    
+    run.update(state="queued", step="improvement", error=None)
+    _submit_or_429(run, "improvement", lambda: _run_improvement_task(run))
+    logger.info(f"   🔄 [{run.run_id}] Profile improvement task queued")
     
-    return {"status": "queued", "message": "Profile improvement analysis started"}
+    return {"status": "queued", "run_id": run.run_id, "message": "Profile improvement analysis started"}
 
 
 @app.get("/download_improvement")
-async def download_improvement():
-    logger.info(f"📨 GET /download_improvement")
+async def download_improvement(run_id: str = Query(...)):
+    logger.info(f"📨 GET /download_improvement - {run_id}")
     
-    path = Path(_state.get("improvement_output") or OUTPUT_DIR / "profile_improvement_output.md")
+    run = _get_run(run_id)
+    path = Path(run.status.get("improvement_output") or run.improvement_md_path)
     
     if not path.exists():
         raise HTTPException(404, "Profile improvement report not found")
@@ -458,29 +694,54 @@ async def download_improvement():
     return FileResponse(path, media_type="text/markdown", filename="profile_improvement.md")
 
 
+@app.post("/invalidate_advisor_cache")
+async def invalidate_advisor_outputs(run_id: str | None = Query(None)):
+    """
+    Drop cached advisor outputs for one run's profile (its current version and
+    the earlier ones replaced by /update_preferences), or all of them when
+    run_id is omitted.
+    """
+    logger.info(f"📨 POST /invalidate_advisor_cache - {run_id or 'all'}")
+    
+    if run_id:
+        run = _get_run(run_id)
+        removed = await invalidate_advisor_cache_for_profile(
+            str(run.db_path),
+            previous_fingerprints=run.status.get("previous_profile_fingerprints") or [],
+        )
+    else:
+        removed = await asyncio.to_thread(invalidate_advisor_cache)
+    
+    return {"status": "invalidated", "run_id": run_id, "removed": removed}
+
+
+@app.post("/cancel")
+async def cancel_run(run_id: str = Query(...)):
+    logger.info(f"📨 POST /cancel - {run_id}")
+    
+    run = _get_run(run_id)
+    cancelled = scheduler.cancel(run.run_id)
+    
+    if cancelled:
+        run.update(state="cancelled", error="Cancelled by user")
+    
+    return {"status": "cancelled" if cancelled else "nothing_to_cancel", "run_id": run_id, "jobs": cancelled}
+
+
 @app.post("/reset")
-async def reset_state():
-    logger.info(f"📨 POST /reset")
+async def reset_state(run_id: str = Query(...)):
+    logger.info(f"📨 POST /reset - {run_id}")
     
-    if _state["state"] == "running":
-        raise HTTPException(409, "Cannot reset while pipeline is running")
+    run = _get_run(run_id)
     
-    cleanup_directories()
+    if run.status["state"] == "running":
+        raise HTTPException(409, "Cannot reset while pipeline is running")
     
-    _state.update({
-        "state": "idle",
-        "step": None,
-        "file": None,
-        "preferences": None,
-        "error": None,
-        "aggregation_path": None,
-        "presenter_md": None,
-        "improvement_output": None,
-        "improvement_result": None,
-    })
+    scheduler.cancel(run.run_id)
+    runs.remove(run.run_id)
     
-    logger.info(f"   ✅ State reset")
-    return {"status": "reset", "message": "Pipeline state cleared"}
+    logger.info(f"   ✅ [{run_id}] Run removed")
+    return {"status": "reset", "run_id": run_id, "message": "Pipeline state cleared"}
 
 
 @app.get("/health")
@@ -488,7 +749,18 @@ async def health():
     return {
         "status": "ok",
         "model": MODEL,
-        "pipeline_state": _state["state"],
+        "runs": {
+            "total": len(runs),
+            "by_state": runs.counts(),
+        },
+        "scheduler": scheduler.stats(),
+        "mcp_pool": mcp_pool.stats() if mcp_pool is not None else None,
+        "profile_cache": profile_repository.stats(),
+        "http_client": http_client_stats(),
+        "search_cache": search_cache.stats(),
+        "advisor_cache": advisor_cache.stats(),
+        "resume_cache": resume_cache.stats(),
+        "resume_extraction": resume_extraction_service.stats(),
         "paths": {
             "input": str(INPUT_DIR),
             "memory": str(MEMORY_DIR),
@@ -3,6 +3,14 @@
 from pathlib import Path
 from typing import Dict, Any
 
+from utils.read_yaml import read_yaml
+
+config = read_yaml(Path("config/master_config.yaml"))
+
+# "sqlite" writes in process (memory_saving/memory_store.py),
+# "mcp" goes through the mcp-memory-libsql node server.
+MEMORY_BACKEND = str(config.get("memory_backend", "sqlite")).lower()
+
 MCP_PARAMS = {
     "command": "mcp-memory-libsql",
     "args": [],
@@ -10,6 +18,26 @@ MCP_PARAMS = {
 }
 
 
+def build_mcp_params(db_path: str | Path | None = None) -> Dict[str, Any]:
+    """
+    Return memory MCP params pointing at db_path (one DB per run).
+    Falls back to the shared MCP_PARAMS when no path is given.
+    """
+    if db_path is None:
+        return MCP_PARAMS
+
+    return {
+        **MCP_PARAMS,
+        "env": {"LIBSQL_URL": f"file:{Path(db_path).as_posix()}"},
+    }
+
+
+def db_path_from_params(params: Dict[str, Any] | None = None) -> Path:
+    """Resolve the SQLite file behind a memory MCP params dict."""
+    if params is None:
+        params = MCP_PARAMS
+    return Path(params["env"]["LIBSQL_URL"].replace("file:", ""))
+
 
 def ensure_memory_dir(params: Dict[str, Any] | None = None) -> Path:
     """
@@ -20,7 +48,7 @@ def ensure_memory_dir(params: Dict[str, Any] | None = None) -> Path:
     if params is None:
         params = MCP_PARAMS
 
-    db_path = Path(params["env"]["LIBSQL_URL"].replace("file:", ""))
+    db_path = db_path_from_params(params)
     memory_dir = db_path.parent
 
     if not memory_dir.exists():
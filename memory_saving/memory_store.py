@@ -0,0 +1,272 @@
+# memory_saving/memory_store.py
+
+"""
+In-process SQLite memory store.
+
+Same entities / observations / relations schema as the `mcp-memory-libsql`
+server, so either backend can read what the other wrote. Writes, upserts and
+reads happen directly in Python over a small per-DB connection pool in WAL
+mode, which removes a node subprocess spawn and the delete_entity +
+create_entities IPC round-trips from every intake.
+"""
+
+import itertools
+import json
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from utils.logger import logging
+
+logger = logging.getLogger(__name__)
+
+# Process-wide so a store that is closed and reopened never reuses a version.
+_write_versions = itertools.count(1)
+
+SCHEMA_STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS entities (
+        name TEXT PRIMARY KEY,
+        entity_type TEXT NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS observations (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        entity_name TEXT NOT NULL,
+        content TEXT NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (entity_name) REFERENCES entities(name)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS relations (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        source TEXT NOT NULL,
+        target TEXT NOT NULL,
+        relation_type TEXT NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (source) REFERENCES entities(name),
+        FOREIGN KEY (target) REFERENCES entities(name)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_entities_name ON entities(name)",
+    "CREATE INDEX IF NOT EXISTS idx_observations_entity ON observations(entity_name)",
+    "CREATE INDEX IF NOT EXISTS idx_relations_source ON relations(source)",
+    "CREATE INDEX IF NOT EXISTS idx_relations_target ON relations(target)",
+)
+
+
+class MemoryStore:
+    """
+    Thread-safe store over one SQLite file.
+
+    Connections are created lazily up to pool_size and reused; each one is
+    opened with check_same_thread=False so callers can hop threads via
+    asyncio.to_thread.
+
+    write_version changes on every committed write so readers that cache
+    parsed observations (memory_saving/profile_repository.py) can tell their
+    entries are stale without touching disk.
+    """
+
+    def __init__(self, db_path: str | Path, pool_size: int = 4, busy_timeout_ms: int = 5000):
+        self.db_path = Path(db_path)
+        self.pool_size = max(1, int(pool_size))
+        self.busy_timeout_ms = busy_timeout_ms
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        self.write_version = next(_write_versions)
+        self._ensure_schema()
+
+    # ----------------------
+    # Connections
+    # ----------------------
+    def _open(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        if self._closed:
+            raise RuntimeError(f"MemoryStore for {self.db_path} is closed")
+
+        conn: Optional[sqlite3.Connection] = None
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if self._created < self.pool_size:
+                    self._created += 1
+                    create = True
+                else:
+                    create = False
+            if create:
+                try:
+                    conn = self._open()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                conn = self._idle.get(timeout=self.busy_timeout_ms / 1000)
+
+        try:
+            yield conn
+        finally:
+            if self._closed:
+                conn.close()
+            else:
+                self._idle.put(conn)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        with self.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            else:
+                conn.execute("COMMIT")
+                self.write_version = next(_write_versions)
+
+    def _ensure_schema(self) -> None:
+        with self.transaction() as conn:
+            for stmt in SCHEMA_STATEMENTS:
+                conn.execute(stmt)
+
+    def close(self) -> None:
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    # ----------------------
+    # Writes (mirror the memory MCP tools)
+    # ----------------------
+    @staticmethod
+    def _insert_entity(conn: sqlite3.Connection, name: str, entity_type: str, observations: Sequence[str]) -> None:
+        conn.execute(
+            "INSERT OR IGNORE INTO entities (name, entity_type) VALUES (?, ?)",
+            (name, entity_type),
+        )
+        conn.executemany(
+            "INSERT INTO observations (entity_name, content) VALUES (?, ?)",
+            [(name, content) for content in observations],
+        )
+
+    @staticmethod
+    def _delete_entity(conn: sqlite3.Connection, name: str) -> None:
+        conn.execute("DELETE FROM observations WHERE entity_name = ?", (name,))
+        conn.execute("DELETE FROM relations WHERE source = ? OR target = ?", (name, name))
+        conn.execute("DELETE FROM entities WHERE name = ?", (name,))
+
+    def create_entities(self, entities: List[Dict[str, Any]]) -> None:
+        """Same argument shape as the MCP create_entities tool (name, entityType, observations)."""
+        with self.transaction() as conn:
+            for entity in entities:
+                self._insert_entity(
+                    conn,
+                    entity["name"],
+                    entity.get("entityType") or entity["name"],
+                    entity.get("observations") or [],
+                )
+
+    def delete_entity(self, name: str) -> None:
+        with self.transaction() as conn:
+            self._delete_entity(conn, name)
+
+    def upsert_entity(self, name: str, entity_type: str, observations: Sequence[str]) -> None:
+        """Replace an entity and all its observations atomically."""
+        with self.transaction() as conn:
+            self._delete_entity(conn, name)
+            self._insert_entity(conn, name, entity_type, observations)
+
+    def upsert_json(self, name: str, payload: Dict[str, Any], entity_type: Optional[str] = None) -> None:
+        """Store payload as the single JSON observation of entity `name` (resume_profile, job_intake)."""
+        self.upsert_entity(name, entity_type or name, [json.dumps(payload, indent=2)])
+
+    # ----------------------
+    # Reads
+    # ----------------------
+    def get_latest_observation(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return {id, content, created_at} of the newest observation for name, or None."""
+        return self.get_latest_observations([name]).get(name)
+
+    def get_latest_observations(self, names: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Newest observation per entity name, fetched in one query."""
+        names = list(dict.fromkeys(names))
+        if not names:
+            return {}
+
+        placeholders = ",".join("?" for _ in names)
+        with self.connection() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT o.entity_name, o.id, o.content, o.created_at
+                FROM observations o
+                WHERE o.entity_name IN ({placeholders})
+                  AND o.id = (
+                      SELECT o2.id FROM observations o2
+                      WHERE o2.entity_name = o.entity_name
+                      ORDER BY o2.created_at DESC, o2.id DESC
+                      LIMIT 1
+                  )
+                """,
+                names,
+            ).fetchall()
+
+        return {
+            entity_name: {"id": obs_id, "content": content, "created_at": created_at}
+            for entity_name, obs_id, content, created_at in rows
+        }
+
+
+# ======================================
+# Process-wide store registry (one pool per DB file)
+# ======================================
+
+_stores: Dict[str, MemoryStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_memory_store(db_path: str | Path, pool_size: int = 4) -> MemoryStore:
+    key = str(Path(db_path).resolve())
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = MemoryStore(db_path, pool_size=pool_size)
+            _stores[key] = store
+            logger.info("Opened memory store at %s", db_path)
+        return store
+
+
+def close_memory_store(db_path: str | Path) -> None:
+    key = str(Path(db_path).resolve())
+    with _stores_lock:
+        store = _stores.pop(key, None)
+    if store is not None:
+        store.close()
+        logger.info("Closed memory store at %s", db_path)
+
+
+def close_all_memory_stores() -> None:
+    with _stores_lock:
+        stores = list(_stores.values())
+        _stores.clear()
+    for store in stores:
+        store.close()
@@ -0,0 +1,140 @@
+# memory_saving/profile_repository.py
+
+"""
+Async, cached reads of the user profile (resume_profile + job_intake).
+
+Research, presenter and advisor phases all load the same two entities from
+the run's memory DB. ProfileRepository reads them in one query over the
+pooled MemoryStore connection, off the event loop, and keeps the parsed JSON
+for a short TTL keyed by (entity, observation id). Entries are dropped as
+soon as the store records a write, so a re-intake is visible immediately.
+"""
+
+import asyncio
+import copy
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from memory_saving.memory_store import MemoryStore, get_memory_store
+from utils.read_yaml import read_yaml
+from utils.logger import logging
+
+logger = logging.getLogger(__name__)
+
+config = read_yaml(Path("config/master_config.yaml"))
+
+RESUME_ENTITY = "resume_profile"
+INTAKE_ENTITY = "job_intake"
+
+
+class _CachedEntity:
+    __slots__ = ("observation_id", "value", "write_version", "expires_at")
+
+    def __init__(self, observation_id: Optional[int], value: Optional[Dict[str, Any]], write_version: int, expires_at: float):
+        self.observation_id = observation_id
+        self.value = value
+        self.write_version = write_version
+        self.expires_at = expires_at
+
+
+class ProfileRepository:
+    """
+    Per-process cache of parsed profile entities, one MemoryStore per DB.
+
+    get_entities() answers from memory while an entry is younger than
+    ttl_seconds and its store has not been written since; otherwise it fetches
+    every missing entity in one query. Parsed JSON is reused when the newest
+    observation id has not changed.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0):
+        self.ttl_seconds = ttl_seconds
+        self._cache: Dict[Tuple[str, str], _CachedEntity] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(db_path: str | Path, entity: str) -> Tuple[str, str]:
+        return (str(Path(db_path).resolve()), entity)
+
+    def _fresh(self, entry: Optional[_CachedEntity], store: MemoryStore, now: float) -> bool:
+        return (
+            entry is not None
+            and entry.expires_at > now
+            and entry.write_version == store.write_version
+        )
+
+    def get_entities(self, db_path: str | Path, entities: Sequence[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Blocking read; returns {entity: parsed JSON or None}. Callers get deep copies."""
+        db_path = Path(db_path)
+        store = get_memory_store(db_path)
+        now = time.monotonic()
+
+        result: Dict[str, Optional[Dict[str, Any]]] = {}
+        missing = []
+        with self._lock:
+            for entity in entities:
+                entry = self._cache.get(self._key(db_path, entity))
+                if self._fresh(entry, store, now):
+                    result[entity] = entry.value
+                    self.hits += 1
+                else:
+                    missing.append(entity)
+                    self.misses += 1
+
+        if missing:
+            version = store.write_version
+            rows = store.get_latest_observations(missing)
+            expires_at = time.monotonic() + self.ttl_seconds
+
+            with self._lock:
+                for entity in missing:
+                    key = self._key(db_path, entity)
+                    row = rows.get(entity)
+                    obs_id = row["id"] if row else None
+                    previous = self._cache.get(key)
+
+                    if previous is not None and obs_id is not None and previous.observation_id == obs_id:
+                        value = previous.value
+                    else:
+                        value = _parse_observation(entity, row["content"]) if row else None
+                        if row is None:
+                            logger.info("No observations found for entity_name=%s", entity)
+
+                    self._cache[key] = _CachedEntity(obs_id, value, version, expires_at)
+                    result[entity] = value
+
+        return {entity: copy.deepcopy(value) for entity, value in result.items()}
+
+    async def get_entities_async(self, db_path: str | Path, entities: Sequence[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        return await asyncio.to_thread(self.get_entities, db_path, entities)
+
+    def invalidate(self, db_path: str | Path | None = None) -> None:
+        """Drop cached entries for one DB (or all of them)."""
+        with self._lock:
+            if db_path is None:
+                self._cache.clear()
+                return
+            db_key = str(Path(db_path).resolve())
+            for key in [k for k in self._cache if k[0] == db_key]:
+                del self._cache[key]
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._cache), "hits": self.hits, "misses": self.misses}
+
+
+def _parse_observation(entity: str, content: str) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError:
+        logger.error("Invalid JSON in observation for entity_name=%s", entity)
+        return None
+
+
+profile_repository = ProfileRepository(
+    ttl_seconds=float(config.get("profile_cache_ttl_seconds", 60)),
+)
@@ -0,0 +1,276 @@
+# memory_saving/resume_extraction_service.py
+
+"""
+Process-pool resume text extraction.
+
+pdfplumber/python-docx parsing is CPU-bound and used to run inside the
+event loop, stalling /status, /health and every other request while a
+large PDF was parsed. ResumeExtractionService runs extract_resume_text in
+worker processes (resume_extraction in config/master_config.yaml):
+
+- workers: number of worker slots (0 runs extraction in a thread instead);
+- timeout_seconds: limit for one task (a file, or one PDF page chunk);
+- max_file_mb: larger files are rejected before any parsing;
+
+Each slot is its own single-process executor, so a timeout or a crashed
+worker (BrokenProcessPool) only takes down the slot that ran the offending
+task: that worker is killed and the slot restarts on next use, while other
+users' extractions keep running. A crashed file is retried once.
+
+PDFs longer than one chunk (pdf_extraction.chunk_pages) are split into page
+chunks that run on the slots in parallel and are joined in page order.
+
+Workers start from a "forkserver" (default) that only preloads
+resume_text_extraction: forking the API process itself ("fork") would copy
+a multi-threaded asyncio server (SQLite, httpx and to_thread workers) and
+can deadlock. max_tasks_per_child recycles workers (not with "fork").
+"""
+
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from memory_saving.resume_text_extraction import (
+    PDF_MAX_CHARS,
+    extract_in_worker,
+    extract_pdf_chunk_in_worker,
+    extract_resume_text,
+    join_pdf_pages,
+    pdf_page_ranges,
+)
+from utils.read_yaml import read_yaml
+from utils.logger import logging
+
+logger = logging.getLogger(__name__)
+
+config = read_yaml(Path("config/master_config.yaml"))
+_extraction_config = config.get("resume_extraction", {})
+
+# Modules the forkserver imports once, so workers start with the extractors loaded.
+WORKER_PRELOAD = ["memory_saving.resume_text_extraction"]
+
+
+class ResumeExtractionError(ValueError):
+    """Extraction was refused (file too large) or did not finish (timeout, worker crash)."""
+
+
+class _WorkerSlot:
+    """One worker process behind a single-worker executor, started lazily."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.executor: Optional[ProcessPoolExecutor] = None
+
+
+class ResumeExtractionService:
+    """
+    Async front end over a fixed set of lazily started worker slots.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        timeout_seconds: float = 60.0,
+        max_file_mb: float = 10.0,
+        start_method: str = "forkserver",
+        max_tasks_per_child: Optional[int] = 50,
+    ):
+        self.workers = max(0, int(workers))
+        self.timeout_seconds = float(timeout_seconds)
+        self.max_file_bytes = int(float(max_file_mb) * 1024 * 1024)
+        if start_method not in multiprocessing.get_all_start_methods():
+            logger.warning("Start method %s is not available here; using spawn", start_method)
+            start_method = "spawn"
+        self.start_method = start_method
+        self.max_tasks_per_child = max_tasks_per_child
+        self._slots: List[_WorkerSlot] = [_WorkerSlot(i) for i in range(self.workers)]
+        self._free: List[_WorkerSlot] = list(self._slots)
+        # Created per event loop (benchmarks run several loops against one service).
+        self._slot_semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.completed = 0
+        self.timeouts = 0
+        self.crashes = 0
+        self.rejected = 0
+
+    # ----------------------
+    # Worker slots
+    # ----------------------
+    def _executor(self, slot: _WorkerSlot) -> ProcessPoolExecutor:
+        with self._lock:
+            if slot.executor is None:
+                context = multiprocessing.get_context(self.start_method)
+                if self.start_method == "forkserver":
+                    context.set_forkserver_preload(WORKER_PRELOAD)
+                kwargs: Dict[str, Any] = {"max_workers": 1, "mp_context": context}
+                if self.start_method != "fork" and self.max_tasks_per_child:
+                    kwargs["max_tasks_per_child"] = int(self.max_tasks_per_child)
+                slot.executor = ProcessPoolExecutor(**kwargs)
+                logger.info("Started resume extraction worker %d (%s)", slot.index, self.start_method)
+            return slot.executor
+
+    def _recycle(self, slot: _WorkerSlot, executor: ProcessPoolExecutor) -> None:
+        """Kill the worker of one hung or broken slot; the slot starts a fresh one on next use."""
+        with self._lock:
+            if slot.executor is executor:
+                slot.executor = None
+        # ProcessPoolExecutor cannot cancel a running task, so its process is terminated directly.
+        for proc in list((getattr(executor, "_processes", None) or {}).values()):
+            if proc.is_alive():
+                proc.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    @asynccontextmanager
+    async def _lease(self) -> AsyncIterator[_WorkerSlot]:
+        loop = asyncio.get_running_loop()
+        if self._slot_semaphore is None or self._semaphore_loop is not loop:
+            self._slot_semaphore = asyncio.Semaphore(len(self._free))
+            self._semaphore_loop = loop
+        semaphore = self._slot_semaphore
+        async with semaphore:
+            slot = self._free.pop()
+            try:
+                yield slot
+            finally:
+                self._free.append(slot)
+
+    async def _run_in_slot(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """fn(*args) in a free worker slot; only that slot is recycled on timeout or crash."""
+        async with self._lease() as slot:
+            executor = self._executor(slot)
+            future = asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+            try:
+                return await asyncio.wait_for(future, timeout=self.timeout_seconds)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                self._recycle(slot, executor)
+                raise
+            except asyncio.CancelledError:
+                # The caller gave up (e.g. a sibling PDF chunk failed) while the worker is still busy.
+                self._recycle(slot, executor)
+                raise
+            except BrokenProcessPool:
+                self._recycle(slot, executor)
+                raise
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executors = [slot.executor for slot in self._slots if slot.executor is not None]
+            for slot in self._slots:
+                slot.executor = None
+        for executor in executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    # ----------------------
+    # Extraction
+    # ----------------------
+    def check_size(self, path: Path) -> None:
+        size = path.stat().st_size
+        if self.max_file_bytes and size > self.max_file_bytes:
+            self.rejected += 1
+            raise ResumeExtractionError(
+                f"Resume file is too large ({size / (1024 * 1024):.1f} MB; "
+                f"limit {self.max_file_bytes / (1024 * 1024):g} MB)."
+            )
+
+    async def extract(self, path: Path) -> str:
+        """extract_resume_text(path) off the event loop, with the size limit and timeout applied."""
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {path}")
+        self.check_size(path)
+
+        self.in_flight += 1
+        try:
+            if self.workers == 0:
+                text = await self._in_thread(path)
+            else:
+                text = await self._extract_in_pool(path)
+            self.completed += 1
+            return text
+        finally:
+            self.in_flight -= 1
+
+    async def _in_thread(self, path: Path) -> str:
+        try:
+            return await asyncio.wait_for(asyncio.to_thread(extract_resume_text, path), timeout=self.timeout_seconds)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise self._timeout_error(path)
+
+    def _timeout_error(self, path: Path) -> ResumeExtractionError:
+        return ResumeExtractionError(
+            f"Resume text extraction timed out after {self.timeout_seconds:.0f}s for {path.name}."
+        )
+
+    async def _extract_in_pool(self, path: Path) -> str:
+        for attempt in (1, 2):
+            try:
+                return await self._run_on_pool(path)
+            except asyncio.TimeoutError:
+                raise self._timeout_error(path)
+            except BrokenProcessPool:
+                # This file killed its worker; only that slot was recycled. Retry once.
+                self.crashes += 1
+                logger.warning("Resume extraction worker crashed on %s (attempt %d)", path.name, attempt)
+        raise ResumeExtractionError(f"Resume text extraction crashed for {path.name}.")
+
+    async def _run_on_pool(self, path: Path) -> str:
+        ranges = None
+        if path.suffix.lower() == ".pdf" and self.workers > 1:
+            try:
+                ranges = await asyncio.to_thread(pdf_page_ranges, path)
+            except Exception:
+                # Unreadable page tree: let the whole-file extractor produce the error.
+                ranges = None
+
+        if not ranges or len(ranges) == 1:
+            return await self._run_in_slot(extract_in_worker, str(path))
+
+        chunk_tasks = [
+            asyncio.ensure_future(self._run_in_slot(extract_pdf_chunk_in_worker, str(path), start, stop))
+            for start, stop in ranges
+        ]
+        try:
+            chunks = await asyncio.gather(*chunk_tasks)
+        except BaseException:
+            # One chunk failed: stop the others so their slots are freed (and recycled if busy).
+            for task in chunk_tasks:
+                task.cancel()
+            await asyncio.gather(*chunk_tasks, return_exceptions=True)
+            raise
+        pages = [text for chunk in chunks for text in chunk]
+        try:
+            return join_pdf_pages(path, pages, max_chars=PDF_MAX_CHARS)
+        except ValueError as e:
+            # Same message shape as extract_text_from_pdf, so image-only PDFs are still recognised.
+            raise ValueError(f"[PDF] Failed {path.name}: {str(e)}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "start_method": self.start_method,
+            "workers_running": sum(1 for slot in self._slots if slot.executor is not None),
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "timeouts": self.timeouts,
+            "crashes": self.crashes,
+            "rejected": self.rejected,
+            "max_file_mb": round(self.max_file_bytes / (1024 * 1024), 1),
+        }
+
+
+resume_extraction_service = ResumeExtractionService(
+    workers=int(_extraction_config.get("workers", 2)),
+    timeout_seconds=float(_extraction_config.get("timeout_seconds", 60)),
+    max_file_mb=float(_extraction_config.get("max_file_mb", 10)),
+    start_method=str(_extraction_config.get("start_method", "forkserver")),
+    max_tasks_per_child=_extraction_config.get("max_tasks_per_child", 50),
+)
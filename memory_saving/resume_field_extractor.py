@@ -0,0 +1,244 @@
+# memory_saving/resume_field_extractor.py
+
+"""
+Rule-based resume fields, so the parser LLM does not have to produce them.
+
+- extract_contact_fields: email, phone and profile links from the raw text;
+- normalize_resume_date: the date forms the parser used to be asked to
+  normalize ("Jun 2023", "06/2023", "2023-06", "Q2 2024", "Summer 2023",
+  "'23", "Present") to 'YYYY-MM' or 'YYYY';
+- complete_parsed_resume: merges both into the parser output, which carries
+  dates exactly as written and no email/phone/current fields.
+
+The LLM still reads names, titles, companies and locations, where layout and
+context matter; these rules only cover fields with a fixed shape.
+"""
+
+import re
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+# Contact details are searched in the first lines (the contact block) and in labelled lines.
+CONTACT_HEADER_LINES = 25
+MAX_LINKS = 10
+
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}")
+_URL_RE = re.compile(
+    r"(?:https?://|www\.)[^\s|,;()<>\"']+"
+    r"|\b(?:linkedin\.com|github\.com|gitlab\.com|bitbucket\.org|medium\.com|kaggle\.com|behance\.net)/[^\s|,;()<>\"']+",
+    re.IGNORECASE,
+)
+_PHONE_RE = re.compile(r"(?<![\w/])\+?\(?\d[\d ().-]{5,20}\d(?![\w/])")
+_PHONE_LABEL_RE = re.compile(r"\b(?:phone|tel|telephone|mobile|mob|cell|contact)\b", re.IGNORECASE)
+# "Student ID:", "Roll No." right before a number; group 1 is set for "Phone No.", "Mobile No:".
+_ID_LABEL_RE = re.compile(
+    r"(\b(?:phone|tel|telephone|mobile|mob|cell|contact)\s*)?\b(?:id|no)\b\.?\s*[:#-]?\s*$",
+    re.IGNORECASE,
+)
+# Unlabelled bare digit runs read as a phone: a 10-digit number, with an optional trunk "0" or "91" prefix.
+_BARE_PHONE_RE = re.compile(r"(?:0|91)?\d{10}")
+_NUMERIC_DATE_RE = re.compile(r"\d{1,4}[./-]\d{1,2}(?:[./-]\d{1,4})?")
+
+MONTHS = {
+    "jan": 1, "january": 1, "feb": 2, "february": 2, "mar": 3, "march": 3,
+    "apr": 4, "april": 4, "may": 5, "jun": 6, "june": 6, "jul": 7, "july": 7,
+    "aug": 8, "august": 8, "sep": 9, "sept": 9, "september": 9, "oct": 10, "october": 10,
+    "nov": 11, "november": 11, "dec": 12, "december": 12,
+}
+# Season -> first month of the season (northern hemisphere, as the parser prompt assumed).
+SEASONS = {"spring": 3, "summer": 6, "fall": 9, "autumn": 9, "winter": 12}
+PRESENT_WORDS = frozenset({
+    "present", "current", "currently", "now", "ongoing", "today", "till date", "to date", "date", "till now",
+})
+
+_YEAR = r"(\d{4}|'\d{2})"
+_DATE_PATTERNS = (
+    # 2023-06, 2023/6, 2023.06.15
+    ("ym", re.compile(r"^(\d{4})[-/.](\d{1,2})(?:[-/.]\d{1,2})?$")),
+    # 06/2023, 6-2023
+    ("my", re.compile(r"^(\d{1,2})[-/.](\d{4})$")),
+    # 15/06/2023 or 06/15/2023
+    ("dmy", re.compile(r"^(\d{1,2})[-/.](\d{1,2})[-/.](\d{4})$")),
+    # Q2 2024, Q2-2024, 2024 Q2
+    ("q", re.compile(r"^q([1-4])[\s/-]*" + _YEAR + "$")),
+    ("yq", re.compile(r"^(\d{4})[\s/-]*q([1-4])$")),
+    # Jun 2023, June, 2023, Sept. '23, Summer 2023
+    ("word", re.compile(r"^([a-z]+)\.?,?[\s/-]*" + _YEAR + "$")),
+    # 2023 June
+    ("yword", re.compile(r"^(\d{4})[\s/-]+([a-z]+)\.?$")),
+    ("y", re.compile(r"^" + _YEAR + "$")),
+)
+_ANY_YEAR_RE = re.compile(r"\b(19\d{2}|20\d{2})\b")
+
+
+def _dedupe(items: List[str]) -> List[str]:
+    seen = set()
+    out: List[str] = []
+    for item in items:
+        key = item.casefold()
+        if key not in seen:
+            seen.add(key)
+            out.append(item)
+    return out
+
+
+def _is_phone(candidate: str) -> bool:
+    digits = re.sub(r"\D", "", candidate)
+    if not 7 <= len(digits) <= 15:
+        return False
+    groups = re.findall(r"\d+", candidate)
+    if all(len(g) == 4 and g[:2] in ("19", "20") for g in groups):
+        # A year or a year range ("2019 - 2023").
+        return False
+    return not _NUMERIC_DATE_RE.fullmatch(candidate.strip())
+
+
+def _is_id_number(prefix: str) -> bool:
+    """The text before a number ends with an ID / number label that is not a phone label."""
+    match = _ID_LABEL_RE.search(prefix)
+    return bool(match) and not match.group(1)
+
+
+def extract_contact_fields(text: str, header_lines: int = CONTACT_HEADER_LINES) -> Dict[str, Any]:
+    """
+    {"email", "phone", "links"} found in text ("" / [] when absent).
+
+    A phone is taken from the header block or from a line with a phone
+    label. A bare digit run never counts after an "ID" / "No." label
+    ("Student ID 20231234567", "Roll No. 1234567890"); without a phone label
+    it must also look like a phone number (10 digits, optionally with a
+    "0" or "91" prefix), while formatted numbers ("+", separators or
+    parentheses) are taken as they are.
+    """
+    lines = (text or "").splitlines()
+    emails = _EMAIL_RE.findall(text or "")
+
+    phone = ""
+    for i, line in enumerate(lines):
+        labelled = bool(_PHONE_LABEL_RE.search(line))
+        if i >= header_lines and not labelled:
+            continue
+        cleaned = _EMAIL_RE.sub(" ", line)
+        for match in _PHONE_RE.finditer(cleaned):
+            candidate = match.group(0).strip(" .-")
+            if not _is_phone(candidate):
+                continue
+            if candidate.isdigit() and (
+                _is_id_number(cleaned[:match.start()])
+                or not (labelled or _BARE_PHONE_RE.fullmatch(candidate))
+            ):
+                continue
+            phone = " ".join(candidate.split())
+            break
+        if phone:
+            break
+
+    links = []
+    for match in _URL_RE.finditer(_EMAIL_RE.sub(" ", text or "")):
+        links.append(match.group(0).rstrip(".:"))
+
+    return {
+        "email": emails[0] if emails else "",
+        "phone": phone,
+        "links": _dedupe(links)[:MAX_LINKS],
+    }
+
+
+def _year(token: str) -> Optional[int]:
+    if token.startswith("'"):
+        yy = int(token[1:])
+        # '23 -> 2023, '98 -> 1998
+        return 2000 + yy if yy <= date.today().year % 100 + 1 else 1900 + yy
+    return int(token)
+
+
+def _format(year: Optional[int], month: Optional[int] = None) -> str:
+    if year is None or not 1900 <= year <= 2100:
+        return ""
+    if month is not None and 1 <= month <= 12:
+        return f"{year:04d}-{month:02d}"
+    return f"{year:04d}"
+
+
+def is_present_date(value: Any) -> bool:
+    return " ".join(str(value or "").casefold().strip(" .").split()) in PRESENT_WORDS
+
+
+def normalize_resume_date(value: Any) -> str:
+    """
+    'YYYY-MM' when the month is known, 'YYYY' when only the year is, "" for
+    an empty, unreadable or ongoing ("Present") date.
+    """
+    text = " ".join(str(value or "").casefold().strip(" .,").split())
+    if not text or text in PRESENT_WORDS:
+        return ""
+
+    for kind, pattern in _DATE_PATTERNS:
+        match = pattern.match(text)
+        if not match:
+            continue
+        a, b = match.group(1), match.group(2) if pattern.groups > 1 else None
+        if kind == "ym":
+            return _format(int(a), int(b))
+        if kind == "my":
+            return _format(int(b), int(a))
+        if kind == "dmy":
+            first, second, year = int(a), int(b), int(match.group(3))
+            # Day-first or month-first: only unambiguous when one part cannot be a month.
+            if first > 12 >= second:
+                return _format(year, second)
+            if second > 12 >= first:
+                return _format(year, first)
+            return _format(year, first if first == second else None)
+        if kind == "q":
+            return _format(_year(b), (int(a) - 1) * 3 + 1)
+        if kind == "yq":
+            return _format(int(a), (int(b) - 1) * 3 + 1)
+        if kind == "word":
+            month = MONTHS.get(a) or SEASONS.get(a)
+            if month:
+                return _format(_year(b), month)
+            break
+        if kind == "yword":
+            month = MONTHS.get(b) or SEASONS.get(b)
+            if month:
+                return _format(int(a), month)
+            break
+        if kind == "y":
+            return _format(_year(a))
+
+    # Anything else with a year in it ("circa 2019", "2019 (expected)") keeps the year.
+    years = _ANY_YEAR_RE.findall(text)
+    return _format(int(years[0])) if years else ""
+
+
+def complete_parsed_resume(parsed: Dict[str, Any], contact: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Parser output -> Resume-shaped dict: contact fields filled in, dates
+    normalized, and "current" set from an ongoing end date.
+    """
+    resume = dict(parsed or {})
+    basic = dict(resume.get("basic_info") or {})
+    for key in ("email", "phone", "links"):
+        if contact.get(key) and not basic.get(key):
+            basic[key] = contact[key]
+    resume["basic_info"] = basic
+
+    experience = []
+    for item in resume.get("experience") or []:
+        item = dict(item)
+        end_raw = item.get("end_date", "")
+        item["current"] = bool(item.get("current")) or is_present_date(end_raw)
+        item["start_date"] = normalize_resume_date(item.get("start_date", ""))
+        item["end_date"] = normalize_resume_date(end_raw)
+        experience.append(item)
+    resume["experience"] = experience
+
+    education = []
+    for item in resume.get("education") or []:
+        item = dict(item)
+        item["start_date"] = normalize_resume_date(item.get("start_date", ""))
+        item["end_date"] = normalize_resume_date(item.get("end_date", ""))
+        education.append(item)
+    resume["education"] = education
+    return resume
@@ -0,0 +1,87 @@
+# memory_saving/resume_parse_cache.py
+
+"""
+Content-addressed cache for resume intake.
+
+Re-uploading the same resume (users often only tweak their preferences)
+should not re-run text extraction or the resume parser LLM. Two entries are
+kept in one SqliteCache (resume_cache in config/master_config.yaml):
+
+- extracted text, keyed by sha256 of the file bytes + RESUME_TEXT_CACHE_VERSION
+- parser LLM output (ParsedResume), keyed by sha256 of the parser input (the
+  extracted text after resume_text_normalizer) + parser model + parser
+  fingerprint (ParsedResume schema and instructions) + RESUME_PARSE_CACHE_VERSION
+
+Keying the parse on the text rather than the file means a new extractor
+that yields the same text still reuses the parse, and a new model or schema
+re-parses without re-extracting. Bump the versions when extraction or
+parsing changes in a way the keys do not capture.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from utils.read_yaml import read_yaml
+from utils.sqlite_cache import SqliteCache, make_cache_key
+from utils.logger import logging
+
+logger = logging.getLogger(__name__)
+
+config = read_yaml(Path("config/master_config.yaml"))
+_resume_cache_config = config.get("resume_cache", {})
+
+# 2: PDF pages are separated by resume_text_extraction.PAGE_BREAK.
+RESUME_TEXT_CACHE_VERSION = "2"
+RESUME_PARSE_CACHE_VERSION = "1"
+
+# Holds resume text and parsed personal details; keep it next to the other caches, outside outputs/.
+resume_cache = SqliteCache(
+    db_path=_resume_cache_config.get("path", "cache/resume_cache.db"),
+    namespace="resume",
+    ttl_seconds=float(_resume_cache_config.get("ttl_days", 7)) * 24 * 60 * 60,
+    max_bytes=int(float(_resume_cache_config.get("max_mb", 64)) * 1024 * 1024),
+    enabled=bool(_resume_cache_config.get("enabled", True)),
+)
+
+
+def file_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def text_cache_key(content_hash: str) -> str:
+    return make_cache_key("resume_text", content_hash, version=RESUME_TEXT_CACHE_VERSION)
+
+
+def parse_cache_key(raw_text: str, model: str, parser_fingerprint: str) -> str:
+    text_hash = hashlib.sha256(raw_text.encode("utf-8")).hexdigest()
+    return make_cache_key(
+        "resume_parse",
+        text_hash,
+        model=model,
+        parser=parser_fingerprint,
+        version=RESUME_PARSE_CACHE_VERSION,
+    )
+
+
+async def get_cached_text(content_hash: str) -> Optional[str]:
+    text = await resume_cache.aget(text_cache_key(content_hash))
+    return text if isinstance(text, str) and text.strip() else None
+
+
+async def set_cached_text(content_hash: str, raw_text: str) -> None:
+    if raw_text and raw_text.strip():
+        await resume_cache.aset(text_cache_key(content_hash), raw_text)
+
+
+async def get_cached_parse(raw_text: str, model: str, parser_fingerprint: str) -> Optional[Dict[str, Any]]:
+    parsed = await resume_cache.aget(parse_cache_key(raw_text, model, parser_fingerprint))
+    return parsed if isinstance(parsed, dict) else None
+
+
+async def set_cached_parse(raw_text: str, model: str, parser_fingerprint: str, parsed: Dict[str, Any]) -> None:
+    await resume_cache.aset(parse_cache_key(raw_text, model, parser_fingerprint), parsed)
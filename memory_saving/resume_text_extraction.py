@@ -0,0 +1,323 @@
+# memory_saving/resume_text_extraction.py
+
+"""
+Resume text extractors (PDF via pypdf with a per-page pdfplumber fallback,
+DOCX via one streaming iterparse pass over its XML parts).
+
+Kept free of the agent/LLM imports in save_user_resume_to_memory so
+worker processes of the extraction service (resume_extraction_service.py)
+start quickly. Every extractor raises ValueError when no text can be read.
+"""
+
+import zipfile
+import xml.etree.ElementTree as ET
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pdfplumber
+from pypdf import PdfReader
+
+from utils.read_yaml import read_yaml
+
+config = read_yaml(Path("config/master_config.yaml"))
+_pdf_config = config.get("pdf_extraction", {})
+# "fast": pypdf text layer with per-page pdfplumber fallback; "pdfplumber": layout analysis on every page.
+PDF_ENGINE = str(_pdf_config.get("engine", "fast")).lower()
+PDF_MAX_PAGES = int(_pdf_config.get("max_pages", 30))
+PDF_MAX_CHARS = int(_pdf_config.get("max_chars", 150000))
+# Separates PDF pages in extracted text so the normalizer can find running headers/footers.
+PAGE_BREAK = "\f"
+# Pages whose text layer is shorter than this go to pdfplumber.
+PDF_MIN_PAGE_CHARS = int(_pdf_config.get("min_page_chars", 30))
+# Pages per parallel chunk in the extraction pool.
+PDF_CHUNK_PAGES = int(_pdf_config.get("chunk_pages", 4))
+
+
+# =========================
+# PDF EXTRACTOR
+# =========================
+# The pypdf text layer is tried first; pdfplumber (layout + tables) only runs for pages where
+# it comes back (nearly) empty. OCR based fallbacks are disabled in this deployment.
+def _plumber_page_text(page, page_num: int) -> str:
+    """Native pdfplumber text, then a tables fallback (no OCR)."""
+    native_text = page.extract_text() or ""
+    if native_text.strip():
+        return native_text.strip()
+
+    table_text: List[str] = []
+    for table in page.extract_tables() or []:
+        for row in table or []:
+            row_text = [str(cell or "") for cell in row if cell]
+            if row_text:
+                table_text.append(" | ".join(row_text))
+    if table_text:
+        return f"[PAGE {page_num} TABLES]\n" + "\n".join(table_text)
+    return ""
+
+
+def pdf_page_count(path: Path) -> int:
+    try:
+        return len(PdfReader(str(path)).pages)
+    except Exception:
+        with pdfplumber.open(str(path)) as pdf:
+            return len(pdf.pages)
+
+
+def pdf_page_ranges(
+    path: Path,
+    chunk_pages: int = PDF_CHUNK_PAGES,
+    max_pages: int = PDF_MAX_PAGES,
+) -> List[Tuple[int, int]]:
+    """[start, stop) page chunks covering the first max_pages pages (0 = no cap)."""
+    total = pdf_page_count(path)
+    if max_pages:
+        total = min(total, max_pages)
+    step = max(1, chunk_pages)
+    return [(start, min(start + step, total)) for start in range(0, total, step)]
+
+
+def extract_pdf_pages(
+    path: Path,
+    start: int,
+    stop: int,
+    engine: str = PDF_ENGINE,
+    max_chars: int = 0,
+    stats: Optional[Dict[str, int]] = None,
+) -> List[str]:
+    """
+    Text of pages [start, stop) in order ("" for pages without text). Stops
+    early once max_chars (0 = no cap) characters have been collected.
+    """
+    texts: List[str] = []
+    layout_pages = 0
+    reader = None
+    if engine == "fast":
+        try:
+            reader = PdfReader(str(path))
+        except Exception as e:
+            print(f"[PDF] pypdf could not open {path.name} ({e}); using pdfplumber")
+
+    with ExitStack() as stack:
+        plumber = None
+        collected = 0
+        for index in range(start, stop):
+            text = ""
+            if reader is not None:
+                try:
+                    text = (reader.pages[index].extract_text() or "").strip()
+                except Exception:
+                    text = ""
+
+            if len(text) < PDF_MIN_PAGE_CHARS:
+                # Needs layout analysis: open pdfplumber lazily, once per chunk.
+                if plumber is None:
+                    plumber = stack.enter_context(pdfplumber.open(str(path)))
+                page = plumber.pages[index]
+                try:
+                    text = _plumber_page_text(page, index + 1) or text
+                finally:
+                    # Drop the page's parsed objects so memory does not grow with page count.
+                    page.close()
+                layout_pages += 1
+
+            texts.append(text)
+            collected += len(text)
+            if max_chars and collected >= max_chars:
+                break
+
+    if stats is not None:
+        stats["pages"] = stats.get("pages", 0) + len(texts)
+        stats["layout_pages"] = stats.get("layout_pages", 0) + layout_pages
+    return texts
+
+
+def join_pdf_pages(path: Path, pages: List[str], max_chars: int = PDF_MAX_CHARS) -> str:
+    result = f"\n{PAGE_BREAK}\n".join(text for text in pages if text)
+    if not result.strip():
+        raise_extraction_error(path)
+    if max_chars and len(result) > max_chars:
+        print(f"[PDF] {path.name}: text capped at {max_chars} chars")
+        result = result[:max_chars]
+    return result
+
+
+def extract_text_from_pdf(path: Path) -> str:
+    """
+    PDF extraction: pypdf text layer, pdfplumber per page where needed, at most
+    pdf_extraction.max_pages pages and max_chars characters.
+    """
+    try:
+        stats: Dict[str, int] = {}
+        ranges = pdf_page_ranges(path)
+        stop = ranges[-1][1] if ranges else 0
+        pages = extract_pdf_pages(path, 0, stop, max_chars=PDF_MAX_CHARS, stats=stats)
+        result = join_pdf_pages(path, pages)
+
+        print(
+            f"[PDF] {path.name}: {stats.get('pages', 0)} pages "
+            f"({stats.get('layout_pages', 0)} via pdfplumber), {len(result)} chars"
+        )
+        return result
+
+    except Exception as e:
+        print(f"[PDF] CRITICAL ERROR: {e}")
+        raise ValueError(f"[PDF] Failed {path.name}: {str(e)}")
+
+
+def raise_extraction_error(path: Path):
+    raise ValueError(f"[PDF] No text from {path.name}. Image-only/corrupted?")
+
+
+# =========================
+# DOCX EXTRACTOR
+# =========================
+# One streaming pass per XML part (headers, body, footers) in document order. The old
+# extractor read paragraphs, then table cells, then every w:t again, so most text reached
+# the resume parser two or three times.
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+_DOCX_BLOCKS = (_W + "p", _W + "tbl")
+
+
+def _docx_parts(names: List[str]) -> List[str]:
+    headers = sorted(n for n in names if n.startswith("word/header") and n.endswith(".xml"))
+    footers = sorted(n for n in names if n.startswith("word/footer") and n.endswith(".xml"))
+    body = ["word/document.xml"] if "word/document.xml" in names else []
+    return headers + body + footers
+
+
+def _iter_docx_part_lines(xml_file) -> Iterator[str]:
+    """
+    Lines of one WordprocessingML part: a paragraph per line, a table row as
+    "cell | cell". Text-box paragraphs come out at their anchor, once: the
+    VML copy under mc:Fallback is skipped. Finished blocks are cleared from
+    the tree, so memory stays bounded by the largest paragraph or table.
+    """
+    paragraphs: List[List[str]] = []   # open w:p buffers (text boxes nest inside paragraphs)
+    cells: List[List[str]] = []        # open w:tc buffers
+    rows: List[List[str]] = []         # open w:tr buffers
+    parents: List[ET.Element] = []
+    fallback_depth = 0
+
+    for event, elem in ET.iterparse(xml_file, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            parents.append(elem)
+            if tag == _MC_FALLBACK:
+                fallback_depth += 1
+            elif fallback_depth:
+                continue
+            elif tag == _W + "p":
+                paragraphs.append([])
+            elif tag == _W + "tc":
+                cells.append([])
+            elif tag == _W + "tr":
+                rows.append([])
+            continue
+
+        parents.pop()
+        if tag == _MC_FALLBACK:
+            fallback_depth -= 1
+        elif fallback_depth:
+            pass
+        elif tag == _W + "t" and paragraphs:
+            if elem.text:
+                paragraphs[-1].append(elem.text)
+        elif tag in (_W + "tab", _W + "br", _W + "cr") and paragraphs:
+            paragraphs[-1].append(" ")
+        elif tag == _W + "p" and paragraphs:
+            text = " ".join("".join(paragraphs.pop()).split())
+            if text:
+                if cells:
+                    cells[-1].append(text)
+                else:
+                    yield text
+        elif tag == _W + "tc" and cells:
+            text = " ".join(cells.pop())
+            if text and rows:
+                rows[-1].append(text)
+        elif tag == _W + "tr" and rows:
+            row = rows.pop()
+            if row:
+                line = " | ".join(row)
+                if cells:
+                    cells[-1].append(line)   # nested table
+                else:
+                    yield line
+
+        if tag in _DOCX_BLOCKS and parents and not paragraphs and not cells:
+            # Top-level block done: drop it from its parent.
+            elem.clear()
+            parents[-1].remove(elem)
+
+
+def iter_docx_lines(path: Path) -> Iterator[str]:
+    """All lines of a DOCX in document order; repeated header/footer lines and consecutive duplicates are dropped."""
+    with zipfile.ZipFile(str(path), "r") as zip_ref:
+        seen_margin_lines = set()
+        previous = None
+        for part in _docx_parts(zip_ref.namelist()):
+            is_margin = part != "word/document.xml"
+            with zip_ref.open(part) as xml_file:
+                for line in _iter_docx_part_lines(xml_file):
+                    if is_margin:
+                        if line in seen_margin_lines:
+                            continue
+                        seen_margin_lines.add(line)
+                    if line == previous:
+                        continue
+                    previous = line
+                    yield line
+
+
+def extract_text_from_docx(path: Path) -> str:
+    """Single-pass DOCX extraction (headers, body, tables, text boxes, footers)."""
+    try:
+        print(f"[DOCX] Processing {path.name}")
+        result = "\n".join(iter_docx_lines(path))
+        print(f"[DOCX] TOTAL: {len(result)} chars")
+        return result if result.strip() else raise_extraction_error(path)
+
+    except Exception as e:
+        print(f"[DOCX] ERROR: {e}")
+        raise ValueError(f"[DOCX] Failed: {e}")
+
+
+def extract_text_from_docx_xml(path: Path) -> str:
+    """Kept for existing callers: the single-pass text, or "" when the file cannot be read."""
+    try:
+        return "\n".join(iter_docx_lines(path))
+    except Exception:
+        return ""
+
+
+# =========================
+# UNIVERSAL EXTRACTOR
+# =========================
+def extract_resume_text(path: Path) -> str:
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+    ext = path.suffix.lower()
+    if ext == ".pdf":
+        return extract_text_from_pdf(path)
+    elif ext == ".docx":
+        return extract_text_from_docx(path)
+    elif ext in [".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp"]:
+        # OCR is disabled - image resumes are not supported in this deployment
+        raise ValueError(
+            f"Image resume formats like {ext} are not supported in this environment. "
+            f"Please upload a PDF or DOCX file instead."
+        )
+    else:
+        raise ValueError(f"Unsupported: {ext}. Use PDF, DOCX, PNG, or JPG")
+
+
+def extract_in_worker(path: str) -> str:
+    """Process-pool entry point used by resume_extraction_service (takes a str so it pickles cheaply)."""
+    return extract_resume_text(Path(path))
+
+
+def extract_pdf_chunk_in_worker(path: str, start: int, stop: int) -> List[str]:
+    """Process-pool entry point for one page chunk of a large PDF."""
+    return extract_pdf_pages(Path(path), start, stop, max_chars=PDF_MAX_CHARS)
@@ -0,0 +1,286 @@
+# memory_saving/resume_text_normalizer.py
+
+"""
+Resume text cleanup before the parser LLM.
+
+Extracted text carries a lot the parser does not need: headers/footers
+repeated at the top or bottom of every page (PDF pages are separated by
+PAGE_BREAK), explicit page markers ("[PAGE 2 TABLES]", "Page 1 of 3"),
+empty table cells, bullet glyphs and whitespace runs. normalize_resume_text
+removes them, detects sections from their headings and, when the text is
+still over the token budget (resume_normalization in
+config/master_config.yaml), trims the least informative sections first:
+references and hobbies go before projects, experience goes last and the
+contact header is never trimmed.
+
+Tokens are estimated as chars / chars_per_token; this only has to be close
+enough to bound the prompt, not exact.
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from memory_saving.resume_text_extraction import PAGE_BREAK
+from utils.read_yaml import read_yaml
+
+config = read_yaml(Path("config/master_config.yaml"))
+_normalization_config = config.get("resume_normalization", {})
+
+NORMALIZATION_ENABLED = bool(_normalization_config.get("enabled", True))
+TOKEN_BUDGET = int(_normalization_config.get("token_budget", 6000))
+CHARS_PER_TOKEN = float(_normalization_config.get("chars_per_token", 4))
+# Lines this close to a page break that recur at another page's edge are running headers/footers.
+PAGE_EDGE_LINES = int(_normalization_config.get("page_edge_lines", 3))
+
+SECTION_HEADER = "header"
+SECTION_OTHER = "other"
+
+# Heading text (lowercase, no punctuation) -> section name.
+SECTION_HEADINGS = {
+    "summary": "summary",
+    "professional summary": "summary",
+    "profile": "summary",
+    "professional profile": "summary",
+    "about me": "summary",
+    "objective": "summary",
+    "career objective": "summary",
+    "experience": "experience",
+    "work experience": "experience",
+    "professional experience": "experience",
+    "employment": "experience",
+    "employment history": "experience",
+    "work history": "experience",
+    "career history": "experience",
+    "internships": "experience",
+    "education": "education",
+    "academic background": "education",
+    "academics": "education",
+    "qualifications": "education",
+    "skills": "skills",
+    "technical skills": "skills",
+    "core skills": "skills",
+    "key skills": "skills",
+    "core competencies": "skills",
+    "tools and technologies": "skills",
+    "projects": "projects",
+    "personal projects": "projects",
+    "academic projects": "projects",
+    "key projects": "projects",
+    "publications": "publications",
+    "research": "publications",
+    "certifications": "certifications",
+    "certificates": "certifications",
+    "licenses and certifications": "certifications",
+    "courses": "courses",
+    "coursework": "courses",
+    "relevant coursework": "courses",
+    "training": "courses",
+    "awards": "awards",
+    "honors and awards": "awards",
+    "achievements": "awards",
+    "accomplishments": "awards",
+    "languages": "languages",
+    "volunteering": "volunteer",
+    "volunteer experience": "volunteer",
+    "extracurricular activities": "activities",
+    "activities": "activities",
+    "leadership": "activities",
+    "interests": "interests",
+    "hobbies": "interests",
+    "hobbies and interests": "interests",
+    "personal details": "personal",
+    "personal information": "personal",
+    "declaration": "references",
+    "references": "references",
+}
+
+# Trim order under the token budget: lowest first. The header (name, contact) is never trimmed.
+SECTION_PRIORITY = {
+    "references": 0,
+    "interests": 1,
+    "personal": 1,
+    "activities": 2,
+    "volunteer": 2,
+    "courses": 3,
+    "awards": 3,
+    "languages": 4,
+    "publications": 4,
+    "certifications": 5,
+    SECTION_OTHER: 5,
+    "summary": 6,
+    "projects": 7,
+    "education": 8,
+    "skills": 9,
+    "experience": 10,
+}
+
+_PAGE_MARKER_RE = re.compile(
+    r"^(?:\[page \d+(?: tables)?\]|page \d+(?:\s*(?:of|/)\s*\d+)?)$",
+    re.IGNORECASE,
+)
+_BOILERPLATE_RE = re.compile(
+    r"^(?:curriculum vitae|resume|résumé|cv|confidential"
+    r"|references (?:are )?available (?:up)?on request"
+    r"|i hereby declare\b.*)$",
+    re.IGNORECASE,
+)
+_BULLET_RE = re.compile(r"^[\u2022\u25cf\u25aa\u25a0\u25e6\u25cb\u2023\u2043\u2219\u00b7\u25ba\u25b6\u2713\u2714\u27a2\u27a4*-]+\s*")
+_INVISIBLE_RE = re.compile(r"[\u200b\u200c\u200d\u2060\ufeff]")
+_SPACES_RE = re.compile(r"[ \t\u00a0\u2000-\u200a\u202f\u3000]+")
+_EMPTY_CELLS_RE = re.compile(r"(?:\s*\|)+\s*")
+_HEADING_PUNCT_RE = re.compile(r"[^a-z ]+")
+
+
+def estimate_tokens(text: str, chars_per_token: float = CHARS_PER_TOKEN) -> int:
+    return int(len(text) / chars_per_token + 0.5) if chars_per_token > 0 else len(text)
+
+
+def _clean_line(line: str) -> str:
+    line = _SPACES_RE.sub(" ", _INVISIBLE_RE.sub("", line)).strip()
+    if "|" in line:
+        # Table rows: drop empty cells and the outer pipes.
+        line = _EMPTY_CELLS_RE.sub(" | ", line).strip(" |")
+    if _BULLET_RE.match(line):
+        line = _BULLET_RE.sub("- ", line).rstrip(" -")
+    return line
+
+
+def _line_key(line: str) -> str:
+    return line.casefold()
+
+
+def section_of(line: str) -> str:
+    """Section name if the line is a section heading, else ""."""
+    if len(line) > 40:
+        return ""
+    heading = " ".join(_HEADING_PUNCT_RE.sub(" ", line.casefold().replace("&", " and ")).split())
+    return SECTION_HEADINGS.get(heading, "")
+
+
+def _page_lines(page: str) -> List[str]:
+    lines = []
+    for raw_line in page.splitlines():
+        line = _clean_line(raw_line)
+        if not line or line == "-" or _PAGE_MARKER_RE.match(line) or _BOILERPLATE_RE.match(line):
+            continue
+        lines.append(line)
+    return lines
+
+
+def _running_keys(edges: List[List[str]]) -> set:
+    """Keys found in this edge (top or bottom lines) of two or more pages."""
+    counts: Dict[str, int] = {}
+    for lines in edges:
+        for key in {_line_key(line) for line in lines}:
+            counts[key] = counts.get(key, 0) + 1
+    return {key for key, count in counts.items() if count > 1}
+
+
+def clean_lines(raw_text: str, edge_lines: int = PAGE_EDGE_LINES) -> List[str]:
+    """
+    Cleaned, non-empty lines: page markers and boilerplate dropped, running
+    headers (footers) - a line among the first (last) edge_lines of two or
+    more pages - kept on their first page only, consecutive duplicates
+    collapsed. Repeats anywhere else (the same bullet under two jobs) are kept.
+    """
+    pages = [_page_lines(page) for page in raw_text.split(PAGE_BREAK)]
+    edge_lines = max(0, edge_lines)
+    running_top = _running_keys([page[:edge_lines] for page in pages]) if edge_lines else set()
+    running_bottom = _running_keys([page[-edge_lines:] for page in pages]) if edge_lines else set()
+
+    lines: List[str] = []
+    seen_running = set()
+    for page in pages:
+        for i, line in enumerate(page):
+            key = _line_key(line)
+            if lines and key == _line_key(lines[-1]):
+                continue
+            is_running = (
+                (i < edge_lines and key in running_top)
+                or (i >= len(page) - edge_lines and key in running_bottom)
+            )
+            if is_running:
+                if key in seen_running:
+                    continue
+                seen_running.add(key)
+            lines.append(line)
+    return lines
+
+
+def split_sections(lines: List[str]) -> List[Dict[str, Any]]:
+    """[{"name", "lines"}] in document order; text before the first heading is the header."""
+    sections = [{"name": SECTION_HEADER, "lines": []}]
+    for line in lines:
+        name = section_of(line)
+        if name:
+            sections.append({"name": name, "lines": [line]})
+        else:
+            sections[-1]["lines"].append(line)
+    return [s for s in sections if s["lines"]]
+
+
+def _render(sections: List[Dict[str, Any]]) -> str:
+    return "\n\n".join("\n".join(s["lines"]) for s in sections if s["lines"])
+
+
+def fit_to_budget(sections: List[Dict[str, Any]], max_chars: int) -> List[str]:
+    """
+    Drop lines from the end of the least informative sections until the
+    rendered text fits max_chars. Returns the names of trimmed sections.
+    """
+    size = len(_render(sections))
+    trimmed: List[str] = []
+    order = sorted(
+        (s for s in sections if s["name"] != SECTION_HEADER),
+        key=lambda s: SECTION_PRIORITY.get(s["name"], SECTION_PRIORITY[SECTION_OTHER]),
+    )
+    for section in order:
+        if size <= max_chars:
+            break
+        lines = section["lines"]
+        while lines and size > max_chars:
+            removed = lines.pop()
+            # The line, its newline, and the blank line between sections once the section is empty.
+            size -= len(removed) + (1 if lines else 2)
+        if section["name"] not in trimmed:
+            trimmed.append(section["name"])
+    return trimmed
+
+
+def normalize_resume_text(
+    raw_text: str,
+    token_budget: int = TOKEN_BUDGET,
+    chars_per_token: float = CHARS_PER_TOKEN,
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Return (text for the parser LLM, stats). stats reports raw/normalized
+    chars, saved chars, the estimated tokens, detected sections and the
+    sections trimmed to fit token_budget (0 = no budget).
+    """
+    raw_chars = len(raw_text or "")
+    if not NORMALIZATION_ENABLED or not raw_text:
+        return raw_text, {
+            "raw_chars": raw_chars,
+            "normalized_chars": raw_chars,
+            "saved_chars": 0,
+            "est_tokens": estimate_tokens(raw_text or "", chars_per_token),
+            "sections": [],
+            "trimmed_sections": [],
+        }
+
+    sections = split_sections(clean_lines(raw_text))
+    section_names = [s["name"] for s in sections]
+    trimmed: List[str] = []
+    if token_budget > 0:
+        trimmed = fit_to_budget(sections, int(token_budget * chars_per_token))
+    text = _render(sections)
+
+    return text, {
+        "raw_chars": raw_chars,
+        "normalized_chars": len(text),
+        "saved_chars": raw_chars - len(text),
+        "est_tokens": estimate_tokens(text, chars_per_token),
+        "sections": section_names,
+        "trimmed_sections": trimmed,
+    }
@@ -1,8 +1,16 @@
+import asyncio
 import json
 from typing import Dict, Any
 from pathlib import Path
 from agents.mcp import MCPServerStdio
-from memory_saving.memory_mcp_config import MCP_PARAMS, ensure_memory_dir
+from memory_saving.memory_mcp_config import (
+    MCP_PARAMS,
+    MEMORY_BACKEND,
+    db_path_from_params,
+    ensure_memory_dir,
+)
+from memory_saving.memory_store import get_memory_store
+from memory_saving.profile_repository import profile_repository
 
 
 async def save_intake_answers_to_memory(
@@ -13,13 +21,37 @@ async def save_intake_answers_to_memory(
     Save or overwrite the user's intake answers in the LibSQL memory DB.
 
     This stores the entire intake dict as one JSON observation under a
-    dedicated entity named 'job_intake'.
+    dedicated entity named 'job_intake'. With the default "sqlite" backend the
+    write happens in process; "mcp" goes through the memory MCP server.
     """
     if params is None:
         params = MCP_PARAMS
 
     ensure_memory_dir(params)
 
+    if MEMORY_BACKEND == "mcp":
+        result = await _save_intake_answers_via_mcp(intake_answers, params)
+        profile_repository.invalidate(db_path_from_params(params))
+    else:
+        store = get_memory_store(db_path_from_params(params))
+        await asyncio.to_thread(store.upsert_json, "job_intake", intake_answers)
+        result = {"backend": "sqlite", "entity": "job_intake"}
+
+    print("[Memory] Saved intake answers to memory")
+
+    # NEEDED FOR REVIEW WHEN HANDLING WEIRD FORMATS
+    print("\n================= INTAKE SNAPSHOT =================\n")
+    for key, value in intake_answers.items():
+        print(f"{key}: {value}")
+    print("\n===================================================\n")
+
+    return result
+
+
+async def _save_intake_answers_via_mcp(
+    intake_answers: Dict[str, Any],
+    params: Dict[str, Any],
+):
     async with MCPServerStdio(params=params, client_session_timeout_seconds=120) as mcp_server:
 
         try:
@@ -38,14 +70,4 @@ async def save_intake_answers_to_memory(
             ]
         }
 
-        result = await mcp_server.call_tool("create_entities", entities_arg)
-
-        print("[Memory] Saved intake answers to memory")
-
-        # NEEDED FOR REVIEW WHEN HANDLING WEIRD FORMATS
-        print("\n================= INTAKE SNAPSHOT =================\n")
-        for key, value in intake_answers.items():
-            print(f"{key}: {value}")
-        print("\n===================================================\n")
-
-        return result
+        return await mcp_server.call_tool("create_entities", entities_arg)
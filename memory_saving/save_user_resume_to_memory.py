@@ -1,20 +1,43 @@
+import asyncio
 import json
 from typing import Dict, Any, List
 from pathlib import Path
 
 import numpy as np
-import pdfplumber
-import docx
 # import easyocr
 from PIL import Image
 from pydantic import BaseModel
 from agents import Agent, Runner, trace
 from agents.mcp import MCPServerStdio
 from dotenv import load_dotenv
-import zipfile
-import xml.etree.ElementTree as ET
 
-from memory_saving.memory_mcp_config import MCP_PARAMS, ensure_memory_dir
+from memory_saving.memory_mcp_config import (
+    MCP_PARAMS,
+    MEMORY_BACKEND,
+    db_path_from_params,
+    ensure_memory_dir,
+)
+from memory_saving.memory_store import get_memory_store
+from memory_saving.profile_repository import profile_repository
+# Extractors live in resume_text_extraction; re-exported here for existing callers.
+from memory_saving.resume_text_extraction import (
+    extract_resume_text,
+    extract_text_from_docx,
+    extract_text_from_docx_xml,
+    extract_text_from_pdf,
+    raise_extraction_error,
+)
+from memory_saving.resume_extraction_service import resume_extraction_service
+from memory_saving.resume_field_extractor import complete_parsed_resume, extract_contact_fields
+from memory_saving.resume_text_normalizer import normalize_resume_text
+from memory_saving.resume_parse_cache import (
+    file_sha256,
+    get_cached_parse,
+    get_cached_text,
+    set_cached_parse,
+    set_cached_text,
+)
+from utils.sqlite_cache import make_cache_key
 
 load_dotenv(override=True)
 
@@ -255,173 +278,6 @@ def compute_contributions(parsed_resume: dict) -> List[str]:
     return deduped
 
 
-# =========================
-# BULLETPROOF PDF EXTRACTOR
-# =========================
-def extract_text_from_pdf(path: Path) -> str:
-    """
-    BULLETPROOF PDF extraction with multiple fallbacks.
-    OCR based fallbacks are disabled in this deployment.
-    """
-    try:
-        print(f"[PDF] Processing {path.name}")
-        text_chunks: List[str] = []
-        page_stats = {"text_pages": 0, "ocr_pages": 0, "total_pages": 0}
-
-        with pdfplumber.open(str(path)) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                page_stats["total_pages"] += 1
-                print(f"[PDF] Page {page_num}/{len(pdf.pages)}")
-
-                # 1) Native text
-                native_text = page.extract_text() or ""
-                if native_text.strip():
-                    text_chunks.append(native_text.strip())
-                    page_stats["text_pages"] += 1
-                    print(f"[PDF] Page {page_num}: Native ({len(native_text)} chars)")
-                    continue
-
-                # 2) Tables fallback (no OCR)
-                tables = page.extract_tables()
-                table_text = []
-                for table_num, table in enumerate(tables or []):
-                    if table:
-                        for row in table:
-                            row_text = [str(cell or "") for cell in row if cell]
-                            if row_text:
-                                table_text.append(" | ".join(row_text))
-                if table_text:
-                    text_chunks.append(f"[PAGE {page_num} TABLES]\n" + "\n".join(table_text))
-                    # page_stats["ocr_pages"] += 1  # would have been OCR tables, but OCR is disabled
-                    continue
-
-                # 3) OCR based fallbacks are disabled
-                # try:
-                #     page_img = page.to_image(resolution=300)
-                #     ocr_text = ocr_image_pil(page_img.original)
-                #     if ocr_text.strip():
-                #         text_chunks.append(f"[PAGE {page_num} OCR]\n{ocr_text.strip()}")
-                #         page_stats["ocr_pages"] += 1
-                #         print(f"[PDF] Page {page_num}: OCR ({len(ocr_text)} chars)")
-                #         continue
-                # except Exception as e:
-                #     print(f"[PDF] Page {page_num} OCR failed: {e}")
-                #
-                # try:
-                #     full_img = page.to_image(resolution=400)
-                #     full_ocr = ocr_image_pil(full_img.original)
-                #     if full_ocr.strip():
-                #         text_chunks.append(f"[PAGE {page_num} FULL OCR]\n{full_ocr}")
-                #         page_stats["ocr_pages"] += 1
-                #         print(f"[PDF] Page {page_num}: Full OCR ({len(full_ocr)} chars)")
-                # except Exception as e:
-                #     print(f"[PDF] Page {page_num} Full OCR failed: {e}")
-
-        print(
-            f"[PDF] SUMMARY: {page_stats['text_pages']} text + "
-            f"{page_stats['ocr_pages']} OCR / {page_stats['total_pages']} pages"
-        )
-
-        result = "\n\n".join(text_chunks)
-        if not result.strip():
-            raise_extraction_error(path)
-
-        print(f"[PDF] TOTAL: {len(result)} chars")
-        return result
-
-    except Exception as e:
-        print(f"[PDF] CRITICAL ERROR: {e}")
-        raise ValueError(f"[PDF] Failed {path.name}: {str(e)}")
-
-
-def raise_extraction_error(path: Path):
-    raise ValueError(f"[PDF] No text from {path.name}. Image-only/corrupted?")
-
-
-# =========================
-# BULLETPROOF DOCX EXTRACTOR
-# =========================
-def extract_text_from_docx(path: Path) -> str:
-    """Enhanced DOCX extraction (paragraphs, tables, XML fallback)."""
-    try:
-        doc = docx.Document(str(path))
-        full_text: List[str] = []
-        print(f"[DOCX] Processing {path.name}")
-
-        para_count = 0
-        for p in doc.paragraphs:
-            para_text = [run.text.strip() for run in p.runs if run.text.strip()]
-            if para_text:
-                full_text.append(" ".join(para_text))
-                para_count += 1
-
-        table_count = 0
-        for table in doc.tables:
-            for row in table.rows:
-                row_text: List[str] = []
-                for cell in row.cells:
-                    for p in cell.paragraphs:
-                        cell_text = [run.text.strip() for run in p.runs if run.text.strip()]
-                        row_text.extend(cell_text)
-                if row_text:
-                    full_text.append(" | ".join(row_text))
-                    table_count += 1
-
-        print(f"[DOCX] Extracted: {para_count} paras, {table_count} tables")
-
-        xml_text = extract_text_from_docx_xml(path)
-        if xml_text.strip():
-            full_text.append(xml_text)
-            print(f"[DOCX] XML added: {len(xml_text)} chars")
-
-        result = "\n".join(full_text)
-        print(f"[DOCX] TOTAL: {len(result)} chars")
-        return result if result.strip() else raise_extraction_error(path)
-
-    except Exception as e:
-        print(f"[DOCX] ERROR: {e}")
-        raise ValueError(f"[DOCX] Failed: {e}")
-
-
-def extract_text_from_docx_xml(path: Path) -> str:
-    """XML parsing for DOCX textboxes and shapes."""
-    try:
-        with zipfile.ZipFile(str(path), "r") as zip_ref:
-            if "word/document.xml" in zip_ref.namelist():
-                with zip_ref.open("word/document.xml") as xml_file:
-                    tree = ET.parse(xml_file)
-                    root = tree.getroot()
-                    ns = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
-                    text_elements = root.findall(".//w:t", ns)
-                    return "\n".join(
-                        [elem.text for elem in text_elements if elem.text and elem.text.strip()]
-                    )
-    except Exception:
-        pass
-    return ""
-
-
-# =========================
-# UNIVERSAL EXTRACTOR
-# =========================
-def extract_resume_text(path: Path) -> str:
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {path}")
-    ext = path.suffix.lower()
-    if ext == ".pdf":
-        return extract_text_from_pdf(path)
-    elif ext == ".docx":
-        return extract_text_from_docx(path)
-    elif ext in [".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp"]:
-        # OCR is disabled - image resumes are not supported in this deployment
-        raise ValueError(
-            f"Image resume formats like {ext} are not supported in this environment. "
-            f"Please upload a PDF or DOCX file instead."
-        )
-    else:
-        raise ValueError(f"Unsupported: {ext}. Use PDF, DOCX, PNG, or JPG")
-
-
 # =========================
 # Pydantic models
 # =========================
@@ -431,6 +287,7 @@ class BasicInfo(BaseModel):
     phone: str = ""
     location: str = ""
     headline: str = ""
+    links: List[str] = []
 
 
 class ExperienceItem(BaseModel):
@@ -465,30 +322,61 @@ class Resume(BaseModel):
     years_experience: float
 
 
+# The parser LLM only fills the fields rules cannot: email, phone, links and
+# "current" come from resume_field_extractor, and dates are copied as written
+# and normalized there. complete_parsed_resume turns this into a Resume.
+class ParsedBasicInfo(BaseModel):
+    full_name: str = ""
+    location: str = ""
+    headline: str = ""
+
+
+class ParsedExperienceItem(BaseModel):
+    title: str = ""
+    company: str = ""
+    location: str = ""
+    start_date: str = ""
+    end_date: str = ""
+    responsibilities: List[str] = []
+
+
+class ParsedResume(BaseModel):
+    basic_info: ParsedBasicInfo
+    summary: str
+    skills: Skills
+    experience: List[ParsedExperienceItem]
+    education: List[EducationItem]
+    years_experience: float
+
+
 # =========================
 # Resume parser agent
 # =========================
-def build_resume_parser_agent(model: str = "gpt-4o-mini") -> Agent[Resume]:
-    instructions = (
-        "You are a strict resume parser.\n"
-        "Extract structured data from raw resume text into the provided Resume schema.\n"
-        "Use empty strings for missing text fields, empty lists for missing arrays, "
-        "false for missing booleans, and 0 for missing numeric fields. "
-        "Estimate total years of experience as a number. "
-        "For dates, use 'YYYY-MM' when possible, otherwise 'YYYY'. "
-        "Support quarter formats like 'Q2 2024' and season formats like 'Summer 2023'. "
-        "Do not invent jobs or degrees that are not clearly present in the text."
-    )
-    agent = Agent[Resume](
+RESUME_PARSER_INSTRUCTIONS = (
+    "You are a strict resume parser.\n"
+    "Extract structured data from raw resume text into the provided schema.\n"
+    "Use empty strings for missing text fields, empty lists for missing arrays, "
+    "and 0 for missing numeric fields. "
+    "Estimate total years of experience as a number. "
+    "Copy dates exactly as written in the resume (for example 'Jun 2023', 'Q2 2024', 'Present'). "
+    "Do not invent jobs or degrees that are not clearly present in the text."
+)
+
+# Cached parses are only reused while the schema and instructions are unchanged.
+RESUME_PARSER_FINGERPRINT = make_cache_key(ParsedResume.model_json_schema(), RESUME_PARSER_INSTRUCTIONS)
+
+
+def build_resume_parser_agent(model: str = "gpt-4o-mini") -> Agent[ParsedResume]:
+    agent = Agent[ParsedResume](
         name="resume_parser",
-        instructions=instructions,
+        instructions=RESUME_PARSER_INSTRUCTIONS,
         model=model,
-        output_type=Resume,
+        output_type=ParsedResume,
     )
     return agent
 
 
-async def parse_resume_with_llm(raw_text: str, agent: Agent[Resume]) -> Dict[str, Any]:
+async def parse_resume_with_llm(raw_text: str, agent: Agent[ParsedResume]) -> Dict[str, Any]:
     prompt = (
         "Parse the following resume text into the structured Resume schema. "
         "Follow your instructions and fill all fields consistently.\n\nRESUME:\n"
@@ -497,7 +385,7 @@ async def parse_resume_with_llm(raw_text: str, agent: Agent[Resume]) -> Dict[str
     try:
         with trace("Parsing and Saving Resume"):
             result = await Runner.run(agent, prompt)
-            resume_obj: Resume = result.final_output
+            resume_obj: ParsedResume = result.final_output
             return resume_obj.model_dump()
     except Exception as e:
         raise Exception(f"Error parsing resume with Agent: {str(e)}")
@@ -506,9 +394,14 @@ async def parse_resume_with_llm(raw_text: str, agent: Agent[Resume]) -> Dict[str
 # =========================
 # Memory saving
 # =========================
-async def save_resume_profile_to_memory(parsed_resume: dict) -> None:
-    ensure_memory_dir()
-    params = MCP_PARAMS
+async def save_resume_profile_to_memory(
+    parsed_resume: dict,
+    params: Dict[str, Any] | None = None,
+) -> None:
+    if params is None:
+        params = MCP_PARAMS
+
+    ensure_memory_dir(params)
 
     basic = parsed_resume.get("basic_info", {})
     skills = parsed_resume.get("skills", {})
@@ -538,6 +431,12 @@ async def save_resume_profile_to_memory(parsed_resume: dict) -> None:
         "top_contributions": top_contributions,
     }
 
+    if MEMORY_BACKEND != "mcp":
+        store = get_memory_store(db_path_from_params(params))
+        await asyncio.to_thread(store.upsert_json, "resume_profile", payload)
+        print("[Memory] Saved resume profile to memory (in-process sqlite).")
+        return
+
     async with MCPServerStdio(params=params, client_session_timeout_seconds=120) as mcp_server:
         try:
             await mcp_server.call_tool("delete_entity", {"name": "resume_profile"})
@@ -556,6 +455,7 @@ async def save_resume_profile_to_memory(parsed_resume: dict) -> None:
         }
 
         result = await mcp_server.call_tool("create_entities", entities_arg)
+        profile_repository.invalidate(db_path_from_params(params))
 
         print("[Memory] Saved resume profile to memory.")
         print("[Memory] Tool result:")
@@ -569,11 +469,21 @@ async def pipeline_process_resume_file(
     path: Path,
     save_to_memory: bool = False,
     model: str = "gpt-4o-mini",
+    memory_params: Dict[str, Any] | None = None,
 ) -> None:
-    resume_agent = build_resume_parser_agent(model=model)
+    if path.exists():
+        # Reject oversized uploads before hashing or parsing them.
+        resume_extraction_service.check_size(path)
+    content_hash = await asyncio.to_thread(file_sha256, path)
+    raw_text = await get_cached_text(content_hash)
+    if raw_text is not None:
+        print("[ResumeCache] Same resume seen before; skipping text extraction.")
 
     try:
-        raw_text = extract_resume_text(path)
+        if raw_text is None:
+            # CPU-bound parsing runs in the extraction process pool, off the event loop.
+            raw_text = await resume_extraction_service.extract(path)
+            await set_cached_text(content_hash, raw_text)
     except ValueError as e:
         # Convert image related extraction errors into OCRDisabledError when relevant
         raise format_image_extraction_error(e)
@@ -584,7 +494,26 @@ async def pipeline_process_resume_file(
         # For unexpected extractor errors, keep the original message
         raise e
 
-    parsed_resume = await parse_resume_with_llm(raw_text, resume_agent)
+    # Page furniture, repeated headers and whitespace never reach the parser; the token budget trims low-value sections.
+    parser_text, norm_stats = normalize_resume_text(raw_text)
+    print(
+        f"[ResumeNormalize] {norm_stats['raw_chars']} -> {norm_stats['normalized_chars']} chars "
+        f"(saved {norm_stats['saved_chars']}, ~{norm_stats['est_tokens']} tokens)"
+        + (f"; trimmed: {', '.join(norm_stats['trimmed_sections'])}" if norm_stats["trimmed_sections"] else "")
+    )
+
+    # Keyed on the text the parser actually sees.
+    parsed_resume = await get_cached_parse(parser_text, model, RESUME_PARSER_FINGERPRINT)
+    if parsed_resume is not None:
+        print("[ResumeCache] Reusing parsed resume; skipping the parser LLM call.")
+    else:
+        resume_agent = build_resume_parser_agent(model=model)
+        parsed_resume = await parse_resume_with_llm(parser_text, resume_agent)
+        await set_cached_parse(parser_text, model, RESUME_PARSER_FINGERPRINT, parsed_resume)
+
+    # Contact fields and date normalization are rule based; the cache keeps only the LLM's part.
+    contact = extract_contact_fields(raw_text)
+    parsed_resume = Resume(**complete_parsed_resume(parsed_resume, contact)).model_dump()
 
     # Compute experience summary from parsed roles (companies + roles only)
     try:
@@ -645,6 +574,6 @@ async def pipeline_process_resume_file(
     print("\n===================================================\n")
 
     if save_to_memory:
-        await save_resume_profile_to_memory(parsed_resume)
+        await save_resume_profile_to_memory(parsed_resume, params=memory_params)
     else:
         print("Skipping memory save.")
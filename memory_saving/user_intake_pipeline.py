@@ -7,12 +7,17 @@ from utils.exception import CustomException
 
 from memory_saving.save_user_resume_to_memory import pipeline_process_resume_file
 from memory_saving.save_user_preferences_to_memory import save_intake_answers_to_memory
+from memory_saving.memory_mcp_config import build_mcp_params
 
 logger = logging.getLogger(__name__)
 
 
-async def process_resume_and_save(path: str | Path, model: str = "gpt-4.1-mini"):
-    """Process a resume file and store structured output in memory."""
+async def process_resume_and_save(
+    path: str | Path,
+    model: str = "gpt-4.1-mini",
+    memory_db_path: str | Path | None = None,
+):
+    """Process a resume file and store structured output in memory (memory_db_path, or the shared DB)."""
     try:
         resume_path = Path(path)
 
@@ -29,6 +34,7 @@ async def process_resume_and_save(path: str | Path, model: str = "gpt-4.1-mini")
             path=resume_path,
             save_to_memory=True,
             model=model,
+            memory_params=build_mcp_params(memory_db_path),
         )
 
         logger.info("Resume processed and saved")
@@ -38,8 +44,8 @@ async def process_resume_and_save(path: str | Path, model: str = "gpt-4.1-mini")
         raise CustomException(e, error_detail=sys)
 
 
-async def save_user_preferences(intake_answers: dict):
-    """Store user intake preferences (location, role, etc) into memory."""
+async def save_user_preferences(intake_answers: dict, memory_db_path: str | Path | None = None):
+    """Store user intake preferences (location, role, etc) into memory (memory_db_path, or the shared DB)."""
     try:
         if not intake_answers:
             logger.error("Empty intake answers")
@@ -50,7 +56,10 @@ async def save_user_preferences(intake_answers: dict):
 
         logger.info("Saving intake preferences")
 
-        await save_intake_answers_to_memory(intake_answers)
+        await save_intake_answers_to_memory(
+            intake_answers,
+            params=build_mcp_params(memory_db_path),
+        )
 
         logger.info("Intake preferences saved")
 
@@ -0,0 +1,291 @@
+# present_to_user/batch_scoring.py
+
+"""
+Batch compatibility scoring over many jobs for one profile.
+
+score_jobs_batch(profile, jobs) returns exactly what
+[score_job(profile, job) for job in jobs] returns, but:
+
+- user-side inputs (role, skills, location tokens, experience, salary) are
+  normalised once per batch instead of once per job;
+- string dimensions (role similarity, skill overlap, location match) are
+  memoised per distinct title / skill list / location, which repeat heavily
+  across sources and cached searches;
+- numeric dimensions (experience, salary) and the weighted overall score,
+  clamps and confidence are computed over NumPy arrays.
+
+Every value that the scalar path rounds is rounded here with Python's round()
+on the same float64 inputs, in the same operation order, so results are
+identical (benchmarks/bench_batch_scoring.py checks this).
+"""
+
+from numbers import Real
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from present_to_user.job_compatibility_scoring import (
+    MIN_SALARY_NEUTRAL_SCORE,
+    WEIGHTS,
+    _num_list_from_text,
+    _safe_lower_list,
+    label_fit,
+    score_job,
+    score_location,
+    score_role,
+    score_skills,
+)
+from utils.logger import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _is_real(value: Any) -> bool:
+    return isinstance(value, Real) and not isinstance(value, bool)
+
+
+class _UserContext:
+    """Profile fields score_job reads, extracted once per batch."""
+
+    def __init__(self, profile: Dict[str, Any]):
+        prefs = profile.get("preferences", {})
+        resume = profile.get("resume", {})
+
+        self.preferred_role = prefs.get("preferred_role")
+        self.user_loc = resume.get("location")
+        self.remote_pref = prefs.get("working_style") or prefs.get("remote_preference")
+        self.user_exp = resume.get("years_experience")
+        self.user_skills = resume.get("top_technical_skills", [])
+        self.exp_salary = prefs.get("salary_expectation") or prefs.get("target_salary_lpa")
+
+    def supports_vector_path(self) -> bool:
+        """Numeric fields must be plain numbers (or None) for the array path to match score_job."""
+        return (
+            (self.user_exp is None or _is_real(self.user_exp))
+            and (self.exp_salary is None or _is_real(self.exp_salary))
+        )
+
+
+# ----------------------
+# Memoised string dimensions
+# ----------------------
+class _StringDimensionCache:
+    def __init__(self, ctx: _UserContext):
+        self.ctx = ctx
+        self._role: Dict[Any, Tuple[float, float]] = {}
+        self._skills: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], Tuple[float, List[str]]] = {}
+        self._location: Dict[Tuple[str, str], Tuple[float, str]] = {}
+
+    def role(self, title: Any) -> Tuple[float, float]:
+        key = title if isinstance(title, str) else repr(title)
+        hit = self._role.get(key)
+        if hit is None:
+            hit = score_role(self.ctx.preferred_role, title)
+            self._role[key] = hit
+        return hit
+
+    def skills(self, required: Any, preferred: Any) -> Tuple[float, List[str]]:
+        key = (tuple(_safe_lower_list(required)), tuple(_safe_lower_list(preferred)))
+        hit = self._skills.get(key)
+        if hit is None:
+            hit = score_skills(self.ctx.user_skills, required, preferred)
+            self._skills[key] = hit
+        return hit[0], list(hit[1])
+
+    def location(self, job_loc: str, remote_type: str) -> Tuple[float, str]:
+        key = (job_loc, remote_type)
+        hit = self._location.get(key)
+        if hit is None:
+            hit = score_location(self.ctx.user_loc, job_loc, self.ctx.remote_pref, remote_type)
+            self._location[key] = hit
+        return hit
+
+
+# ----------------------
+# Vectorised numeric dimensions
+# ----------------------
+def _experience_scores(user_exp: Optional[float], required_years: Sequence[Optional[float]]) -> List[float]:
+    """
+    Same branches as score_experience, with the ratio path done over arrays.
+    required_years[i] is max(numbers in experience_required) or None.
+    """
+    n = len(required_years)
+    if user_exp is None:
+        return [0.0] * n
+
+    required = np.array([np.nan if v is None else v for v in required_years], dtype=float)
+
+    out = np.empty(n)
+    no_req = np.isnan(required)
+    out[no_req] = 1.0 if user_exp >= 1.0 else 0.0
+
+    has_req = ~no_req
+    req = required[has_req]
+    sub = np.empty(req.shape)
+    zero = req <= 0
+    meets = ~zero & (user_exp >= req)
+    ratio_mask = ~zero & ~meets
+    sub[zero] = 0.0
+    sub[meets] = 3.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sub[ratio_mask] = np.clip((user_exp / req[ratio_mask]) * 3.0, 0.0, 3.0)
+    out[has_req] = sub
+
+    ratio_idx = np.flatnonzero(has_req)[ratio_mask]
+    result = out.tolist()
+    for i in ratio_idx.tolist():
+        result[i] = round(result[i], 3)
+    return result
+
+
+def _salary_scores(
+    exp_salary: Optional[float],
+    mins: Sequence[Any],
+    maxs: Sequence[Any],
+) -> Tuple[List[float], List[str], List[int]]:
+    """
+    Same branches and labels as score_salary, ratio path done over arrays.
+    Also returns indices whose salary parsed to NaN; callers score those with score_job.
+    """
+    n = len(mins)
+    if exp_salary is None:
+        return [1.0] * n, ["no_expectation"] * n, []
+
+    scores: List[float] = [0.0] * n
+    labels: List[str] = [""] * n
+    median = np.full(n, np.nan)
+
+    for i, (min_sal, max_sal) in enumerate(zip(mins, maxs)):
+        if min_sal is None and max_sal is None:
+            scores[i], labels[i] = MIN_SALARY_NEUTRAL_SCORE, "salary_unknown"
+            continue
+        try:
+            if min_sal is not None and max_sal is not None:
+                median[i] = (float(min_sal) + float(max_sal)) / 2.0
+            else:
+                median[i] = float(min_sal or max_sal)
+        except Exception:
+            scores[i], labels[i] = 0.0, "salary_parse_error"
+
+    valid = ~np.isnan(median)
+    nan_parsed = [i for i in range(n) if not labels[i] and not valid[i]]
+    meets = valid & (median >= exp_salary)
+    below = valid & ~meets
+    if exp_salary > 0:
+        ratio = median / exp_salary
+    else:
+        ratio = np.zeros(n)
+    raw = np.clip(ratio * 3.0, 0.0, 3.0)
+
+    for i in np.flatnonzero(meets).tolist():
+        scores[i], labels[i] = 3.0, "meets_expectation"
+    raw_list = raw.tolist()
+    ratio_list = ratio.tolist()
+    for i in np.flatnonzero(below).tolist():
+        r = ratio_list[i]
+        if r >= 0.8:
+            label = "near_expectation"
+        elif r >= 0.5:
+            label = "below_expectation"
+        else:
+            label = "far_below"
+        scores[i], labels[i] = round(raw_list[i], 3), label
+    return scores, labels, nan_parsed
+
+
+# ----------------------
+# Public API
+# ----------------------
+def score_jobs_batch(profile: Dict[str, Any], jobs: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Score many jobs for one profile; output matches score_job per job, in order."""
+    if not jobs:
+        return []
+
+    try:
+        ctx = _UserContext(profile)
+        vector_ok = ctx.supports_vector_path()
+    except Exception:
+        vector_ok = False
+    if not vector_ok:
+        # Odd profile types hit score_job's own error handling; keep that behaviour exactly.
+        return [score_job(profile, job) for job in jobs]
+
+    strings = _StringDimensionCache(ctx)
+    n = len(jobs)
+    r = [0.0] * n
+    role_sim = [0.0] * n
+    s = [0.0] * n
+    matched: List[List[str]] = [[] for _ in range(n)]
+    l = [0.0] * n
+    loc_reason = [""] * n
+    required_years: List[Optional[float]] = [None] * n
+    sal_min: List[Any] = [None] * n
+    sal_max: List[Any] = [None] * n
+    failed = [False] * n
+
+    for i, job in enumerate(jobs):
+        try:
+            r[i], role_sim[i] = strings.role(job.get("title", ""))
+            s[i], matched[i] = strings.skills(job.get("required_skills", []), job.get("preferred_skills", []))
+            nums = _num_list_from_text(job.get("experience_required", "") or "")
+            required_years[i] = max(nums) if nums else None
+            l[i], loc_reason[i] = strings.location(job.get("location_area", "") or "", job.get("remote_type", "") or "")
+            sal_min[i], sal_max[i] = job.get("salary_min"), job.get("salary_max")
+        except Exception:
+            failed[i] = True
+
+    e = _experience_scores(ctx.user_exp, required_years)
+    sal, sal_reason, nan_salaries = _salary_scores(ctx.exp_salary, sal_min, sal_max)
+    for i in nan_salaries:
+        failed[i] = True
+        sal[i] = 0.0
+
+    r_a, s_a, e_a, l_a, sal_a = (np.asarray(v, dtype=float) for v in (r, s, e, l, sal))
+    weighted_sum = (
+        r_a * WEIGHTS["role"] +
+        s_a * WEIGHTS["skills"] +
+        e_a * WEIGHTS["experience"] +
+        l_a * WEIGHTS["location"] +
+        sal_a * WEIGHTS["salary"]
+    )
+    overall_raw = np.clip((weighted_sum / 3.0) * 100.0, 0.0, 100.0).tolist()
+    confidence_raw = ((r_a + s_a + e_a + l_a + sal_a) / (3.0 * len(WEIGHTS))).tolist()
+
+    out: List[Dict[str, Any]] = []
+    for i, job in enumerate(jobs):
+        if failed[i]:
+            out.append(score_job(profile, job))
+            continue
+
+        overall = round(overall_raw[i], 2)
+        key_gaps = []
+        if s[i] < 1.5:
+            key_gaps.append("skills_low")
+        if e[i] < 1.5:
+            key_gaps.append("experience_low")
+        if l[i] < 1.0:
+            key_gaps.append("location_mismatch")
+        if sal[i] < 1.0:
+            key_gaps.append("salary_unknown_or_low")
+
+        out.append({
+            **job,
+            "dimension_scores": {
+                "role": round(r[i], 3),
+                "role_similarity": round(role_sim[i], 3),
+                "skills": round(s[i], 3),
+                "matched_skills": matched[i],
+                "experience": round(e[i], 3),
+                "location": round(l[i], 3),
+                "location_reason": loc_reason[i],
+                "salary": round(sal[i], 3),
+                "salary_reason": sal_reason[i],
+            },
+            "overall_score": overall,
+            "fit_level": label_fit(overall),
+            "key_gaps": key_gaps,
+            "confidence": round(confidence_raw[i], 3),
+        })
+
+    logger.info("Batch scored %d jobs", n)
+    return out
@@ -3,11 +3,13 @@ import json
 import os
 import re
 import sys
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from difflib import SequenceMatcher
 
 from utils.logger import logging
 from utils.exception import CustomException
+from utils.skill_taxonomy import SkillKey, skill_taxonomy
+from present_to_user.role_similarity import ROLE_MATCHING_ENGINE, role_matcher
 
 # -----------------------------
 # Config / weights
@@ -20,6 +22,9 @@ WEIGHTS = {
     "salary": 0.10,
 }
 
+# Bump when scoring logic changes so incremental runs re-score (full_pipeline_files/pipeline_dag.py).
+SCORING_VERSION = "1"
+
 MAX_SKILL_DENOM = 3  # denominator for skills ratio (cap)
 MIN_SALARY_NEUTRAL_SCORE = 1.0  # score when no salary info (0..3 scale)
 ROLE_SIMILARITY_FULL = 0.75  # ratio above which role considered a strong match
@@ -65,15 +70,23 @@ def _clamp(x: float, a: float, b: float) -> float:
 # Dimension scorers (0..3 float)
 # -----------------------------
 def score_role(preferred_role: str, title: str) -> Tuple[float, float]:
-    """Return (score 0..3, similarity_ratio 0..1)."""
+    """
+    Return (score 0..3, similarity_ratio 0..1).
+    Uses the cached role-similarity index (present_to_user/role_similarity.py);
+    role_matching.engine "sequence_matcher" restores the original difflib path.
+    """
     try:
         if not preferred_role or not title:
             return 0.0, 0.0
-        p = preferred_role.strip().lower()
-        t = title.strip().lower()
-        sim = SequenceMatcher(None, p, t).ratio()
+        if ROLE_MATCHING_ENGINE == "index":
+            sim, keyword_hit = role_matcher.similarity(preferred_role, title)
+        else:
+            p = preferred_role.strip().lower()
+            t = title.strip().lower()
+            sim = SequenceMatcher(None, p, t).ratio()
+            keyword_hit = p in t or any(tok for tok in p.split() if tok and tok in t)
         score = _clamp(sim * 3.0, 0.0, 3.0)
-        if p in t or any(tok for tok in p.split() if tok and tok in t):
+        if keyword_hit:
             score = max(score, 1.2) 
         return round(score, 3), round(sim, 3)
     except Exception:
@@ -82,21 +95,20 @@ def score_role(preferred_role: str, title: str) -> Tuple[float, float]:
 
 
 def score_skills(user_skills: List[str], job_required: List[str], job_preferred: List[str]) -> Tuple[float, List[str]]:
+    """
+    Return (score 0..3, matched job skills).
+    Skills are resolved to taxonomy keys (utils/skill_taxonomy.py), so aliases
+    match ("k8s" / "kubernetes") and overlap is a set intersection.
+    """
     try:
-        user_low = set(_safe_lower_list(user_skills))
-        job_low = _safe_lower_list(job_required) + _safe_lower_list(job_preferred)
-        job_low_unique = []
-        for j in job_low:
-            if j not in job_low_unique:
-                job_low_unique.append(j)
-        overlap = []
-        for u in user_low:
-            for j in job_low_unique:
-                if u == j or u in j or j in u:
-                    overlap.append(j)
-                    break
-        overlap = list(dict.fromkeys(overlap))  
-        denom = max(1, min(MAX_SKILL_DENOM, len(job_low_unique)))  
+        user_ids = skill_taxonomy.id_set(_safe_lower_list(user_skills))
+        job_ids: Dict[SkillKey, str] = {}
+        for j in _safe_lower_list(job_required) + _safe_lower_list(job_preferred):
+            skill_id = skill_taxonomy.skill_id(j)
+            if skill_id is not None:
+                job_ids.setdefault(skill_id, j)
+        overlap = [j for skill_id, j in job_ids.items() if skill_id in user_ids]
+        denom = max(1, min(MAX_SKILL_DENOM, len(job_ids)))
         ratio = len(overlap) / denom
         score = _clamp(ratio * 3.0, 0.0, 3.0)
         return round(score, 3), overlap
@@ -253,34 +265,48 @@ def score_job(profile: Dict[str, Any], job: Dict[str, Any]) -> Dict[str, Any]:
         return {**job, "overall_score": 0.0, "fit_level": "aspirational", "key_gaps": ["scoring_error"], "confidence": 0.0}
 
 
-def add_scores_to_aggregation(input_path: str, output_path: str) -> Dict[str, Any]:
-    try:
-        logging.info("Loading aggregation from %s", input_path)
-        with open(input_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+def score_aggregation(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Score a saved aggregation payload ({"profile", "aggregation"}) in memory and
+    return the scored payload the presenter consumes.
+    """
+    profile = data.get("profile", {})
+    aggregation = data.get("aggregation", {})
 
-        profile = data.get("profile", {})
-        aggregation = data.get("aggregation", {})
+    best_matches = aggregation.get("best_matches", [])
+    logging.info("Scoring %d best-matched jobs", len(best_matches))
 
-        best_matches = aggregation.get("best_matches", [])
-        logging.info("Scoring %d best-matched jobs", len(best_matches))
+    # Imported here: batch_scoring builds on the scorers defined in this module.
+    from present_to_user.batch_scoring import score_jobs_batch
 
-        scored_best = []
-        for job in best_matches:
-            scored_best.append(score_job(profile, job))
+    scored_best = score_jobs_batch(profile, best_matches)
 
-        out = {
-            "profile": profile,
-            "aggregation": aggregation,
-            "compatibility_scores": scored_best,
-            "scored_best_matches": scored_best,
-        }
+    return {
+        "profile": profile,
+        "aggregation": aggregation,
+        "compatibility_scores": scored_best,
+        "scored_best_matches": scored_best,
+    }
+
+
+def write_scores(scored: Dict[str, Any], output_path: str) -> None:
+    """Persist a scored payload (compact JSON; nothing in the pipeline reads it back when scores are passed in memory)."""
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(scored, f, ensure_ascii=False, separators=(",", ":"))
+    logging.info("Wrote compatibility scores to %s", output_path)
+
+
+def add_scores_to_aggregation(input_path: str, output_path: Optional[str] = None) -> Dict[str, Any]:
+    try:
+        logging.info("Loading aggregation from %s", input_path)
+        with open(input_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
 
-        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(out, f, indent=2)
+        out = score_aggregation(data)
 
-        logging.info("Wrote compatibility scores to %s", output_path)
+        if output_path:
+            write_scores(out, output_path)
         return out
 
     except Exception as e:
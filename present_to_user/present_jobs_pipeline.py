@@ -4,7 +4,7 @@ import json
 import os
 import sys
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from utils.logger import logging
 from utils.exception import CustomException
@@ -35,23 +35,29 @@ async def run_presenter_pipeline(
     scored_out_path: str = SCORED_OUT_PATH,
     presenter_md_path: str = PRESENTER_MD_PATH,
     memory_db_path: str = MEMORY_DB_PATH,
+    scored: Optional[Dict[str, Any]] = None,
 ) -> str:
     """
     Runs scoring + presenter agent + markdown save.
+    Pass scored (the add_scores_to_aggregation / score_aggregation payload) to
+    skip scoring; it is not modified.
     Uses the provided paths (falls back to module-level defaults).
     Returns path to the final presenter markdown output.
     """
-    try:
-        logging.info("Starting scoring step")
-        logging.info("Using input_agg_path=%s scored_out_path=%s", input_agg_path, scored_out_path)
-        scored = add_scores_to_aggregation(input_agg_path, scored_out_path)
-        logging.info(
-            "Scoring step complete: %d scored jobs",
-            len(scored.get("compatibility_scores", [])),
-        )
-    except Exception as e:
-        logging.error("Scoring failed: %s", CustomException(e, sys))
-        raise
+    if scored is not None:
+        logging.info("Using pre-scored payload: %d scored jobs", len(scored.get("compatibility_scores", [])))
+    else:
+        try:
+            logging.info("Starting scoring step")
+            logging.info("Using input_agg_path=%s scored_out_path=%s", input_agg_path, scored_out_path)
+            scored = add_scores_to_aggregation(input_agg_path, scored_out_path)
+            logging.info(
+                "Scoring step complete: %d scored jobs",
+                len(scored.get("compatibility_scores", [])),
+            )
+        except Exception as e:
+            logging.error("Scoring failed: %s", CustomException(e, sys))
+            raise
 
     try:
         logging.info(
@@ -71,7 +77,7 @@ async def run_presenter_pipeline(
             if "preferences" in profile and "intake" not in profile:
                 profile["intake"] = profile.pop("preferences")
 
-            scored["profile"] = profile
+            scored = {**scored, "profile": profile}
 
             logging.info(
                 "Attached fetched profile to scored payload. "
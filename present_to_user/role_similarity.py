@@ -0,0 +1,212 @@
+# present_to_user/role_similarity.py
+
+"""
+Role-matching engine used by score_role.
+
+Titles are normalised once (lowercase, punctuation stripped, seniority,
+level and stop words removed, common abbreviations folded into canonical phrases)
+and cached. Similarity between two normalised titles is the mean of a
+token-set Dice coefficient and a character-trigram Dice coefficient, both
+linear in title length, instead of difflib.SequenceMatcher which is
+quadratic in the worst case. Pair results are memoised in an LRU keyed by
+the stripped, lowercased raw pair.
+
+Calibration mode additionally computes the old SequenceMatcher ratio for
+every scored pair and keeps running drift statistics (see drift_stats()
+and benchmarks/calibrate_role_similarity.py).
+"""
+
+import re
+import threading
+from collections import Counter
+from difflib import SequenceMatcher
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from utils.read_yaml import read_yaml
+from utils.logger import logging
+
+logger = logging.getLogger(__name__)
+
+config = read_yaml(Path("config/master_config.yaml"))
+_role_config = config.get("role_matching", {})
+
+# Level / seniority words that should not affect which job family a title is in.
+SENIORITY_TOKENS = frozenset({
+    "senior", "sr", "junior", "jr", "lead", "principal", "staff", "associate",
+    "intern", "internship", "trainee", "entry", "level", "mid", "graduate",
+    "i", "ii", "iii", "iv", "v", "1", "2", "3", "4",
+})
+
+STOPWORDS = frozenset({"a", "an", "and", "the", "of", "for", "in", "to", "at", "with", "&"})
+
+# Multi-word and single-word abbreviations folded before tokenising.
+PHRASE_SYNONYMS: Tuple[Tuple[str, str], ...] = (
+    (r"\bml\b", "machine learning"),
+    (r"\bai\b", "artificial intelligence"),
+    (r"\bnlp\b", "natural language processing"),
+    (r"\bcv\b", "computer vision"),
+    (r"\bswe\b", "software engineer"),
+    (r"\bsde\b", "software engineer"),
+    (r"\bsre\b", "site reliability engineer"),
+    (r"\bqa\b", "quality assurance"),
+    (r"\bux\b", "user experience"),
+    (r"\bui\b", "user interface"),
+    (r"\bpm\b", "product manager"),
+    (r"\bbi\b", "business intelligence"),
+    (r"\bfull[\s-]?stack\b", "fullstack"),
+    (r"\bfront[\s-]?end\b", "frontend"),
+    (r"\bback[\s-]?end\b", "backend"),
+    (r"\bdev[\s-]?ops\b", "devops"),
+    (r"\bml[\s-]?ops\b", "mlops"),
+)
+
+TOKEN_SYNONYMS: Dict[str, str] = {
+    "developer": "engineer",
+    "dev": "engineer",
+    "engg": "engineer",
+    "eng": "engineer",
+    "mgr": "manager",
+    "analytics": "analyst",
+    "scientists": "scientist",
+    "engineers": "engineer",
+    "developers": "engineer",
+    "managers": "manager",
+    "analysts": "analyst",
+    "programmer": "engineer",
+}
+
+_PUNCT_RE = re.compile(r"[^a-z0-9+#\s]+")
+
+
+class NormalizedTitle:
+    __slots__ = ("text", "tokens", "token_set", "trigrams")
+
+    def __init__(self, tokens: Tuple[str, ...]):
+        self.tokens = tokens
+        self.text = " ".join(tokens)
+        self.token_set: FrozenSet[str] = frozenset(tokens)
+        self.trigrams: Counter = _trigrams(self.text)
+
+
+def _trigrams(text: str) -> Counter:
+    padded = f"  {text} "
+    return Counter(padded[i:i + 3] for i in range(len(padded) - 2)) if text else Counter()
+
+
+def _dice_sets(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a and not b:
+        return 0.0
+    return 2.0 * len(a & b) / (len(a) + len(b))
+
+
+def _dice_counts(a: Counter, b: Counter) -> float:
+    total = sum(a.values()) + sum(b.values())
+    if not total:
+        return 0.0
+    return 2.0 * sum((a & b).values()) / total
+
+
+@lru_cache(maxsize=8192)
+def normalize_title(title: str) -> NormalizedTitle:
+    """Lowercase, fold abbreviations, drop punctuation, seniority tokens and stop words."""
+    t = (title or "").lower()
+    for pattern, replacement in PHRASE_SYNONYMS:
+        t = re.sub(pattern, replacement, t)
+    t = _PUNCT_RE.sub(" ", t)
+
+    tokens: List[str] = []
+    for tok in t.split():
+        tok = TOKEN_SYNONYMS.get(tok, tok)
+        if tok in SENIORITY_TOKENS or tok in STOPWORDS:
+            continue
+        tokens.append(tok)
+
+    # A title made only of seniority words ("Senior") keeps its raw tokens.
+    if not tokens:
+        tokens = t.split()
+    return NormalizedTitle(tuple(tokens))
+
+
+class RoleMatcher:
+    """
+    Memoised role similarity with optional drift tracking against SequenceMatcher.
+    """
+
+    def __init__(self, cache_size: int = 16384, calibrate: bool = False):
+        self.calibrate = calibrate
+        self._similarity = lru_cache(maxsize=cache_size)(self._similarity_uncached)
+        self._lock = threading.Lock()
+        self._drift_n = 0
+        self._drift_sum = 0.0
+        self._drift_max = 0.0
+
+    @staticmethod
+    def _similarity_uncached(p_raw: str, t_raw: str) -> Tuple[float, bool]:
+        p = normalize_title(p_raw)
+        t = normalize_title(t_raw)
+        sim = 0.5 * _dice_sets(p.token_set, t.token_set) + 0.5 * _dice_counts(p.trigrams, t.trigrams)
+        keyword_hit = bool(p.text) and (
+            p.text in t.text or any(tok in t.text for tok in p.tokens)
+        )
+        return sim, keyword_hit
+
+    def similarity(self, preferred_role: str, title: str) -> Tuple[float, bool]:
+        """(similarity 0..1, keyword hit) for a raw role/title pair."""
+        p = preferred_role.strip().lower()
+        t = title.strip().lower()
+        sim, keyword_hit = self._similarity(p, t)
+        if self.calibrate:
+            self._record_drift(sim, SequenceMatcher(None, p, t).ratio())
+        return sim, keyword_hit
+
+    def _record_drift(self, new: float, old: float) -> None:
+        diff = abs(new - old)
+        with self._lock:
+            self._drift_n += 1
+            self._drift_sum += diff
+            self._drift_max = max(self._drift_max, diff)
+
+    def drift_stats(self) -> Optional[Dict[str, float]]:
+        if not self.calibrate:
+            return None
+        with self._lock:
+            n = self._drift_n
+            return {
+                "pairs": n,
+                "mean_abs_drift": round(self._drift_sum / n, 4) if n else 0.0,
+                "max_abs_drift": round(self._drift_max, 4),
+            }
+
+    def cache_info(self) -> Dict[str, int]:
+        info = self._similarity.cache_info()
+        return {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+
+
+def calibration_report(pairs: Iterable[Tuple[str, str]]) -> Dict[str, float]:
+    """Compare RoleMatcher similarity with SequenceMatcher over (role, title) pairs."""
+    matcher = RoleMatcher()
+    diffs: List[float] = []
+    for role, title in pairs:
+        p, t = role.strip().lower(), title.strip().lower()
+        new, _ = matcher.similarity(role, title)
+        diffs.append(abs(new - SequenceMatcher(None, p, t).ratio()))
+
+    if not diffs:
+        return {"pairs": 0, "mean_abs_drift": 0.0, "p95_abs_drift": 0.0, "max_abs_drift": 0.0}
+    diffs.sort()
+    return {
+        "pairs": len(diffs),
+        "mean_abs_drift": round(sum(diffs) / len(diffs), 4),
+        "p95_abs_drift": round(diffs[min(len(diffs) - 1, int(0.95 * len(diffs)))], 4),
+        "max_abs_drift": round(diffs[-1], 4),
+    }
+
+
+ROLE_MATCHING_ENGINE = str(_role_config.get("engine", "index")).lower()
+
+role_matcher = RoleMatcher(
+    cache_size=int(_role_config.get("cache_size", 16384)),
+    calibrate=bool(_role_config.get("calibrate", False)),
+)
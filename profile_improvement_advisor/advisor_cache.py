@@ -0,0 +1,155 @@
+# profile_improvement_advisor/advisor_cache.py
+
+"""
+Persistent cache of advisor outputs.
+
+An advisor result depends on three things: the job, the user profile and
+the prompt. Each gets a stable fingerprint:
+
+- job_fingerprint(): normalized ADVISOR_JOB_FIELDS (trimmed, lowercased
+  strings, canonical URL, sorted skill lists); per-user fields such as
+  matched_criteria or scores are not part of it, and advisor_job_view()
+  keeps them out of the prompt too, so the key covers exactly what the
+  advisor sees;
+- profile_fingerprint(): the normalized profile passed to
+  build_profile_improvement_task;
+- prompt_fingerprint(): PROFILE_IMPROVEMENT_PROMPT_VERSION, the agent model,
+  its instructions and the task template.
+
+Keys are "<prompt>:<job>:<profile>" so invalidate_advisor_cache() can drop
+every entry for one job, one profile, or everything, and
+invalidate_advisor_profiles() every entry for earlier versions of a profile
+known only by fingerprint. Entries live in a
+size-bounded SqliteCache (advisor_cache in config/master_config.yaml).
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from career_research.job_aggregator import normalize_job_url
+from profile_improvement_advisor.profile_improvement_agent import (
+    PROFILE_IMPROVEMENT_INSTRUCTIONS,
+    PROFILE_IMPROVEMENT_PROMPT_VERSION,
+    PROFILE_IMPROVEMENT_TASK_TEMPLATE,
+    profile_improvement_agent,
+)
+from utils.read_yaml import read_yaml
+from utils.sqlite_cache import SqliteCache
+from utils.logger import logging
+
+logger = logging.getLogger(__name__)
+
+config = read_yaml(Path("config/master_config.yaml"))
+_advisor_cache_config = config.get("advisor_cache", {})
+
+# Job fields the advisor sees; everything else on a selected job is per-user or UI state.
+ADVISOR_JOB_FIELDS = (
+    "title",
+    "company",
+    "location_area",
+    "salary_min",
+    "salary_max",
+    "salary_currency",
+    "job_type",
+    "remote_type",
+    "job_url",
+    "required_skills",
+    "preferred_skills",
+    "experience_required",
+    "additional_comments",
+)
+
+advisor_cache = SqliteCache(
+    db_path=_advisor_cache_config.get("path", "cache/advisor_cache.db"),
+    namespace="advisor",
+    ttl_seconds=float(_advisor_cache_config.get("ttl_days", 7)) * 24 * 60 * 60,
+    max_bytes=int(float(_advisor_cache_config.get("max_mb", 32)) * 1024 * 1024),
+    enabled=bool(_advisor_cache_config.get("enabled", True)),
+)
+
+
+# ----------------------
+# Normalization
+# ----------------------
+def _normalize(value: Any) -> Any:
+    if isinstance(value, str):
+        return " ".join(value.split()).lower()
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items() if v not in (None, "", [], {})}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value if v not in (None, "")]
+    return str(value)
+
+
+def _digest(value: Any) -> str:
+    raw = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:24]
+
+
+def advisor_job_view(job: Dict[str, Any]) -> Dict[str, Any]:
+    """The job fields passed to the advisor prompt (ADVISOR_JOB_FIELDS that are set)."""
+    return {k: job[k] for k in ADVISOR_JOB_FIELDS if job.get(k) not in (None, "", [])}
+
+
+def job_fingerprint(job: Dict[str, Any]) -> str:
+    view = _normalize(advisor_job_view(job))
+    if "job_url" in view:
+        view["job_url"] = normalize_job_url(view["job_url"])
+    for skills in ("required_skills", "preferred_skills"):
+        if skills in view:
+            view[skills] = sorted(set(view[skills]))
+    return _digest(view)
+
+
+def profile_fingerprint(profile: Dict[str, Any]) -> str:
+    return _digest(_normalize(profile or {}))
+
+
+def prompt_fingerprint() -> str:
+    return _digest({
+        "version": PROFILE_IMPROVEMENT_PROMPT_VERSION,
+        "model": str(profile_improvement_agent.model),
+        "instructions": PROFILE_IMPROVEMENT_INSTRUCTIONS,
+        "template": PROFILE_IMPROVEMENT_TASK_TEMPLATE,
+    })[:12]
+
+
+_PROMPT_FINGERPRINT = prompt_fingerprint()
+
+
+def advisor_cache_key(job: Dict[str, Any], profile: Dict[str, Any]) -> str:
+    return f"{_PROMPT_FINGERPRINT}:{job_fingerprint(job)}:{profile_fingerprint(profile)}"
+
+
+# ----------------------
+# Invalidation
+# ----------------------
+def invalidate_advisor_cache(
+    job: Optional[Dict[str, Any]] = None,
+    profile: Optional[Dict[str, Any]] = None,
+) -> int:
+    """
+    Drop cached advisor outputs for one job, one profile, one job/profile pair,
+    or (no arguments) all of them. Returns how many entries were removed.
+    """
+    job_part = job_fingerprint(job) if job is not None else "%"
+    profile_part = profile_fingerprint(profile) if profile is not None else "%"
+    if job is None and profile is None:
+        removed = advisor_cache.clear()
+    else:
+        removed = advisor_cache.delete_like(f"%:{job_part}:{profile_part}")
+    logger.info("Invalidated %d advisor cache entries", removed)
+    return removed
+
+
+def invalidate_advisor_profiles(fingerprints: Iterable[str]) -> int:
+    """Drop cached advisor outputs for each profile fingerprint. Returns how many entries were removed."""
+    removed = sum(advisor_cache.delete_like(f"%:%:{fp}") for fp in dict.fromkeys(fingerprints) if fp)
+    logger.info("Invalidated %d advisor cache entries", removed)
+    return removed
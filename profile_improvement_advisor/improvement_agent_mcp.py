@@ -4,38 +4,18 @@ from typing import List
 
 from agents.mcp import MCPServerStdio
 
+from career_research.research_mcp_and_tools import (
+    researcher_mcp_stdio_servers as _shared_researcher_mcp_stdio_servers,
+)
+
 
 # ======================================
-# MCP SERVER HELPERS (unchanged)
+# MCP SERVER HELPERS (same servers as the research team)
 # ======================================
 
 def researcher_mcp_stdio_servers(
     client_session_timeout_seconds: int = 300,
 ) -> List[MCPServerStdio]:
-    servers: List[MCPServerStdio] = []
-
-    # ✅ Fetch MCP (Python, robust)
-    servers.append(
-        MCPServerStdio(
-            name="fetch_mcp",
-            params={
-                "command": "python",
-                "args": ["-m", "mcp_server_fetch"],
-            },
-            client_session_timeout_seconds=client_session_timeout_seconds,
-        )
+    return _shared_researcher_mcp_stdio_servers(
+        client_session_timeout_seconds=client_session_timeout_seconds,
     )
-
-    # ✅ DuckDuckGo MCP (already working)
-    servers.append(
-        MCPServerStdio(
-            name="ddg_mcp",
-            params={
-                "command": "ddg-search-mcp",
-                "args": [],
-            },
-            client_session_timeout_seconds=client_session_timeout_seconds,
-        )
-    )
-
-    return servers
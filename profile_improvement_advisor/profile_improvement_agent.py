@@ -12,6 +12,9 @@ from utils.exception import CustomException
 
 load_dotenv(override=True)
 
+# Part of the advisor cache key (advisor_cache.py): bump it when advisor behaviour changes without a prompt text change.
+PROFILE_IMPROVEMENT_PROMPT_VERSION = "1"
+
 PROFILE_IMPROVEMENT_INSTRUCTIONS = """
 You are the Profile Improvement Advisor Agent for a career assistant.
 
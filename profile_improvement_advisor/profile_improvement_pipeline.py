@@ -2,12 +2,13 @@
 
 import sys
 import asyncio
-from typing import Dict, Any, Optional, List
+from contextlib import AsyncExitStack
+from typing import Callable, Dict, Any, Optional, List, Sequence
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-from agents import Runner, trace
+from agents import Agent, Runner, trace
 from utils.logger import logging
 from utils.exception import CustomException
 
@@ -19,7 +20,16 @@ from profile_improvement_advisor.profile_improvement_agent import (
     build_profile_improvement_task,
 )
 
+from profile_improvement_advisor.advisor_cache import (
+    advisor_cache,
+    advisor_cache_key,
+    advisor_job_view,
+    invalidate_advisor_profiles,
+    profile_fingerprint,
+)
 from career_research.fetch_user_profile import fetch_user_profile_async
+from utils.mcp_server_pool import MCPServerPool
+from utils.read_yaml import read_yaml
 
 load_dotenv(override=True)
 
@@ -27,6 +37,12 @@ MEMORY_DB_PATH = "memory/userprofile.db"
 USER_SELECTION_PATH = "input/user_selected_jobs.json"
 PROFILE_IMPROVEMENT_MAX_TURNS = 2
 
+config = read_yaml(Path("config/master_config.yaml"))
+_advisor_config = config.get("advisor", {})
+# How many selected jobs are advised at once, and how long one job may take.
+ADVISOR_CONCURRENCY = int(_advisor_config.get("concurrency", 3))
+ADVISOR_JOB_TIMEOUT_SECONDS = float(_advisor_config.get("job_timeout_seconds", 180))
+
 
 
 async def _safe_server_cleanup(server):
@@ -52,10 +68,9 @@ async def _safe_runner_close(runner: Runner):
 
 
 
-async def _load_user_profile_from_memory() -> Dict[str, Any]:
+async def _load_user_profile_from_memory(memory_db_path: str = MEMORY_DB_PATH) -> Dict[str, Any]:
     """Load user profile from memory database."""
     try:
-        memory_db_path = MEMORY_DB_PATH
         logging.info(
             "Attempting to fetch user profile from memory DB at %s",
             memory_db_path,
@@ -83,9 +98,9 @@ async def _load_user_profile_from_memory() -> Dict[str, Any]:
         return {}
 
 
-def _load_user_selection() -> Dict[str, Any]:
+def _load_user_selection(selection_path: str = USER_SELECTION_PATH) -> Dict[str, Any]:
     """
-    Load user job selection from input/user_selected_jobs.json.
+    Load user job selection from selection_path (input/user_selected_jobs.json by default).
 
     Expected format:
     {
@@ -98,12 +113,12 @@ def _load_user_selection() -> Dict[str, Any]:
     Returns empty dict if file not found or invalid.
     """
     try:
-        selection_path = Path(USER_SELECTION_PATH)
+        selection_path = Path(selection_path)
 
         if not selection_path.exists():
             logging.warning(
                 "User selection file not found at %s",
-                USER_SELECTION_PATH,
+                selection_path,
             )
             return {}
 
@@ -122,7 +137,7 @@ def _load_user_selection() -> Dict[str, Any]:
     except Exception as e:
         logging.error(
             "Failed to load user selection from %s: %s",
-            USER_SELECTION_PATH,
+            selection_path,
             CustomException(e, sys),
         )
         return {}
@@ -132,32 +147,47 @@ async def _run_advisor_for_job(
     job: Dict[str, Any],
     user_profile: Dict[str, Any],
     runner: Runner,
-    active_mcp_servers: List[Any],
+    advisor_agent: Agent,
 ) -> Dict[str, Any]:
     """
     Run profile improvement advisor for a single job.
+    Successful outputs are cached (advisor_cache.py); a cache hit skips the model call.
 
     Returns dict with:
         - job_title: str
         - company: str
         - summary_text: str (advisor output)
+        - cached: bool (True when served from the advisor cache)
         - error: str (optional, if failed)
     """
     job_title = job.get("title", "Unknown")
     company = job.get("company", "Unknown")
 
     try:
+        cache_key = advisor_cache_key(job, user_profile)
+        cached = await advisor_cache.aget(cache_key)
+        if cached:
+            logging.info("Advisor cache hit for: %s at %s", job_title, company)
+            return {
+                "job_title": job_title,
+                "company": company,
+                "location": job.get("location_area", ""),
+                "job_url": job.get("job_url", ""),
+                "summary_text": cached,
+                "cached": True,
+            }
+
         logging.info(
             "Running advisor for: %s at %s",
             job_title,
             company,
         )
 
-        task = build_profile_improvement_task(job, user_profile)
+        task = build_profile_improvement_task(advisor_job_view(job), user_profile)
 
         with trace(f"Profile Improvement - {job_title}"):
             result = await runner.run(
-                profile_improvement_agent,
+                advisor_agent,
                 task,
                 max_turns=PROFILE_IMPROVEMENT_MAX_TURNS,
             )
@@ -174,12 +204,14 @@ async def _run_advisor_for_job(
             }
 
         logging.info("Successfully completed advisor for %s", job_title)
+        await advisor_cache.aset(cache_key, raw_output)
         return {
             "job_title": job_title,
             "company": company,
             "location": job.get("location_area", ""),
             "job_url": job.get("job_url", ""),
             "summary_text": raw_output,
+            "cached": False,
         }
 
     except Exception as e:
@@ -196,23 +228,123 @@ async def _run_advisor_for_job(
         }
 
 
+async def _run_advisor_with_limits(
+    job: Dict[str, Any],
+    user_profile: Dict[str, Any],
+    runner: Runner,
+    advisor_agent: Agent,
+    semaphore: asyncio.Semaphore,
+    timeout_seconds: float,
+) -> Dict[str, Any]:
+    """_run_advisor_for_job under the shared concurrency limit and a per-job timeout."""
+    async with semaphore:
+        try:
+            return await asyncio.wait_for(
+                _run_advisor_for_job(job, user_profile, runner, advisor_agent),
+                timeout=timeout_seconds,
+            )
+        except asyncio.TimeoutError:
+            job_title = job.get("title", "Unknown")
+            logging.warning("Advisor timed out after %.0fs for %s", timeout_seconds, job_title)
+            return {
+                "job_title": job_title,
+                "company": job.get("company", "Unknown"),
+                "location": job.get("location_area", ""),
+                "job_url": job.get("job_url", ""),
+                "summary_text": "The advisor ran out of time before finishing an improvement plan for this role.",
+                "error": "timeout",
+            }
+
+
+def build_improvement_markdown(result_dict: Dict[str, Any]) -> str:
+    """
+    Markdown report for a (possibly partial) pipeline result.
+    Entries of result_dict["results"] that are still None render as in progress.
+    """
+    results = result_dict.get("results", [])
+    finished = sum(1 for r in results if r is not None)
+
+    markdown_output = f"# Profile Improvement Report\n\n"
+    markdown_output += f"**Generated:** {result_dict.get('timestamp', 'N/A')}\n\n"
+    markdown_output += f"**Jobs Analyzed:** {result_dict.get('total_jobs', 0)}\n\n"
+    markdown_output += f"**Successful:** {result_dict.get('successful', 0)}\n\n"
+    if finished < len(results):
+        markdown_output += f"**In progress:** {finished}/{len(results)} jobs finished\n\n"
+    markdown_output += "---\n\n"
+
+    for idx, job_result in enumerate(results, 1):
+        if job_result is None:
+            markdown_output += f"## {idx}. In progress\n\n"
+            markdown_output += "_The advisor is still working on this role._\n\n---\n\n"
+            continue
+        markdown_output += f"## {idx}. {job_result.get('job_title', 'Unknown')}\n\n"
+        markdown_output += f"**Company:** {job_result.get('company', 'N/A')}\n\n"
+        markdown_output += f"**Location:** {job_result.get('location', 'N/A')}\n\n"
+        if job_result.get('job_url'):
+            markdown_output += f"**Link:** {job_result['job_url']}\n\n"
+        markdown_output += f"### Improvement Recommendations\n\n"
+        markdown_output += job_result.get('summary_text', 'No recommendations available')
+        markdown_output += "\n\n---\n\n"
+    return markdown_output
+
+
+async def _write_markdown(path: Path, markdown_output: str) -> None:
+    """Threaded write, shielded so it completes even if the pipeline is cancelled."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    await asyncio.shield(asyncio.to_thread(path.write_text, markdown_output, "utf-8"))
+
+
+async def advisor_profile_fingerprint(memory_db_path: str = MEMORY_DB_PATH) -> str:
+    """Fingerprint the advisor cache keys the profile stored at memory_db_path under."""
+    return profile_fingerprint(await _load_user_profile_from_memory(memory_db_path))
+
+
+async def invalidate_advisor_cache_for_profile(
+    memory_db_path: str = MEMORY_DB_PATH,
+    previous_fingerprints: Sequence[str] = (),
+) -> int:
+    """
+    Drop cached advisor outputs for the profile stored at memory_db_path and
+    for earlier versions of it (previous_fingerprints, recorded when it changed).
+    """
+    fingerprints = [await advisor_profile_fingerprint(memory_db_path), *previous_fingerprints]
+    return await asyncio.to_thread(invalidate_advisor_profiles, fingerprints)
+
+
 async def run_profile_improvement_pipeline(
     runner: Optional[Runner] = None,
     mcp_client_session_timeout_seconds: int = 120,
     selection_data: Optional[Dict[str, Any]] = None,
     output_path: Optional[str] = None,
+    memory_db_path: str = MEMORY_DB_PATH,
+    selection_path: str = USER_SELECTION_PATH,
+    mcp_pool: Optional[MCPServerPool] = None,
+    on_event: Optional[Callable[..., Any]] = None,
+    concurrency: Optional[int] = None,
+    job_timeout_seconds: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
     Loads user selection (unless provided via selection_data) and runs the Profile Improvement Advisor.
 
+    memory_db_path and selection_path point at the run's own files, so concurrent
+    runs never read each other's profile or selection. MCP servers are attached to
+    a per-call clone of the advisor agent instead of the shared module-level agent.
+    When mcp_pool is given, servers are leased from it instead of spawned per call.
+    on_event (optional) receives "advisor.job_done" after each job.
+
+    Up to concurrency jobs (advisor.concurrency) are advised at once, each bounded
+    by job_timeout_seconds (advisor.job_timeout_seconds); results keep the order of
+    selected_jobs whatever order they finish in.
+
     If output_path is provided the pipeline will attempt to write a markdown report there
-    (using a shielded threaded write so it completes even if cancellation occurs).
+    (using a shielded threaded write so it completes even if cancellation occurs). The
+    report is rewritten as each job finishes, so partial results are readable early.
     The returned dict will include "output_path" when the file was written successfully.
     """
     #### print("#### PROFILE_IMPROVEMENT_PIPELINE: start") ####
 
     if selection_data is None:
-        selection_data = _load_user_selection()
+        selection_data = _load_user_selection(selection_path)
 
     if not selection_data:
         logging.error("No user selection data found")
@@ -220,7 +352,7 @@ async def run_profile_improvement_pipeline(
         return {
             "status": "failed",
             "error": "no_selection_data",
-            "message": "Could not load user job selection from input/user_selected_jobs.json",
+            "message": f"Could not load user job selection from {selection_path}",
         }
 
     selected_jobs = selection_data.get("selected_jobs", [])
@@ -233,16 +365,16 @@ async def run_profile_improvement_pipeline(
             "message": "User selection file contains no jobs",
         }
 
-    user_profile = await _load_user_profile_from_memory()
+    user_profile = await _load_user_profile_from_memory(memory_db_path)
 
     close_runner = False
     if runner is None:
         runner = Runner()
         close_runner = True
 
-    original_tools = getattr(profile_improvement_agent, "tools", None)
-    original_mcp_servers = getattr(profile_improvement_agent, "mcp_servers", None)
     active_mcp_servers: List[Any] = []
+    advisor_agent = profile_improvement_agent
+    lease_stack = AsyncExitStack()
 
     try:
         logging.info(
@@ -253,9 +385,16 @@ async def run_profile_improvement_pipeline(
         #### print(f"#### DEBUG: selected_jobs count = {len(selected_jobs)}") ####
 
         try:
-            servers = researcher_mcp_stdio_servers(
-                client_session_timeout_seconds=mcp_client_session_timeout_seconds
-            )
+            if mcp_pool is not None:
+                servers = []
+                active_mcp_servers.extend(
+                    await lease_stack.enter_async_context(mcp_pool.lease())
+                )
+                logging.info("Leased %d MCP servers from pool", len(active_mcp_servers))
+            else:
+                servers = researcher_mcp_stdio_servers(
+                    client_session_timeout_seconds=mcp_client_session_timeout_seconds
+                )
 
             for server in servers:
                 try:
@@ -270,11 +409,7 @@ async def run_profile_improvement_pipeline(
                         "Connection to MCP server %s was cancelled",
                         getattr(server, "name", "unknown"),
                     )
-                    return {
-                        "status": "failed",
-                        "error": "cancelled",
-                        "message": "MCP server connection cancelled",
-                    }
+                    raise
                 except Exception as connect_exc:
                     logging.error(
                         "Failed to connect MCP server %s: %s",
@@ -283,7 +418,9 @@ async def run_profile_improvement_pipeline(
                     )
 
             if active_mcp_servers:
-                profile_improvement_agent.mcp_servers = active_mcp_servers
+                advisor_agent = profile_improvement_agent.clone(
+                    mcp_servers=list(active_mcp_servers)
+                )
                 logging.info(
                     "Attached %d MCP servers to the agent",
                     len(active_mcp_servers),
@@ -295,24 +432,70 @@ async def run_profile_improvement_pipeline(
         except Exception as e:
             logging.error("Failed to setup MCP servers: %s", CustomException(e, sys))
 
-        results: List[Dict[str, Any]] = []
+        limit = max(1, concurrency or ADVISOR_CONCURRENCY)
+        timeout_seconds = job_timeout_seconds or ADVISOR_JOB_TIMEOUT_SECONDS
+        semaphore = asyncio.Semaphore(limit)
+        report_lock = asyncio.Lock()
+
+        # Filled by index so the report keeps selection order; None = still running.
+        results: List[Optional[Dict[str, Any]]] = [None] * len(selected_jobs)
         successful_count = 0
 
-        for idx, job in enumerate(selected_jobs, 1):
+        logging.info(
+            "Advising %d jobs with concurrency %d (timeout %.0fs per job)",
+            len(selected_jobs),
+            limit,
+            timeout_seconds,
+        )
+
+        async def _write_partial_report() -> None:
+            async with report_lock:
+                partial = {
+                    "timestamp": selection_data.get("timestamp", ""),
+                    "total_jobs": len(selected_jobs),
+                    "successful": successful_count,
+                    "results": results,
+                }
+                try:
+                    await _write_markdown(Path(output_path), build_improvement_markdown(partial))
+                except Exception as e:
+                    logging.warning("Failed to write partial improvement report: %s", e)
+
+        async def _advise(idx: int, job: Dict[str, Any]) -> None:
+            nonlocal successful_count
             logging.info("Processing job %d/%d", idx, len(selected_jobs))
 
-            result = await _run_advisor_for_job(
+            result = await _run_advisor_with_limits(
                 job,
                 user_profile,
                 runner,
-                active_mcp_servers,
+                advisor_agent,
+                semaphore,
+                timeout_seconds,
             )
 
-            results.append(result)
+            results[idx - 1] = result
 
             if "error" not in result:
                 successful_count += 1
 
+            if on_event:
+                on_event(
+                    "advisor.job_done",
+                    index=idx,
+                    total=len(selected_jobs),
+                    job_title=result.get("job_title"),
+                    company=result.get("company"),
+                    ok="error" not in result,
+                )
+
+            if output_path:
+                await _write_partial_report()
+
+        await asyncio.gather(
+            *(_advise(idx, job) for idx, job in enumerate(selected_jobs, 1))
+        )
+
         if successful_count == len(selected_jobs):
             status = "success"
         elif successful_count > 0:
@@ -338,25 +521,8 @@ async def run_profile_improvement_pipeline(
         if output_path:
             try:
                 outp = Path(output_path)
-                outp.parent.mkdir(parents=True, exist_ok=True)
-
-
-                markdown_output = f"# Profile Improvement Report\n\n"
-                markdown_output += f"**Generated:** {result_dict.get('timestamp', '')}\n\n"
-                markdown_output += f"**Jobs Analyzed:** {result_dict.get('total_jobs', 0)}\n\n"
-                markdown_output += f"**Successful:** {result_dict.get('successful', 0)}\n\n"
-                markdown_output += "---\n\n"
-                for idx, job_result in enumerate(result_dict.get("results", []), 1):
-                    markdown_output += f"## {idx}. {job_result.get('job_title', 'Unknown')}\n\n"
-                    markdown_output += f"**Company:** {job_result.get('company', 'N/A')}\n\n"
-                    markdown_output += f"**Location:** {job_result.get('location', 'N/A')}\n\n"
-                    if job_result.get('job_url'):
-                        markdown_output += f"**Link:** {job_result['job_url']}\n\n"
-                    markdown_output += f"### Improvement Recommendations\n\n"
-                    markdown_output += job_result.get('summary_text', 'No recommendations available')
-                    markdown_output += "\n\n---\n\n"
-
-                await asyncio.shield(asyncio.to_thread(outp.write_text, markdown_output, "utf-8"))
+                async with report_lock:
+                    await _write_markdown(outp, build_improvement_markdown(result_dict))
                 logging.info("Wrote profile improvement markdown to %s", outp.resolve())
                 result_dict["output_path"] = str(outp.resolve())
             except Exception as e:
@@ -369,12 +535,9 @@ async def run_profile_improvement_pipeline(
         return result_dict
 
     except asyncio.CancelledError as e:
+        # Propagate: the caller (/cancel via the scheduler) must not see a finished run.
         logging.warning("Profile improvement pipeline was cancelled: %s", e)
-        return {
-            "status": "failed",
-            "error": "cancelled",
-            "message": "Pipeline was cancelled before completion.",
-        }
+        raise
 
     except Exception as e:
         logging.error("Profile improvement pipeline failed: %s", CustomException(e, sys))
@@ -385,28 +548,15 @@ async def run_profile_improvement_pipeline(
         }
 
     finally:
-        try:
-            if original_tools is not None:
-                profile_improvement_agent.tools = original_tools
-            else:
-                if hasattr(profile_improvement_agent, "tools"):
-                    delattr(profile_improvement_agent, "tools")
-        except Exception:
-            logging.debug("Failed to restore original agent tools", exc_info=True)
-
-        try:
-            if original_mcp_servers is not None:
-                profile_improvement_agent.mcp_servers = original_mcp_servers
-            elif hasattr(profile_improvement_agent, "mcp_servers"):
-                delattr(profile_improvement_agent, "mcp_servers")
-        except Exception:
-            logging.debug("Failed to restore original mcp_servers", exc_info=True)
-
-        for server in active_mcp_servers:
-            try:
-                asyncio.create_task(_safe_server_cleanup(server))
-            except Exception as e:
-                logging.debug("Failed to schedule safe cleanup for MCP server %s: %s", getattr(server, "name", "unknown"), e)
+        if mcp_pool is not None:
+            # Pooled servers go back to the pool; the pool owns their lifecycle.
+            await lease_stack.aclose()
+        else:
+            for server in active_mcp_servers:
+                try:
+                    asyncio.create_task(_safe_server_cleanup(server))
+                except Exception as e:
+                    logging.debug("Failed to schedule safe cleanup for MCP server %s: %s", getattr(server, "name", "unknown"), e)
 
         if close_runner:
             try:
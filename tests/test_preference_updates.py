@@ -0,0 +1,129 @@
+# tests/test_preference_updates.py
+
+"""
+/update_preferences only re-runs the paid research phase when a field the
+job search actually uses changes, and the research fingerprint covers what
+the juniors are actually sent. Run from the repo root:
+    python -m pytest -q tests
+"""
+
+import asyncio
+import contextlib
+
+import pytest
+
+import main
+from career_research import research_pipeline
+from career_research.career_researcher_agent import JobSearchOutput
+from full_pipeline_files import pipeline_dag
+from full_pipeline_files.artifact_store import ARTIFACT_AGGREGATION
+from full_pipeline_files.pipeline_dag import StageContext, job_pipeline, save_manifest
+from full_pipeline_files.run_registry import RunRegistry
+
+PREFERENCES = {
+    "preferred_role": "Data Scientist",
+    "preferred_locations": ["Bangalore"],
+    "remote_preference": "hybrid",
+    "target_salary_lpa": 20,
+    "user_reported_years_experience": 3,
+}
+RESUME = {"location": "Bangalore", "top_technical_skills": ["PyTorch", "SQL"], "years_experience": 3}
+
+
+@pytest.fixture
+def researched_run(tmp_path, monkeypatch):
+    """A run whose research stage completed with PREFERENCES; queued phases are recorded, not run."""
+    registry = RunRegistry(tmp_path / "input", tmp_path / "outputs", tmp_path / "memory")
+    monkeypatch.setattr(main, "runs", registry)
+    run = registry.create()
+    run.update(state="done", step="present", file="resume.pdf", preferences=dict(PREFERENCES))
+
+    async def fetch_profile(_db_path):
+        return {"preferences": run.status["preferences"], "resume": RESUME}
+
+    async def save_preferences(_prefs, memory_db_path=None):
+        return None
+
+    async def fingerprint(_db_path):
+        return "fp-" + str(run.status["preferences"].get("target_salary_lpa"))
+
+    submitted = []
+    monkeypatch.setattr(pipeline_dag, "fetch_user_profile_async", fetch_profile)
+    monkeypatch.setattr(main, "save_user_preferences", save_preferences)
+    monkeypatch.setattr(main, "advisor_profile_fingerprint", fingerprint)
+    monkeypatch.setattr(main, "_submit_or_429", lambda r, phase, factory: submitted.append(phase))
+
+    steps = asyncio.run(job_pipeline.plan(StageContext(run, main.MODEL)))
+    research = next(s for s in steps if s["stage"] == "research")
+    save_manifest(
+        run.output_dir / pipeline_dag.MANIFEST_NAME,
+        {"research": {"fingerprint": research["fingerprint"], "token": "t0"}},
+    )
+    run.artifacts.put(ARTIFACT_AGGREGATION, {"best_matches": []})
+    yield run, submitted
+    registry.remove(run.run_id)
+
+
+def test_salary_edit_only_rescores(researched_run):
+    run, submitted = researched_run
+    result = asyncio.run(main.update_preferences(run_id=run.run_id, preferences={"target_salary_lpa": 35}))
+
+    assert result["changed"] == ["target_salary_lpa"]
+    assert result["rerun"] == "rescore"
+    assert submitted == ["present"]
+    # Advisor outputs cached under the old profile can still be invalidated for this run.
+    assert run.status["previous_profile_fingerprints"] == ["fp-20"]
+
+
+def test_experience_edit_reruns_research(researched_run):
+    # The DuckDuckGo agent filters postings by years_experience.
+    run, submitted = researched_run
+    result = asyncio.run(
+        main.update_preferences(run_id=run.run_id, preferences={"user_reported_years_experience": 6})
+    )
+
+    assert result["rerun"] == "research"
+    assert submitted == ["research"]
+
+
+def test_role_edit_reruns_research(researched_run):
+    run, submitted = researched_run
+    result = asyncio.run(main.update_preferences(run_id=run.run_id, preferences={"preferred_role": "ML Engineer"}))
+
+    assert result["rerun"] == "research"
+    assert submitted == ["research"]
+
+
+def test_ddg_task_carries_the_fingerprinted_profile(monkeypatch):
+    profile = {"preferences": dict(PREFERENCES), "resume": RESUME}
+    tasks = {}
+
+    async def fetch_profile(_db_path):
+        return profile
+
+    async def create_agents(model, mcp_servers):
+        return "jsearch", "adzuna", "ddg"
+
+    async def run_junior(agent, task):
+        tasks[agent] = task
+        return JobSearchOutput()
+
+    async def direct_search(_mini_profile, default_country=None):
+        return JobSearchOutput()
+
+    monkeypatch.setattr(research_pipeline, "fetch_user_profile_async", fetch_profile)
+    monkeypatch.setattr(research_pipeline, "create_multi_source_career_research_agents", create_agents)
+    monkeypatch.setattr(research_pipeline, "researcher_mcp_stdio_servers", lambda: [])
+    monkeypatch.setattr(research_pipeline, "safe_run_junior", run_junior)
+    monkeypatch.setattr(research_pipeline, "direct_search_jsearch", direct_search)
+    monkeypatch.setattr(research_pipeline, "direct_search_adzuna", direct_search)
+    monkeypatch.setattr(research_pipeline, "JUNIOR_MODE", "direct")
+    monkeypatch.setattr(research_pipeline, "trace", lambda _name: contextlib.nullcontext())
+
+    asyncio.run(research_pipeline.run_career_research("unused.db"))
+
+    mini_profile = research_pipeline.minimize_profile(profile)
+    ddg_profile = research_pipeline.junior_task_profiles(mini_profile, "direct")["ddg"]
+    assert tasks["ddg"] == research_pipeline.build_junior_task(ddg_profile)
+    assert '"top_skills"' in tasks["ddg"] and '"years_experience"' in tasks["ddg"]
+    assert "target_salary_lpa" not in tasks["ddg"]
@@ -0,0 +1,39 @@
+# tests/test_resume_field_extractor.py
+
+"""
+Phone numbers in the resume header: bare numbers are phones unless an ID
+label precedes them. Run from the repo root:
+    python -m pytest -q tests
+"""
+
+import pytest
+
+from memory_saving.resume_field_extractor import extract_contact_fields
+
+
+@pytest.mark.parametrize(
+    "header, phone",
+    [
+        ("Jane Doe | 9876543210 | jane@x.com", "9876543210"),
+        ("Jane Doe\n919876543210", "919876543210"),
+        ("Jane Doe\n+91 98765 43210", "+91 98765 43210"),
+        ("Jane Doe\n(555) 123-4567", "(555) 123-4567"),
+        ("Jane Doe\nMobile No.: 9876543210", "9876543210"),
+        ("Jane Doe\nStudent ID 20231234567 | 9876543210", "9876543210"),
+    ],
+)
+def test_header_phone_forms(header, phone):
+    assert extract_contact_fields(header)["phone"] == phone
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        "Jane Doe\nStudent ID 20231234567",
+        "Jane Doe\nRoll No. 1234567890",
+        "Jane Doe\nReg. No: 9876543210",
+        "Jane Doe\nB.Tech 2019 - 2023",
+    ],
+)
+def test_header_numbers_that_are_not_phones(header):
+    assert extract_contact_fields(header)["phone"] == ""
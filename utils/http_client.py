@@ -0,0 +1,126 @@
+# utils/http_client.py
+
+"""
+Process-wide pooled httpx.AsyncClient for outbound API calls (JSearch, Adzuna).
+
+One client keeps HTTP keep-alive connections open across tool calls and runs,
+with configurable connect/read timeouts. A per-host semaphore caps how many
+requests hit the same API at once, so parallel junior agents overlap their
+network I/O without hammering a single rate-limited host.
+
+The client is bound to the event loop that created it; get_http_client()
+transparently rebuilds it when called from a new loop (e.g. repeated
+asyncio.run() in CLI scripts). close_http_client() is called from the API
+lifespan on shutdown.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from utils.read_yaml import read_yaml
+from utils.logger import logging
+
+logger = logging.getLogger(__name__)
+
+config = read_yaml(Path("config/master_config.yaml"))
+_http_config = config.get("http_client", {})
+
+CONNECT_TIMEOUT_SECONDS = float(_http_config.get("connect_timeout_seconds", 5))
+READ_TIMEOUT_SECONDS = float(_http_config.get("read_timeout_seconds", 30))
+MAX_CONNECTIONS = int(_http_config.get("max_connections", 20))
+MAX_KEEPALIVE_CONNECTIONS = int(_http_config.get("max_keepalive_connections", 10))
+KEEPALIVE_EXPIRY_SECONDS = float(_http_config.get("keepalive_expiry_seconds", 30))
+PER_HOST_LIMIT = int(_http_config.get("per_host_limit", 4))
+HOST_LIMITS: Dict[str, int] = dict(_http_config.get("host_limits", {}) or {})
+
+
+class SharedHttpClient:
+    """httpx.AsyncClient plus per-host concurrency limits and simple counters."""
+
+    def __init__(self):
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                READ_TIMEOUT_SECONDS,
+                connect=CONNECT_TIMEOUT_SECONDS,
+            ),
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        )
+        self.loop = asyncio.get_running_loop()
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self.requests = 0
+        self.errors = 0
+        self.in_flight: Dict[str, int] = {}
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        sem = self._host_limits.get(host)
+        if sem is None:
+            sem = asyncio.Semaphore(max(1, int(HOST_LIMITS.get(host, PER_HOST_LIMIT))))
+            self._host_limits[host] = sem
+        return sem
+
+    async def get_json(
+        self,
+        url: str,
+        params: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """GET url under the host's concurrency limit; raises on HTTP errors."""
+        host = urlsplit(url).hostname or ""
+        async with self._semaphore(host):
+            self.in_flight[host] = self.in_flight.get(host, 0) + 1
+            self.requests += 1
+            try:
+                resp = await self.client.get(url, params=params, headers=headers)
+                resp.raise_for_status()
+                return resp.json()
+            except Exception:
+                self.errors += 1
+                raise
+            finally:
+                self.in_flight[host] -= 1
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": {h: n for h, n in self.in_flight.items() if n},
+        }
+
+
+_shared: Optional[SharedHttpClient] = None
+
+
+def get_http_client() -> SharedHttpClient:
+    """Return the shared client for the running loop, creating it on first use."""
+    global _shared
+    loop = asyncio.get_running_loop()
+    if _shared is None or _shared.loop is not loop or _shared.client.is_closed:
+        _shared = SharedHttpClient()
+        logger.info(
+            "Created shared HTTP client (max_connections=%d, per_host_limit=%d)",
+            MAX_CONNECTIONS, PER_HOST_LIMIT,
+        )
+    return _shared
+
+
+async def close_http_client() -> None:
+    global _shared
+    if _shared is not None:
+        await _shared.aclose()
+        _shared = None
+        logger.info("Closed shared HTTP client")
+
+
+def http_client_stats() -> Optional[Dict[str, Any]]:
+    return _shared.stats() if _shared is not None else None
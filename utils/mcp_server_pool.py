@@ -0,0 +1,289 @@
+# utils/mcp_server_pool.py
+
+"""
+Process-wide pool of long-lived MCP stdio servers.
+
+Instead of spawning `python -m mcp_server_fetch` / `ddg-search-mcp` for every
+research or advisor run, the API starts a few copies of each server once (in
+the FastAPI lifespan) and leases them to runs.
+
+Each pooled server is owned by its own supervisor task which does connect()
+and cleanup(). The MCP stdio client uses anyio cancel scopes that must be
+entered and exited in the same task, so keeping both ends in one supervisor
+makes reconnects and shutdown safe no matter which run noticed the failure.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence
+
+from utils.logger import logging
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledServer:
+    """One pool slot: a server instance plus the supervisor task that owns it."""
+
+    def __init__(self, name: str, index: int, factory: Callable[[], Any]):
+        self.name = name
+        self.index = index
+        self.factory = factory
+        self.server: Any = None
+        self.ready = asyncio.Event()
+        self.healthy = False
+        self.in_use = False
+        self.reconnects = 0
+        self.last_checked = 0.0
+        self._cycle = asyncio.Event()
+        self._stopping = False
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def label(self) -> str:
+        return f"{self.name}#{self.index}"
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._supervise(), name=f"mcp-pool-{self.label}")
+
+    async def stop(self) -> None:
+        self._stopping = True
+        self._cycle.set()
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(self._task, timeout=15)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                self._task.cancel()
+            except Exception:
+                logger.debug("MCP pool: supervisor for %s exited with error", self.label, exc_info=True)
+
+    def request_reconnect(self) -> None:
+        if not self._stopping:
+            logger.warning("MCP pool: reconnect requested for %s", self.label)
+            self.healthy = False
+            self.ready.clear()
+            self._cycle.set()
+
+    async def _supervise(self) -> None:
+        backoff = 1.0
+        while not self._stopping:
+            server = self.factory()
+            try:
+                await server.connect()
+            except Exception as e:
+                logger.error("MCP pool: failed to connect %s: %s", self.label, e)
+                try:
+                    await server.cleanup()
+                except Exception:
+                    pass
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+                continue
+
+            self.server = server
+            self.healthy = True
+            self.last_checked = time.monotonic()
+            self.ready.set()
+            backoff = 1.0
+            logger.info("MCP pool: %s connected", self.label)
+
+            await self._cycle.wait()
+            self._cycle.clear()
+            self.ready.clear()
+            self.healthy = False
+
+            try:
+                await server.cleanup()
+                logger.info("MCP pool: %s cleaned up", self.label)
+            except Exception:
+                logger.debug("MCP pool: cleanup error for %s", self.label, exc_info=True)
+
+            if not self._stopping:
+                self.reconnects += 1
+
+    async def health_check(self, timeout: float) -> bool:
+        if not self.ready.is_set() or self.server is None:
+            return False
+        try:
+            await asyncio.wait_for(self.server.list_tools(), timeout=timeout)
+            self.healthy = True
+        except Exception as e:
+            logger.warning("MCP pool: health check failed for %s: %s", self.label, e)
+            self.healthy = False
+        self.last_checked = time.monotonic()
+        return self.healthy
+
+
+class MCPServerPool:
+    """
+    Lease-based pool of MCP servers keyed by name.
+
+    factories maps a server name (e.g. "fetch_mcp") to a zero-arg callable that
+    builds a fresh, unconnected MCPServerStdio. size_per_server copies of each
+    are kept connected; lease() hands one copy of each requested name to the
+    caller and returns it to the pool afterwards.
+    """
+
+    def __init__(
+        self,
+        factories: Dict[str, Callable[[], Any]],
+        size_per_server: int = 2,
+        lease_timeout_seconds: float = 30.0,
+        health_check_interval_seconds: float = 60.0,
+        health_check_timeout_seconds: float = 10.0,
+    ):
+        self.factories = dict(factories)
+        self.size_per_server = max(1, int(size_per_server))
+        self.lease_timeout_seconds = lease_timeout_seconds
+        self.health_check_interval_seconds = health_check_interval_seconds
+        self.health_check_timeout_seconds = health_check_timeout_seconds
+
+        self._slots: Dict[str, List[_PooledServer]] = {}
+        self._idle: Dict[str, asyncio.Queue] = {}
+        self._health_task: Optional[asyncio.Task] = None
+        self._started = False
+
+        self._lease_count: Dict[str, int] = {name: 0 for name in self.factories}
+        self._lease_failures: Dict[str, int] = {name: 0 for name in self.factories}
+        self._wait_total: Dict[str, float] = {name: 0.0 for name in self.factories}
+        self._wait_max: Dict[str, float] = {name: 0.0 for name in self.factories}
+
+    # ----------------------
+    # Lifecycle
+    # ----------------------
+    async def start(self, wait_ready_seconds: float = 30.0) -> None:
+        if self._started:
+            return
+        for name, factory in self.factories.items():
+            self._idle[name] = asyncio.Queue()
+            self._slots[name] = []
+            for i in range(self.size_per_server):
+                slot = _PooledServer(name, i, factory)
+                slot.start()
+                self._slots[name].append(slot)
+                self._idle[name].put_nowait(slot)
+
+        self._started = True
+
+        all_slots = [slot for slots in self._slots.values() for slot in slots]
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(slot.ready.wait() for slot in all_slots)),
+                timeout=wait_ready_seconds,
+            )
+        except asyncio.TimeoutError:
+            pending = [slot.label for slot in all_slots if not slot.ready.is_set()]
+            logger.warning("MCP pool: still connecting after %.0fs: %s", wait_ready_seconds, pending)
+
+        self._health_task = asyncio.create_task(self._health_loop(), name="mcp-pool-health")
+        logger.info(
+            "MCP pool started: %s x%d",
+            list(self.factories), self.size_per_server,
+        )
+
+    async def stop(self) -> None:
+        if not self._started:
+            return
+        if self._health_task is not None:
+            self._health_task.cancel()
+            await asyncio.gather(self._health_task, return_exceptions=True)
+        await asyncio.gather(
+            *(slot.stop() for slots in self._slots.values() for slot in slots),
+            return_exceptions=True,
+        )
+        self._started = False
+        logger.info("MCP pool stopped")
+
+    # ----------------------
+    # Leasing
+    # ----------------------
+    async def _acquire(self, name: str) -> Optional[_PooledServer]:
+        start = time.monotonic()
+        deadline = start + self.lease_timeout_seconds
+        try:
+            slot: _PooledServer = await asyncio.wait_for(
+                self._idle[name].get(), timeout=self.lease_timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            self._lease_failures[name] += 1
+            logger.warning("MCP pool: no idle %s within %.0fs", name, self.lease_timeout_seconds)
+            return None
+
+        slot.in_use = True
+        try:
+            if slot.ready.is_set() and not slot.healthy:
+                slot.request_reconnect()
+            remaining = max(0.1, deadline - time.monotonic())
+            await asyncio.wait_for(slot.ready.wait(), timeout=remaining)
+        except asyncio.TimeoutError:
+            self._release(slot)
+            self._lease_failures[name] += 1
+            logger.warning("MCP pool: %s not ready within lease timeout", slot.label)
+            return None
+
+        waited = time.monotonic() - start
+        self._lease_count[name] += 1
+        self._wait_total[name] += waited
+        self._wait_max[name] = max(self._wait_max[name], waited)
+        return slot
+
+    def _release(self, slot: _PooledServer) -> None:
+        slot.in_use = False
+        self._idle[slot.name].put_nowait(slot)
+
+    @asynccontextmanager
+    async def lease(self, names: Optional[Sequence[str]] = None) -> AsyncIterator[List[Any]]:
+        """
+        Lease one connected server per name (all pooled names by default).
+
+        Names whose server cannot be leased in time are skipped, so callers get
+        a possibly shorter list and can degrade instead of failing the run.
+        """
+        if not self._started:
+            raise RuntimeError("MCP pool is not started")
+
+        wanted = list(names) if names is not None else list(self.factories)
+        acquired = await asyncio.gather(*(self._acquire(name) for name in wanted))
+        slots = [slot for slot in acquired if slot is not None]
+
+        try:
+            yield [slot.server for slot in slots]
+        except Exception:
+            # A failing run may have broken the stdio session; verify before reuse.
+            for slot in slots:
+                if not await slot.health_check(self.health_check_timeout_seconds):
+                    slot.request_reconnect()
+            raise
+        finally:
+            for slot in slots:
+                self._release(slot)
+
+    # ----------------------
+    # Health
+    # ----------------------
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval_seconds)
+            for slots in self._slots.values():
+                for slot in slots:
+                    if slot.in_use or not slot.ready.is_set():
+                        continue
+                    if not await slot.health_check(self.health_check_timeout_seconds):
+                        slot.request_reconnect()
+
+    def stats(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        for name, slots in self._slots.items():
+            leases = self._lease_count[name]
+            out[name] = {
+                "size": len(slots),
+                "idle": self._idle[name].qsize(),
+                "healthy": sum(1 for s in slots if s.healthy),
+                "reconnects": sum(s.reconnects for s in slots),
+                "leases": leases,
+                "lease_failures": self._lease_failures[name],
+                "lease_wait_avg_ms": round(self._wait_total[name] / leases * 1000, 1) if leases else 0.0,
+                "lease_wait_max_ms": round(self._wait_max[name] * 1000, 1),
+            }
+        return out
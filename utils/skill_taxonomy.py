@@ -0,0 +1,141 @@
+# utils/skill_taxonomy.py
+
+"""
+Skill taxonomy and alias index shared by scoring and profile minimization.
+
+config/skill_taxonomy.yaml lists canonical skills with aliases and a signal
+tier. At load time every canonical name and alias is normalized and put in
+one dict mapping to an integer skill id, so:
+
+- normalizing a skill is a single hash lookup ("k8s" -> id of "kubernetes");
+- skill overlap is an intersection of integer id sets, with no substring
+  matching ("c" no longer matches "machine learning");
+- the low-signal check in minimize_profile is a lookup of the id's tier.
+
+Skills missing from the taxonomy are keyed by their normalized name instead
+of an id, so two unknown skills still match when their names are equal and
+the index never grows with the job postings a long-running server scores.
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+from utils.read_yaml import read_yaml
+from utils.logger import logging
+
+logger = logging.getLogger(__name__)
+
+config = read_yaml(Path("config/master_config.yaml"))
+_taxonomy_config = config.get("skill_taxonomy", {})
+
+DEFAULT_TAXONOMY_PATH = "config/skill_taxonomy.yaml"
+HIGH_SIGNAL = "high"
+LOW_SIGNAL = "low"
+
+_SPACE_RE = re.compile(r"\s+")
+_PAREN_RE = re.compile(r"\([^)]*\)")
+_EDGE_PUNCT = " .,;:-_/*•"
+
+# Integer id for taxonomy skills, the normalized name for anything else.
+SkillKey = Union[int, str]
+
+
+def normalize_skill(skill: Any) -> str:
+    """Lowercase, drop parentheticals, collapse whitespace and strip edge punctuation."""
+    text = _PAREN_RE.sub(" ", str(skill or "").lower())
+    return _SPACE_RE.sub(" ", text).strip(_EDGE_PUNCT)
+
+
+class SkillTaxonomy:
+    """
+    Alias index over the taxonomy: normalized alias -> integer skill id.
+    """
+
+    def __init__(self, entries: Iterable[Dict[str, Any]]):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._tiers: List[str] = []
+
+        for entry in entries or []:
+            name = normalize_skill(entry.get("name"))
+            if not name:
+                continue
+            tier = str(entry.get("tier") or HIGH_SIGNAL).lower()
+            skill_id = self._ids.get(name)
+            if skill_id is None:
+                skill_id = self._add(name, tier)
+            for alias in entry.get("aliases") or []:
+                key = normalize_skill(alias)
+                if not key:
+                    continue
+                existing = self._ids.setdefault(key, skill_id)
+                if existing != skill_id:
+                    logger.warning("Skill alias '%s' already maps to '%s'", key, self._names[existing])
+
+        self.known_skills = len(self._names)
+
+    @classmethod
+    def from_yaml(cls, path: str | Path) -> "SkillTaxonomy":
+        try:
+            data = read_yaml(Path(path))
+            entries = [dict(e) for e in (data.get("skills") or [])]
+        except Exception as e:
+            logger.error("Could not load skill taxonomy from %s, using an empty one: %s", path, e)
+            entries = []
+        taxonomy = cls(entries)
+        logger.info("Loaded skill taxonomy: %d skills, %d aliases", taxonomy.known_skills, len(taxonomy._ids))
+        return taxonomy
+
+    def _add(self, name: str, tier: str) -> int:
+        skill_id = len(self._names)
+        self._names.append(name)
+        self._tiers.append(tier)
+        self._ids[name] = skill_id
+        return skill_id
+
+    # ----------------------
+    # Lookups
+    # ----------------------
+    def skill_id(self, skill: Any) -> Optional[SkillKey]:
+        """Taxonomy id for a raw skill string, its normalized name when unknown, None for blanks."""
+        key = normalize_skill(skill)
+        if not key:
+            return None
+        skill_id = self._ids.get(key)
+        return key if skill_id is None else skill_id
+
+    def skill_ids(self, skills: Iterable[Any]) -> List[SkillKey]:
+        """Keys of skills in first-seen order, without duplicates."""
+        ids: Dict[SkillKey, None] = {}
+        for skill in skills or []:
+            skill_id = self.skill_id(skill)
+            if skill_id is not None:
+                ids.setdefault(skill_id)
+        return list(ids)
+
+    def id_set(self, skills: Iterable[Any]) -> Set[SkillKey]:
+        return set(self.skill_ids(skills))
+
+    def canonical(self, skill: Any) -> Optional[str]:
+        skill_id = self.skill_id(skill)
+        return skill_id if skill_id is None or isinstance(skill_id, str) else self._names[skill_id]
+
+    def name(self, skill_id: int) -> str:
+        return self._names[skill_id]
+
+    def tier(self, skill: Any) -> str:
+        skill_id = self._ids.get(normalize_skill(skill))
+        return HIGH_SIGNAL if skill_id is None else self._tiers[skill_id]
+
+    def is_low_signal(self, skill: Any) -> bool:
+        return self.tier(skill) == LOW_SIGNAL
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "known_skills": self.known_skills,
+            "aliases": len(self._ids),
+        }
+
+
+skill_taxonomy = SkillTaxonomy.from_yaml(_taxonomy_config.get("path", DEFAULT_TAXONOMY_PATH))
@@ -0,0 +1,320 @@
+# utils/sqlite_cache.py
+
+"""
+Small on-disk TTL + LRU cache backed by SQLite.
+
+Values are JSON-serialisable objects stored under a string key inside a
+namespace, so several caches (job search responses, advisor outputs, parsed
+resumes) can share one file or live in their own. Entries expire after
+ttl_seconds; when a namespace grows past max_bytes the least recently used
+entries are evicted. Hit/miss/eviction counters and the namespace's entry
+count and byte total are kept in memory, so /health and the size check on
+every set never scan the table; the totals are read once when the
+connection opens (each namespace is written by one SqliteCache) and
+re-read after the periodic expiry sweep.
+
+All methods are blocking and thread-safe; the a* variants run them in a
+worker thread for use from async code.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from utils.logger import logging
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(*parts: Any, **fields: Any) -> str:
+    """Stable sha256 key over positional parts and keyword fields (order-independent)."""
+    raw = json.dumps({"parts": parts, "fields": fields}, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SqliteCache:
+    """
+    TTL + size-bounded LRU cache for one namespace of an SQLite file.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        namespace: str,
+        ttl_seconds: float = 6 * 60 * 60,
+        max_bytes: int = 64 * 1024 * 1024,
+        enabled: bool = True,
+        sweep_every: int = 100,
+    ):
+        self.db_path = Path(db_path)
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        # Expired rows are swept every sweep_every writes (and whenever the namespace is over max_bytes).
+        self.sweep_every = max(1, int(sweep_every))
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # Namespace totals, loaded when the connection opens.
+        self._entries: Optional[int] = None
+        self._bytes = 0
+        self._writes = 0
+
+    # ----------------------
+    # Connection
+    # ----------------------
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_lru ON cache_entries(namespace, last_access)"
+            )
+            self._conn = conn
+            self._load_totals(conn)
+        return self._conn
+
+    def _load_totals(self, conn: sqlite3.Connection) -> None:
+        self._entries, self._bytes = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries WHERE namespace = ?",
+            (self.namespace,),
+        ).fetchone()
+
+    def _removed(self, size: int) -> None:
+        if self._entries is not None:
+            self._entries = max(0, self._entries - 1)
+        self._bytes = max(0, self._bytes - size)
+
+    def _size_of(self, conn: sqlite3.Connection, key: str) -> Optional[int]:
+        row = conn.execute(
+            "SELECT size FROM cache_entries WHERE namespace = ? AND key = ?",
+            (self.namespace, key),
+        ).fetchone()
+        return row[0] if row else None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ----------------------
+    # Blocking API
+    # ----------------------
+    def get(self, key: str, default: Any = None) -> Any:
+        if not self.enabled:
+            return default
+
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT value, size, expires_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                ).fetchone()
+
+                if row is None:
+                    self.misses += 1
+                    return default
+
+                value, size, expires_at = row
+                if expires_at <= now:
+                    conn.execute(
+                        "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                        (self.namespace, key),
+                    )
+                    self._removed(size)
+                    self.misses += 1
+                    return default
+
+                conn.execute(
+                    "UPDATE cache_entries SET last_access = ? WHERE namespace = ? AND key = ?",
+                    (now, self.namespace, key),
+                )
+                self.hits += 1
+                return json.loads(value)
+
+            except Exception as e:
+                # A broken cache must never break the caller; treat as a miss.
+                logger.warning("Cache %s get failed: %s", self.namespace, e)
+                self.misses += 1
+                return default
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        if not self.enabled:
+            return
+
+        now = time.time()
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        try:
+            payload = json.dumps(value, ensure_ascii=False, default=str)
+        except (TypeError, ValueError) as e:
+            logger.warning("Cache %s: value for %s is not JSON serialisable: %s", self.namespace, key, e)
+            return
+
+        with self._lock:
+            try:
+                conn = self._connection()
+                old_size = self._size_of(conn, key)
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO cache_entries
+                        (namespace, key, value, size, created_at, expires_at, last_access)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (self.namespace, key, payload, len(payload), now, now + ttl, now),
+                )
+                if old_size is None:
+                    self._entries = (self._entries or 0) + 1
+                self._bytes += len(payload) - (old_size or 0)
+                self._writes += 1
+                self._evict(conn, now)
+            except Exception as e:
+                logger.warning("Cache %s set failed: %s", self.namespace, e)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """
+        Every sweep_every writes, or once over max_bytes: drop expired rows,
+        then least recently used rows until under max_bytes.
+        """
+        if self._bytes <= self.max_bytes and self._writes % self.sweep_every:
+            return
+
+        cur = conn.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND expires_at <= ?",
+            (self.namespace, now),
+        )
+        if cur.rowcount:
+            self._load_totals(conn)
+        if self._bytes <= self.max_bytes:
+            return
+
+        to_free = self._bytes - self.max_bytes
+        freed = 0
+        victims = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM cache_entries WHERE namespace = ? ORDER BY last_access ASC",
+            (self.namespace,),
+        ):
+            victims.append((self.namespace, key))
+            freed += size
+            if freed >= to_free:
+                break
+
+        conn.executemany("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", victims)
+        self._entries = max(0, (self._entries or 0) - len(victims))
+        self._bytes = max(0, self._bytes - freed)
+        self.evictions += len(victims)
+        logger.info("Cache %s evicted %d entries (%d bytes)", self.namespace, len(victims), freed)
+
+    def delete(self, key: str) -> bool:
+        if not self.enabled:
+            return False
+
+        with self._lock:
+            try:
+                conn = self._connection()
+                size = self._size_of(conn, key)
+                if size is None:
+                    return False
+                conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                )
+                self._removed(size)
+                return True
+            except Exception as e:
+                logger.warning("Cache %s delete failed: %s", self.namespace, e)
+                return False
+
+    def delete_like(self, pattern: str) -> int:
+        """Remove entries whose key matches an SQL LIKE pattern. Returns how many were removed."""
+        if not self.enabled:
+            return 0
+
+        with self._lock:
+            try:
+                conn = self._connection()
+                cur = conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key LIKE ?",
+                    (self.namespace, pattern),
+                )
+                if cur.rowcount:
+                    self._load_totals(conn)
+                return cur.rowcount
+            except Exception as e:
+                logger.warning("Cache %s delete_like failed: %s", self.namespace, e)
+                return 0
+
+    def clear(self) -> int:
+        """Remove every entry in this namespace. Returns how many were removed."""
+        if not self.enabled:
+            return 0
+
+        with self._lock:
+            try:
+                cur = self._connection().execute(
+                    "DELETE FROM cache_entries WHERE namespace = ?",
+                    (self.namespace,),
+                )
+                self._entries, self._bytes = 0, 0
+                return cur.rowcount
+            except Exception as e:
+                logger.warning("Cache %s clear failed: %s", self.namespace, e)
+                return 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        In-memory counters only (no query, no lock), so /health can call it
+        on the event loop. entries is None until the cache is first used.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": self._entries,
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+    # ----------------------
+    # Async wrappers
+    # ----------------------
+    async def aget(self, key: str, default: Any = None) -> Any:
+        if not self.enabled:
+            return default
+        return await asyncio.to_thread(self.get, key, default)
+
+    async def aset(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        if not self.enabled:
+            return
+        await asyncio.to_thread(self.set, key, value, ttl_seconds)